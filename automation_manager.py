@@ -1,5 +1,6 @@
 import json
 import time
+import heapq
 import requests
 import schedule
 import logging
@@ -9,6 +10,7 @@ from pathlib import Path
 import html
 import pandas as pd
 import ichimoku_scanner as scanner
+import state_store
 CONFIG_PATH = 'config.json'
 USER_DATA_DIR = ''
 STRATEGY_OVERRIDES_FILENAME = 'strategy_overrides.json'
@@ -25,7 +27,8 @@ POTENTIAL_WATCHLIST_MIN_SCORE = 50
 MAX_POTENTIAL_WATCHLIST_SIZE = 150
 NORMAL_WHITELIST_SIZE = 10
 CAUTION_WHITELIST_SIZE = 3
-MARKET_HISTORY_FILENAME = 'market_history.json'
+MARKET_HISTORY_FILENAME = 'market_history.jsonl'
+LEGACY_MARKET_HISTORY_FILENAME = 'market_history.json'
 MARKET_HISTORY_PATH = ''
 MARKET_HISTORY_MAX_ENTRIES = 72
 EMERGENCY_FALLBACK_PAIR = 'USDC/USDT'
@@ -38,8 +41,11 @@ TELEGRAM_CHAT_ID = ''
 TELEGRAM_TOP_N_TARGETS = 15
 TELEGRAM_MESSAGE_CLEANUP_ENABLED = True
 TELEGRAM_MESSAGE_CLEANUP_DAYS = 7
-TELEGRAM_MESSAGE_LOG_FILENAME = 'telegram_message_log.json'
+TELEGRAM_MESSAGE_LOG_FILENAME = 'telegram_message_log.jsonl'
+LEGACY_TELEGRAM_MESSAGE_LOG_FILENAME = 'telegram_message_log.json'
 TELEGRAM_MESSAGE_LOG_PATH = ''
+telegram_message_log: Optional[state_store.AppendOnlyLog] = None
+market_history_log: Optional[state_store.AppendOnlyLog] = None
 api_session = requests.Session()
 exchange_instance = None
 managed_manual_trade_ids = set()
@@ -55,6 +61,7 @@ This is an important startup function that sets global variables for the entire
     global MANAGED_TRADES_PATH, MARKET_HISTORY_PATH
     global TELEGRAM_ENABLED, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, TELEGRAM_MESSAGE_LOG_PATH
     global TRANSLATION_ENABLED, TRANSLATION_TARGET_LANG
+    global telegram_message_log, market_history_log
     global exchange_instance
     try:
         with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
@@ -72,6 +79,8 @@ This is an important startup function that sets global variables for the entire
         TELEGRAM_MESSAGE_LOG_PATH = USER_DATA_DIR / TELEGRAM_MESSAGE_LOG_FILENAME
         MARKET_HISTORY_PATH = USER_DATA_DIR / MARKET_HISTORY_FILENAME
         MANAGED_TRADES_PATH = USER_DATA_DIR / MANAGED_TRADES_FILENAME
+        telegram_message_log = state_store.AppendOnlyLog(TELEGRAM_MESSAGE_LOG_PATH, legacy_path=USER_DATA_DIR / LEGACY_TELEGRAM_MESSAGE_LOG_FILENAME)
+        market_history_log = state_store.AppendOnlyLog(MARKET_HISTORY_PATH, max_entries=MARKET_HISTORY_MAX_ENTRIES, legacy_path=USER_DATA_DIR / LEGACY_MARKET_HISTORY_FILENAME, newest_first_legacy=True)
         tg_config = config.get('telegram', {})
         TELEGRAM_ENABLED = tg_config.get('enabled', False)
         TELEGRAM_BOT_TOKEN = tg_config.get('token')
@@ -82,7 +91,7 @@ This is an important startup function that sets global variables for the entire
         if TRANSLATION_ENABLED:
             logging.info(f"DỊCH THUẬT TỰ ĐỘNG ĐÃ BẬT. Ngôn ngữ đích: '{TRANSLATION_TARGET_LANG}'")
         if exchange_instance is None:
-            exchange_instance = scanner.initialize_exchange(scanner.EXCHANGE)
+            exchange_instance = scanner.get_scan_context().get_exchange()
             if not exchange_instance:
                 logging.critical('KHÔNG THỂ KHỞI TẠO EXCHANGE INSTANCE. Bot không thể lấy dữ liệu.')
                 return False
@@ -138,20 +147,15 @@ def _load_managed_trades():
     """Load list of managed trade_ids from file."""
     global managed_manual_trade_ids
     if MANAGED_TRADES_PATH and MANAGED_TRADES_PATH.exists():
-        try:
-            with open(MANAGED_TRADES_PATH, 'r') as f:
-                managed_manual_trade_ids = set(json.load(f))
-            logging.info(f'Đã tải {len(managed_manual_trade_ids)} trade_id đã được quản lý.')
-        except (json.JSONDecodeError, IOError):
-            managed_manual_trade_ids = set()
+        managed_manual_trade_ids = set(state_store.read_json(MANAGED_TRADES_PATH, default=[]))
+        logging.info(f'Đã tải {len(managed_manual_trade_ids)} trade_id đã được quản lý.')
 
 def _save_managed_trades():
     """Save the list of managed trade_ids to file."""
     if MANAGED_TRADES_PATH:
         try:
-            with open(MANAGED_TRADES_PATH, 'w') as f:
-                json.dump(list(managed_manual_trade_ids), f)
-        except IOError as e:
+            state_store.atomic_write_json(MANAGED_TRADES_PATH, sorted(managed_manual_trade_ids))
+        except (IOError, TypeError) as e:
             logging.error(f'Không thể lưu file managed_trades: {e}')
 
 def load_trade_plan():
@@ -172,17 +176,11 @@ Returns a dictionary with the structure {"market_state": ..., "pairs": ...}."""
         return {'market_state': {}, 'pairs': {}}
 
 def log_sent_telegram_message(message_id: int):
-    if not TELEGRAM_MESSAGE_LOG_PATH:
+    if telegram_message_log is None:
         return
     try:
-        log_data = []
-        if TELEGRAM_MESSAGE_LOG_PATH.exists():
-            with open(TELEGRAM_MESSAGE_LOG_PATH, 'r', encoding='utf-8') as f:
-                log_data = json.load(f)
-        log_data.append({'message_id': message_id, 'timestamp': datetime.now().isoformat()})
-        with open(TELEGRAM_MESSAGE_LOG_PATH, 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, indent=4, ensure_ascii=False)
-    except (IOError, json.JSONDecodeError) as e:
+        telegram_message_log.append({'message_id': message_id, 'timestamp': datetime.now().isoformat()})
+    except IOError as e:
         logging.error(f'Lỗi khi ghi log tin nhắn Telegram: {e}')
 
 def send_telegram_message(message: str, parse_mode: str='HTML'):
@@ -285,48 +283,28 @@ def format_manual_trade_takeover_message(pair: str, plan: Dict[str, Any]) -> str
     return message
 
 def load_potential_watchlist():
-    if not POTENTIAL_WATCHLIST_PATH.exists():
-        return {}
-    try:
-        with open(POTENTIAL_WATCHLIST_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+    if not POTENTIAL_WATCHLIST_PATH:
         return {}
+    watchlist = state_store.read_json(POTENTIAL_WATCHLIST_PATH, default={})
+    return watchlist if isinstance(watchlist, dict) else {}
 
 def save_potential_watchlist(watchlist: Dict[str, Dict]):
     try:
-        USER_DATA_DIR.mkdir(parents=True, exist_ok=True)
-        with open(POTENTIAL_WATCHLIST_PATH, 'w', encoding='utf-8') as f:
-            json.dump(watchlist, f, indent=4, ensure_ascii=False)
+        state_store.atomic_write_json(POTENTIAL_WATCHLIST_PATH, watchlist)
         logging.info(f"Đã làm mới 'Bộ Nhớ Tác chiến', hiện có {len(watchlist)} mục tiêu đang được theo dõi.")
     except IOError as e:
         logging.error(f"Lỗi khi lưu file 'Bộ Nhớ': {e}")
 
 def update_market_history(new_entry: Dict[str, Any]):
-    """Read market log file, add latest entry at the beginning, limit quantity
-and securely record the JSON file."""
-    if not MARKET_HISTORY_PATH:
+    """Append the latest entry to the market log (JSONL, one line per cycle).
+The log keeps at most MARKET_HISTORY_MAX_ENTRIES entries."""
+    if market_history_log is None:
         logging.warning('MARKET_HISTORY_PATH chưa được cấu hình. Bỏ qua việc ghi nhật ký.')
         return
-    history = []
-    if MARKET_HISTORY_PATH.exists():
-        try:
-            with open(MARKET_HISTORY_PATH, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-            if not isinstance(history, list):
-                logging.warning(f'File {MARKET_HISTORY_FILENAME} có định dạng không đúng (không phải list). Sẽ tạo lại file mới.')
-                history = []
-        except (json.JSONDecodeError, IOError) as e:
-            logging.error(f'Lỗi khi đọc file nhật ký thị trường ({MARKET_HISTORY_PATH}): {e}. Sẽ tạo lại file mới.')
-            history = []
-    history.insert(0, new_entry)
-    trimmed_history = history[:MARKET_HISTORY_MAX_ENTRIES]
     try:
-        USER_DATA_DIR.mkdir(parents=True, exist_ok=True)
-        with open(MARKET_HISTORY_PATH, 'w', encoding='utf-8') as f:
-            json.dump(trimmed_history, f, indent=4, ensure_ascii=False)
-        logging.info(f'Đã cập nhật Nhật ký Thị trường, hiện có {len(trimmed_history)}/{MARKET_HISTORY_MAX_ENTRIES} mục.')
-    except IOError as e:
+        market_history_log.append(new_entry)
+        logging.info(f'Đã cập nhật Nhật ký Thị trường, hiện có {len(market_history_log)}/{MARKET_HISTORY_MAX_ENTRIES} mục.')
+    except (IOError, TypeError) as e:
         logging.error(f'Lỗi nghiêm trọng khi ghi file Nhật ký Thị trường: {e}')
 
 def format_btc_analysis_telegram(btc_context: Dict[str, Any]) -> str:
@@ -508,21 +486,34 @@ def check_open_trades() -> Optional[List[Dict[str, Any]]]:
         logging.error(f'Lỗi khi kiểm tra lệnh mở: {e}.')
         return None
 
-def update_files_and_reload(new_whitelist: List[str], final_trade_plans_data: Dict[str, Any], force_reload: bool=True):
+def update_files_and_reload(new_whitelist: List[str], final_trade_plans_data: Dict[str, Any], force_reload: bool=False):
     """Update configuration files and reload Freqtrade.
-v7.1: Fix NameError due to still referencing the deleted MANUAL_TRADE_WHITELIST_PAIRS."""
+v7.1: Fix NameError due to still referencing the deleted MANUAL_TRADE_WHITELIST_PAIRS.
+v7.2: Push the whitelist live to the bot (PushPairList) instead of a full reload.
+      The bot applies it on its next iteration and only warms up new pairs;
+      config.json is still updated so a restart keeps the same whitelist.
+      Falls back to reload_config if the bot does not accept the push.
+v7.3: `force_reload` still reloads after a push when the trade plans or strategy overrides
+      changed, so the bot picks them up - only whitelist-only changes skip the reload.
+v7.4: Trade plans and strategy overrides travel with the push (dp.pushed_data() in the
+      strategy), so new plans don't need a reload either. The files are still written for
+      restarts. Without a successful push, changed plans / overrides / config reload the bot.
+      `force_reload` skips the push and always reloads."""
     try:
         UNIVERSAL_STRATEGY_NAME = 'ExternalSignalStrategy'
-        with open(TRADE_PLAN_PATH, 'w', encoding='utf-8') as f:
-            json.dump(final_trade_plans_data, f, indent=4, ensure_ascii=False)
+        plans_changed = state_store.read_json(TRADE_PLAN_PATH) != final_trade_plans_data
+        state_store.atomic_write_json(TRADE_PLAN_PATH, final_trade_plans_data, indent=4)
         logging.info(f'Đã cập nhật Kế Hoạch Tác Chiến và Trạng Thái Thị Trường ({TRADE_PLAN_FILENAME}).')
         final_whitelist_set = set(new_whitelist)
         new_overrides = {pair: UNIVERSAL_STRATEGY_NAME for pair in final_whitelist_set}
-        with open(STRATEGY_OVERRIDES_PATH, 'w', encoding='utf-8') as f:
-            json.dump(new_overrides, f, indent=4, ensure_ascii=False)
+        overrides_changed = state_store.read_json(STRATEGY_OVERRIDES_PATH) != new_overrides
+        state_store.atomic_write_json(STRATEGY_OVERRIDES_PATH, new_overrides, indent=4)
         logging.info(f"Đã cập nhật Sổ Lệnh để trỏ {len(new_overrides)} mục tới '{UNIVERSAL_STRATEGY_NAME}'.")
         config_updated, _ = update_config_file(list(final_whitelist_set))
-        if config_updated or force_reload:
+        strategy_data = {'trade_plan': final_trade_plans_data, 'strategy_overrides': new_overrides}
+        if not force_reload and push_whitelist(sorted(final_whitelist_set), strategy_data):
+            logging.info('Whitelist và Kế Hoạch Tác Chiến đã được đẩy trực tiếp tới Freqtrade. Không cần reload.')
+        elif force_reload or config_updated or plans_changed or overrides_changed:
             logging.info(f'Cấu hình đã thay đổi. Chờ 5s trước khi gửi lệnh reload...')
             time.sleep(5)
             if reload_freqtrade_config():
@@ -553,6 +544,35 @@ def update_config_file(new_whitelist: list) -> Tuple[bool, int]:
         logging.error(f"Lỗi khi cập nhật file '{CONFIG_PATH}': {e}")
         return (False, 0)
 
+def push_whitelist(new_whitelist: List[str], strategy_data: Optional[Dict[str, Any]]=None) -> bool:
+    try:
+        payload = {'whitelist': new_whitelist}
+        if strategy_data is not None:
+            payload['data'] = strategy_data
+        response = api_session.post(f'{FREQTRADE_URL}/api/v1/whitelist', json=payload, timeout=15)
+        response.raise_for_status()
+        result = response.json()
+        logging.info(f"Đẩy whitelist thành công. Thêm: {result.get('added', [])}, Bỏ: {result.get('removed', [])}")
+        for pair, error in result.get('errors', {}).items():
+            logging.warning(f"    - [{pair}] Bị từ chối: {error.get('error_msg')}")
+        return True
+    except requests.exceptions.RequestException as e:
+        logging.warning(f'Không thể đẩy whitelist trực tiếp (cần PushPairList trong config): {e}')
+        return False
+
+def fetch_bot_candles(pairs: List[str], timeframe: str, limit: int) -> Dict[str, Optional[pd.DataFrame]]:
+    """Candle source for the scanner: read OHLCV for all pairs straight from the running bot's
+DataProvider in a single /api/v1/pair_candles/batch call (OHLCV columns only, column-major).
+Pairs the bot does not have come back as None; the scanner downloads those from the exchange."""
+    try:
+        payload = {'candles': [{'pair': pair, 'timeframe': timeframe, 'limit': limit, 'columns': []} for pair in pairs]}
+        response = api_session.post(f'{FREQTRADE_URL}/api/v1/pair_candles/batch', json=payload, timeout=15)
+        response.raise_for_status()
+        return {entry['pair']: scanner.bot_candles_to_dataframe(entry) for entry in response.json().get('candles', [])}
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logging.warning(f'Không lấy được nến {timeframe} từ bot: {e}')
+        return {}
+
 def reload_freqtrade_config() -> bool:
     try:
         response = api_session.post(f'{FREQTRADE_URL}/api/v1/reload_config', timeout=15)
@@ -604,7 +624,7 @@ This function performs the following steps:
         full_plan_data = load_trade_plan()
         existing_trade_plans = full_plan_data.get('pairs', {})
         open_trade_pairs = [trade['pair'] for trade in open_trades_details]
-        health_analysis = scanner.analyze_open_trades(open_trade_pairs)
+        health_analysis = scanner.analyze_open_trades(open_trade_pairs, candle_source=fetch_bot_candles)
         combined_analysis = {}
         for trade in open_trades_details:
             pair = trade['pair']
@@ -633,6 +653,29 @@ def manage_open_trade_plan(*args, **kwargs):
     '[PROPRIETARY LOGIC HIDDEN]\n---------------------------------------------------------\nThis function contains advanced algorithmic logic for:\n- Pattern Recognition & Signal Processing\n- Dynamic Risk Management (DEFCON System)\n- Automated Trade Execution\n\nThe implementation details and specific parameters have been\nremoved to protect Intellectual Property (IP).\n---------------------------------------------------------'
     pass
 
+def push_bounded_top_n(heap: List[Tuple[Any, ...]], item: Tuple[Any, ...], limit: int):
+    """Keep only the `limit` largest items in the min-heap `heap`, compared on `(score, tie_breaker)`."""
+    if limit <= 0:
+        return
+    if len(heap) < limit:
+        heapq.heappush(heap, item)
+    elif item[:2] > heap[0][:2]:
+        heapq.heapreplace(heap, item)
+
+def _passes_target_filter(rec: Dict[str, Any], min_score_threshold: float, allowed_strategy: Optional[str], disallowed_strategies: List[str], defcon_level: str) -> bool:
+    pair, score, strategy = (rec.get('pair', 'UNKNOWN'), rec.get('final_score', 0), rec.get('strategy_type', 'N/A'))
+    if score < min_score_threshold:
+        logging.info(f'    -> [LOẠI] {pair:<15} | Lý do: Điểm số quá thấp ({score:.0f} < {min_score_threshold})')
+        return False
+    if allowed_strategy and allowed_strategy not in strategy:
+        logging.info(f"    -> [LOẠI] {pair:<15} | Lý do: Chiến lược '{strategy}' không được phép (chỉ cho phép '{allowed_strategy}')")
+        return False
+    if strategy in disallowed_strategies:
+        logging.info(f"    -> [LOẠI] {pair:<15} | Lý do: Chiến lược '{strategy}' bị cấm trong cấp độ {defcon_level}")
+        return False
+    logging.info(f'    -> [OK] {pair:<15} | Điểm: {score:.0f} | Chiến lược: {strategy}')
+    return True
+
 def main_job():
     """Main function of Operational Advisor v7.1 - Fair Selection Logic.
 - UPDATE (v7.1):
@@ -665,20 +708,45 @@ def main_job():
         open_trades_map = {trade['pair']: trade for trade in open_trades_details}
         existing_trade_plans = load_trade_plan().get('pairs', {})
         logging.info(' -> Bắt đầu quét toàn diện thị trường (có thể mất vài phút)...')
-        scan_data = scanner.run_scan()
-        all_results_map = {res['pair']: res for res in scan_data.get('recommendations', [])}
+        scan_stream = scanner.stream_scan()
         logging.info('\n--- BƯỚC 2: Phân tích Tình báo & Xác định Cấp độ Báo động ---')
-        summary_data = scan_data.get('summary', {})
+        summary_data = scan_stream.summary
         market_state = analyze_market_state(summary_data)
         defcon_level = market_state.get('level', 'DEFCON 4: NORMAL')
         cycle_summary['market_state'] = market_state
-        cycle_summary.update(summary_data)
         btc_context = summary_data.get('market_context', {}).get('btc_context', {})
         send_telegram_message(format_btc_analysis_telegram(btc_context))
         time.sleep(1)
+        open_trade_pairs = list(open_trades_map.keys())
+        logging.info(' -> Áp dụng Bộ lọc Chiến lược Thích ứng để tìm mục tiêu mới...')
+        limit_new_targets = NORMAL_WHITELIST_SIZE
+        min_score_threshold = 90
+        allowed_strategy = None
+        disallowed_strategies = []
+        if 'DEFCON 1' in defcon_level or 'DEFCON 2' in defcon_level or 'DEFCON 3' in defcon_level:
+            limit_new_targets = 5
+            min_score_threshold = 110 if 'DEFCON 1' in defcon_level else 100
+            allowed_strategy = 'Reversal-Scout'
+            logging.info(f"   -> {defcon_level}: KÍCH HOẠT CHẾ ĐỘ 'SĂN ĐÁY'. Chỉ cho phép 'Reversal-Scout', điểm > {min_score_threshold}, giới hạn {limit_new_targets} cặp.")
+        elif 'DEFCON 4' in defcon_level:
+            disallowed_strategies = ['Breakout-Pre']
+            logging.info(f"   -> {defcon_level}: Loại bỏ chiến lược 'Breakout-Pre', điểm > {min_score_threshold}.")
+        else:
+            logging.info(f'   -> {defcon_level}: Cho phép tất cả các chiến lược, điểm > {min_score_threshold}.')
+        logging.info('--- [BỘ LỌC CHI TIẾT] Đánh giá các mục tiêu tiềm năng ngay khi được chấm điểm ---')
+        all_results_map = {}
+        top_targets_heap = []
+        filtered_count = 0
+        for seq, rec in enumerate(scan_stream):
+            all_results_map[rec['pair']] = rec
+            if rec['pair'] in open_trade_pairs or not _passes_target_filter(rec, min_score_threshold, allowed_strategy, disallowed_strategies, defcon_level):
+                continue
+            filtered_count += 1
+            push_bounded_top_n(top_targets_heap, (rec.get('final_score', 0), -seq, rec), limit_new_targets)
+        cycle_summary.update(summary_data)
+        logging.info(f'--- [BỘ LỌC CHI TIẾT] Hoàn tất. Tìm thấy {filtered_count} mục tiêu hợp lệ. ---')
         logging.info(f'\n--- BƯỚC 3: Xây dựng Kế Hoạch Tác Chiến theo {defcon_level} ---')
         logging.info(f' -> Tái đánh giá và quản lý {len(open_trades_map)} lệnh đang mở...')
-        open_trade_pairs = list(open_trades_map.keys())
         for pair in open_trade_pairs:
             if pair in existing_trade_plans:
                 new_scan_result = all_results_map.get(pair)
@@ -695,40 +763,8 @@ def main_job():
                     logging.info(f"    - [{pair}] TƯ THẾ GIỮ NGUYÊN: '{final_stance}'")
                 managed_plan = manage_open_trade_plan(pair, existing_trade_plans[pair], new_scan_result, trade_details, market_state, final_stance)
                 final_trade_plans[pair] = managed_plan
-        logging.info(' -> Áp dụng Bộ lọc Chiến lược Thích ứng để tìm mục tiêu mới...')
-        potential_targets = [rec for rec in sorted(all_results_map.values(), key=lambda x: x.get('final_score', 0), reverse=True) if rec['pair'] not in open_trade_pairs]
-        limit_new_targets = NORMAL_WHITELIST_SIZE
-        min_score_threshold = 90
-        allowed_strategy = None
-        disallowed_strategies = []
-        if 'DEFCON 1' in defcon_level or 'DEFCON 2' in defcon_level or 'DEFCON 3' in defcon_level:
-            limit_new_targets = 5
-            min_score_threshold = 110 if 'DEFCON 1' in defcon_level else 100
-            allowed_strategy = 'Reversal-Scout'
-            logging.info(f"   -> {defcon_level}: KÍCH HOẠT CHẾ ĐỘ 'SĂN ĐÁY'. Chỉ cho phép 'Reversal-Scout', điểm > {min_score_threshold}, giới hạn {limit_new_targets} cặp.")
-        elif 'DEFCON 4' in defcon_level:
-            disallowed_strategies = ['Breakout-Pre']
-            logging.info(f"   -> {defcon_level}: Loại bỏ chiến lược 'Breakout-Pre', điểm > {min_score_threshold}.")
-        else:
-            logging.info(f'   -> {defcon_level}: Cho phép tất cả các chiến lược, điểm > {min_score_threshold}.')
-        logging.info(f'--- [BỘ LỌC CHI TIẾT] Đánh giá {len(potential_targets)} mục tiêu tiềm năng ---')
-        filtered_targets = []
-        for rec in potential_targets:
-            pair, score, strategy = (rec.get('pair', 'UNKNOWN'), rec.get('final_score', 0), rec.get('strategy_type', 'N/A'))
-            if score < min_score_threshold:
-                logging.info(f'    -> [LOẠI] {pair:<15} | Lý do: Điểm số quá thấp ({score:.0f} < {min_score_threshold})')
-                continue
-            if allowed_strategy and allowed_strategy not in strategy:
-                logging.info(f"    -> [LOẠI] {pair:<15} | Lý do: Chiến lược '{strategy}' không được phép (chỉ cho phép '{allowed_strategy}')")
-                continue
-            if strategy in disallowed_strategies:
-                logging.info(f"    -> [LOẠI] {pair:<15} | Lý do: Chiến lược '{strategy}' bị cấm trong cấp độ {defcon_level}")
-                continue
-            logging.info(f'    -> [OK] {pair:<15} | Điểm: {score:.0f} | Chiến lược: {strategy}')
-            filtered_targets.append(rec)
-        logging.info(f'--- [BỘ LỌC CHI TIẾT] Hoàn tất. Tìm thấy {len(filtered_targets)} mục tiêu hợp lệ. ---')
         logging.info(' -> Tuyển chọn các mục tiêu điểm cao nhất một cách công bằng (không ưu tiên chiến lược).')
-        selected_targets = filtered_targets[:limit_new_targets]
+        selected_targets = [rec for _, _, rec in sorted(top_targets_heap, key=lambda item: item[:2], reverse=True)]
         new_targets_for_whitelist = [rec['pair'] for rec in selected_targets]
         logging.info(f' -> Đã chọn {len(new_targets_for_whitelist)} mục tiêu hàng đầu sau đây vào whitelist:')
         for target in selected_targets:
@@ -754,14 +790,14 @@ def main_job():
             cycle_summary['fallback_activated'] = True
         new_potential_watchlist = {r['pair']: {'last_score': r.get('final_score', 0), 'timestamp': datetime.now().isoformat()} for r in all_results_map.values() if r.get('final_score', 0) > POTENTIAL_WATCHLIST_MIN_SCORE}
         save_potential_watchlist(dict(sorted(new_potential_watchlist.items(), key=lambda item: item[1]['last_score'], reverse=True)[:MAX_POTENTIAL_WATCHLIST_SIZE]))
-        open_trade_analysis_15m = scanner.analyze_open_trades(open_trade_pairs)
+        open_trade_analysis_15m = scanner.analyze_open_trades(open_trade_pairs, candle_source=fetch_bot_candles)
         cycle_summary.update({'a_grade_targets': [r['pair'] for r in all_results_map.values() if r.get('is_A_grade')], 'b_grade_targets': [r['pair'] for r in all_results_map.values() if not r.get('is_A_grade')], 'final_whitelist': final_whitelist, 'new_targets_in_whitelist': new_targets_for_whitelist})
         logging.info('\n--- BƯỚC 5: Gửi Báo cáo & Triển khai Kế Hoạch Tác Chiến tới Bot ---')
         send_telegram_message(format_telegram_summary(open_trade_analysis_15m, sorted(all_results_map.values(), key=lambda x: x.get('final_score', 0), reverse=True), cycle_summary))
         final_plans_data = {'market_state': market_state, 'pairs': final_trade_plans}
         if BOT_OPERATIONAL_STATE == 'RUNNING':
             logging.info('Bot đang ở trạng thái RUNNING. Triển khai kế hoạch tác chiến...')
-            update_files_and_reload(final_whitelist, final_plans_data, force_reload=True)
+            update_files_and_reload(final_whitelist, final_plans_data)
             send_telegram_message('✅ <b>Chu kỳ Cố Vấn Tác Chiến (HÀNG GIỜ) hoàn tất và đã áp dụng.</b>')
         else:
             logging.warning('!!! Bot đang ở trạng thái STOPPED. Hoạt động ở chế độ Cố Vấn. Bỏ qua cập nhật whitelist và reload. !!!')
@@ -781,31 +817,26 @@ def delete_old_telegram_messages():
     if not TELEGRAM_ENABLED or not TELEGRAM_MESSAGE_CLEANUP_ENABLED:
         return
     logging.info('--- [Dọn dẹp Telegram] Bắt đầu chu kỳ dọn dẹp tin nhắn cũ ---')
-    if not TELEGRAM_MESSAGE_LOG_PATH.exists():
+    if telegram_message_log is None:
         return
     try:
-        with open(TELEGRAM_MESSAGE_LOG_PATH, 'r') as f:
-            log_data = json.load(f)
-        if not log_data:
-            return
         cutoff_date = datetime.now() - timedelta(days=TELEGRAM_MESSAGE_CLEANUP_DAYS)
-        messages_to_keep, messages_deleted = ([], 0)
-        for msg_info in log_data:
+        expired_messages = telegram_message_log.range(end=cutoff_date)
+        if not expired_messages:
+            return
+        failed_ids, messages_deleted = (set(), 0)
+        for msg_info in expired_messages:
             try:
-                if datetime.fromisoformat(msg_info['timestamp']) < cutoff_date:
-                    url = f'https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/deleteMessage'
-                    payload = {'chat_id': TELEGRAM_CHAT_ID, 'message_id': msg_info['message_id']}
-                    response = requests.post(url, json=payload, timeout=5)
-                    if response.status_code == 200:
-                        messages_deleted += 1
-                else:
-                    messages_to_keep.append(msg_info)
+                url = f'https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/deleteMessage'
+                payload = {'chat_id': TELEGRAM_CHAT_ID, 'message_id': msg_info['message_id']}
+                response = requests.post(url, json=payload, timeout=5)
+                if response.status_code == 200:
+                    messages_deleted += 1
             except Exception:
-                messages_to_keep.append(msg_info)
-        with open(TELEGRAM_MESSAGE_LOG_PATH, 'w') as f:
-            json.dump(messages_to_keep, f, indent=4)
+                failed_ids.add(msg_info.get('message_id'))
+        telegram_message_log.delete_before(cutoff_date, keep=lambda msg_info: msg_info.get('message_id') in failed_ids)
         logging.info(f'--- [Dọn dẹp Telegram] Hoàn tất. Đã xóa {messages_deleted} tin nhắn. ---')
-    except (IOError, json.JSONDecodeError) as e:
+    except IOError as e:
         logging.error(f'Lỗi khi xử lý file log Telegram: {e}')
 
 def print_schedule_status(last_status_str=''):
@@ -51,11 +51,17 @@ ARGS_BACKTEST = [
     "enable_protections",
     "dry_run_wallet",
     "timeframe_detail",
+    "backtest_columnar_data",
+    "backtest_event_driven",
     "strategy_list",
+    "backtest_jobs",
+    "backtest_fast_screen",
     "export",
     "exportfilename",
     "backtest_breakdown",
     "backtest_cache",
+    "backtest_indicator_cache",
+    "backtest_incremental",
     "freqai_backtest_live_models",
 ]
 
@@ -67,6 +73,8 @@ ARGS_HYPEROPT = [
     "enable_protections",
     "dry_run_wallet",
     "timeframe_detail",
+    "backtest_columnar_data",
+    "backtest_event_driven",
     "epochs",
     "spaces",
     "print_all",
@@ -74,6 +82,7 @@ ARGS_HYPEROPT = [
     "hyperopt_jobs",
     "hyperopt_random_state",
     "hyperopt_min_trades",
+    "hyperopt_halving_factor",
     "hyperopt_loss",
     "disableparamexport",
     "hyperopt_ignore_missing_space",
@@ -249,7 +258,16 @@ ARGS_STRATEGY_UPDATER = ["strategy_list", "strategy_path", "recursive_strategy_s
 ARGS_LOOKAHEAD_ANALYSIS = [
     a
     for a in ARGS_BACKTEST
-    if a not in ("position_stacking", "backtest_cache", "backtest_breakdown")
+    if a
+    not in (
+        "position_stacking",
+        "backtest_cache",
+        "backtest_indicator_cache",
+        "backtest_incremental",
+        "backtest_breakdown",
+        "backtest_jobs",
+        "backtest_fast_screen",
+    )
 ] + ["minimum_trade_amount", "targeted_trade_amount", "lookahead_analysis_exportfilename"]
 
 ARGS_RECURSIVE_ANALYSIS = ["timeframe", "timerange", "dataformat_ohlcv", "pairs", "startup_candle"]
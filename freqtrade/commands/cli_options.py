@@ -199,6 +199,23 @@ AVAILABLE_CLI_OPTIONS = {
         "(so `backtest-data.json` becomes `backtest-data-SampleStrategy.json`",
         nargs="+",
     ),
+    "backtest_jobs": Arg(
+        "-j",
+        "--job-workers",
+        help="The number of strategies from `--strategy-list` to backtest concurrently "
+        "(backtest worker processes). "
+        "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+        "If 1 (default) is given, strategies are backtested one after the other.",
+        type=int,
+        metavar="JOBS",
+    ),
+    "backtest_fast_screen": Arg(
+        "--fast-screen",
+        help="Screen the strategies from `--strategy-list` with the vectorized fast screen "
+        "engine first, and only run the full backtest for the INT most profitable ones.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
     "export": Arg(
         "--export",
         help="Export backtest results (default: trades).",
@@ -229,12 +246,41 @@ AVAILABLE_CLI_OPTIONS = {
         nargs="+",
         choices=constants.BACKTEST_BREAKDOWNS,
     ),
+    "backtest_columnar_data": Arg(
+        "--columnar-data",
+        help="Keep backtest candles in columnar NumPy arrays instead of lists. "
+        "Uses considerably less memory for many pairs and long timeranges.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_event_driven": Arg(
+        "--event-driven",
+        help="Only visit pairs with an entry signal or an open trade on each candle. "
+        "Results are identical, but backtests of strategies with few signals "
+        "on many pairs are considerably faster.",
+        action="store_true",
+        default=False,
+    ),
     "backtest_cache": Arg(
         "--cache",
         help="Load a cached backtest result no older than specified age (default: %(default)s).",
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_indicator_cache": Arg(
+        "--indicator-cache",
+        help="Store analyzed dataframes on disk, and reuse them as long as "
+        "populate_indicators(), strategy parameters and data are unchanged.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_incremental": Arg(
+        "--incremental",
+        help="Store the backtest state before the last candle, and resume from it when "
+        "backtesting the same strategy and configuration on extended data.",
+        action="store_true",
+        default=False,
+    ),
     # Edge
     "stoploss_range": Arg(
         "--stoplosses",
@@ -336,6 +382,14 @@ AVAILABLE_CLI_OPTIONS = {
         metavar="INT",
         default=1,
     ),
+    "hyperopt_halving_factor": Arg(
+        "--successive-halving",
+        help="Evaluate FACTOR^2 parameter sets per epoch with successive halving: "
+        "all on the first 1/FACTOR^2 of the timerange, the best 1/FACTOR of them on the "
+        "first 1/FACTOR of the timerange, and the best of those on the full timerange.",
+        type=check_int_positive,
+        metavar="FACTOR",
+    ),
     "hyperopt_loss": Arg(
         "--hyperopt-loss",
         "--hyperoptloss",
@@ -184,6 +184,14 @@ CONF_SCHEMA = {
             "type": "boolean",
             "default": False,
         },
+        "indicator_jobs": {
+            "description": (
+                "Number of worker processes populating indicators in backtesting and hyperopt. "
+                "Only used for strategies with `pair_independent_indicators`."
+            ),
+            "type": "integer",
+            "default": 1,
+        },
         # Lookahead analysis section
         "minimum_trade_amount": {
             "description": "Minimum amount for a trade - only used for lookahead-analysis",
@@ -251,6 +251,30 @@ class Configuration:
             logstring="Parameter --enable-protections detected, enabling Protections. ...",
         )
 
+        self._args_to_config(
+            config,
+            argname="backtest_columnar_data",
+            logstring="Parameter --columnar-data detected, using columnar backtest data ...",
+        )
+
+        self._args_to_config(
+            config,
+            argname="backtest_event_driven",
+            logstring="Parameter --event-driven detected, only visiting pairs with events ...",
+        )
+
+        self._args_to_config(
+            config,
+            argname="backtest_indicator_cache",
+            logstring="Parameter --indicator-cache detected, caching analyzed dataframes ...",
+        )
+
+        self._args_to_config(
+            config,
+            argname="backtest_incremental",
+            logstring="Parameter --incremental detected, resuming from backtest snapshots ...",
+        )
+
         if self.args.get("max_open_trades"):
             config.update({"max_open_trades": self.args["max_open_trades"]})
             logger.info(
@@ -308,6 +332,8 @@ class Configuration:
             ("export", "Parameter --export detected: {} ..."),
             ("backtest_breakdown", "Parameter --breakdown detected ..."),
             ("backtest_cache", "Parameter --cache={} detected ..."),
+            ("backtest_jobs", "Parameter -j/--job-workers detected: {}"),
+            ("backtest_fast_screen", "Parameter --fast-screen detected: {} ..."),
             ("disableparamexport", "Parameter --disableparamexport detected: {} ..."),
             ("freqai_backtest_live_models", "Parameter --freqai-backtest-live-models detected ..."),
         ]
@@ -341,6 +367,7 @@ class Configuration:
             ("hyperopt_jobs", "Parameter -j/--job-workers detected: {}"),
             ("hyperopt_random_state", "Parameter --random-state detected: {}"),
             ("hyperopt_min_trades", "Parameter --min-trades detected: {}"),
+            ("hyperopt_halving_factor", "Parameter --successive-halving detected: {}"),
             ("hyperopt_loss", "Using Hyperopt loss class name: {}"),
             ("hyperopt_show_index", "Parameter -n/--index detected: {}"),
             ("hyperopt_list_best", "Parameter --best detected: {}"),
@@ -47,6 +47,7 @@ AVAILABLE_PAIRLISTS = [
     "PercentChangePairList",
     "ProducerPairList",
     "RemotePairList",
+    "PushPairList",
     "MarketCapPairList",
     "AgeFilter",
     "FullTradesFilter",
@@ -7,6 +7,7 @@ Common Interface for bot and strategy to access data.
 
 import logging
 from collections import deque
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Any
 
@@ -50,6 +51,7 @@ class DataProvider:
         self.__rpc = rpc
         self.__cached_pairs: dict[PairWithTimeframe, tuple[DataFrame, datetime]] = {}
         self.__slice_index: dict[str, int] = {}
+        self.__slice_index_func: Callable[[str], int | None] | None = None
         self.__slice_date: datetime | None = None
 
         self.__cached_pairs_backtesting: dict[PairWithTimeframe, DataFrame] = {}
@@ -77,6 +79,15 @@ class DataProvider:
         """
         self.__slice_index[pair] = limit_index
 
+    def _set_dataframe_max_index_func(self, func: Callable[[str], int | None] | None):
+        """
+        Compute the max index of a pair on demand, instead of setting it for every candle.
+        Pairs for which func returns None use the index set by _set_dataframe_max_index.
+        Only relevant in backtesting.
+        :param func: Callable returning the max index for a pair - or None to reset.
+        """
+        self.__slice_index_func = func
+
     def _set_dataframe_max_date(self, limit_date: datetime):
         """
         Limit informative dataframe to max specified index.
@@ -85,6 +96,13 @@ class DataProvider:
         """
         self.__slice_date = limit_date
 
+    def _get_dataframe_max_date(self) -> datetime | None:
+        """
+        "current date" as set by _set_dataframe_max_date.
+        Only relevant in backtesting.
+        """
+        return self.__slice_date
+
     def _set_cached_df(
         self, pair: str, timeframe: str, dataframe: DataFrame, candle_type: CandleType
     ) -> None:
@@ -393,7 +411,10 @@ class DataProvider:
                 df, date = self.__cached_pairs[pair_key]
             else:
                 df, date = self.__cached_pairs[pair_key]
-                if (max_index := self.__slice_index.get(pair)) is not None:
+                max_index = self.__slice_index_func(pair) if self.__slice_index_func else None
+                if max_index is None:
+                    max_index = self.__slice_index.get(pair)
+                if max_index is not None:
                     df = df.iloc[max(0, max_index - MAX_DATAFRAME_CANDLES) : max_index]
                 else:
                     return (DataFrame(), datetime.fromtimestamp(0, tz=timezone.utc))
@@ -423,6 +444,19 @@ class DataProvider:
         else:
             raise OperationalException("Dataprovider was not initialized with a pairlist provider.")
 
+    def pushed_data(self) -> dict[str, Any]:
+        """
+        Data pushed alongside the whitelist through `POST /api/v1/whitelist`.
+        Requires the PushPairList - updates become visible without reloading the bot.
+        :return: dict with the last pushed data. Empty if nothing was pushed yet.
+        """
+        if not self._pairlists:
+            raise OperationalException("Dataprovider was not initialized with a pairlist provider.")
+        for handler in self._pairlists._pairlist_handlers:
+            if handler.name == "PushPairList":
+                return handler.data
+        return {}
+
     def clear_cache(self):
         """
         Clear pair dataframe cache.
@@ -432,6 +466,7 @@ class DataProvider:
         # otherwise they're reloaded each time during hyperopt due to with analyze_per_epoch
         # self.__cached_pairs_backtesting = {}
         self.__slice_index = {}
+        self.__slice_index_func = None
 
     # Exchange functions
 
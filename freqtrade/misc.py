@@ -4,6 +4,7 @@ Various tool function for Freqtrade and scripts
 
 import gzip
 import logging
+import sys
 from collections.abc import Iterator, Mapping
 from io import StringIO
 from pathlib import Path
@@ -12,6 +13,7 @@ from urllib.parse import urlparse
 
 import pandas as pd
 import rapidjson
+from joblib.externals import cloudpickle
 
 from freqtrade.enums import SignalTagType, SignalType
 
@@ -236,3 +238,16 @@ def append_candles_to_dataframe(left: pd.DataFrame, right: pd.DataFrame) -> pd.D
     left.reset_index(drop=True, inplace=True)
 
     return left
+
+
+def register_strategy_pickle_by_value(bases: tuple[type, ...]) -> None:
+    """
+    Register modules of strategy base classes to be pickled by value,
+    so worker processes can load strategies inheriting across files.
+    :param bases: Base classes of the strategy class (``strategy.__class__.__bases__``)
+    """
+    for modules in bases:
+        if modules.__name__ != "IStrategy":
+            if mod := sys.modules.get(modules.__module__):
+                cloudpickle.register_pickle_by_value(mod)
+            register_strategy_pickle_by_value(modules.__bases__)
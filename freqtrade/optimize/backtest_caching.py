@@ -1,22 +1,46 @@
 import hashlib
+import inspect
 from copy import deepcopy
 from pathlib import Path
 
 import rapidjson
+from pandas import DataFrame
 
+from freqtrade import __version__
+from freqtrade.misc import pair_to_filename
 
-def get_strategy_run_id(strategy) -> str:
+
+# Configuration keys which can change the result of populate_indicators().
+INDICATOR_CONFIG_KEYS = (
+    "timeframe",
+    "stake_currency",
+    "trading_mode",
+    "margin_mode",
+    "reduce_df_footprint",
+    "orderflow",
+)
+
+
+def get_strategy_run_id(strategy, ignore_timerange: bool = False) -> str:
     """
     Generate unique identification hash for a backtest run. Identical config and strategy file will
     always return an identical hash.
     :param strategy: strategy object.
+    :param ignore_timerange: Identical hash for different timeranges (for incremental backtests).
     :return: hex string id.
     """
     digest = hashlib.sha1()  # noqa: S324
     config = deepcopy(strategy.config)
 
     # Options that have no impact on results of individual backtest.
-    not_important_keys = ("strategy_list", "original_config", "telegram", "api_server")
+    not_important_keys: tuple[str, ...] = (
+        "strategy_list",
+        "original_config",
+        "telegram",
+        "api_server",
+    )
+    if ignore_timerange:
+        not_important_keys += ("timerange",)
     for k in not_important_keys:
         if k in config:
             del config[k]
@@ -37,6 +61,66 @@ def get_strategy_run_id(strategy) -> str:
     return digest.hexdigest().lower()
 
 
+def get_indicator_hash(strategy) -> str:
+    """
+    Generate identification hash for the indicators of a strategy.
+    Covers the source of populate_indicators() (and of @informative() methods),
+    the strategy parameter values and the configuration influencing indicators -
+    but not entry / exit logic, ROI or stoploss.
+    :param strategy: strategy object.
+    :return: hex string id.
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    populate_fns = [type(strategy).populate_indicators]
+    populate_fns.extend(populate_fn for _, populate_fn in strategy._ft_informative)
+    for populate_fn in populate_fns:
+        try:
+            digest.update(inspect.getsource(populate_fn).encode("utf-8"))
+        except (OSError, TypeError):
+            # Source not available - fall back to the whole strategy file.
+            with Path(strategy.__file__).open("rb") as fp:
+                digest.update(fp.read())
+
+    config = {key: strategy.config.get(key) for key in INDICATOR_CONFIG_KEYS}
+    config["use_public_trades"] = strategy.config.get("exchange", {}).get("use_public_trades")
+    metadata = {
+        "version": __version__,
+        "strategy": strategy.get_strategy_name(),
+        "startup_candle_count": strategy.startup_candle_count,
+        "informative": [str(inf_data) for inf_data, _ in strategy._ft_informative],
+        "params": {name: param.value for name, param in strategy.enumerate_parameters()},
+        "config": config,
+    }
+    digest.update(
+        rapidjson.dumps(metadata, default=str, number_mode=rapidjson.NM_NAN).encode("utf-8")
+    )
+    return digest.hexdigest().lower()
+
+
+def get_indicator_cache_filename(
+    cache_dir: Path, pair: str, timeframe: str, dataframe: DataFrame
+) -> Path:
+    """
+    Return the cache filename for the analyzed dataframe of a pair.
+    The candle range of the (not yet analyzed) dataframe is part of the filename,
+    so a different timerange or updated data won't use the cached indicators.
+    """
+    start = int(dataframe["date"].iloc[0].timestamp()) if len(dataframe) else 0
+    end = int(dataframe["date"].iloc[-1].timestamp()) if len(dataframe) else 0
+    return (
+        cache_dir / f"{pair_to_filename(pair)}-{timeframe}-{start}-{end}-{len(dataframe)}.feather"
+    )
+
+
+def get_backtest_snapshot_filename(backtest_dir: Path, strategy) -> Path:
+    """
+    Return the filename of the incremental backtest snapshot for a strategy.
+    Identical for all timeranges, so a backtest on extended data finds the snapshot.
+    """
+    run_id = get_strategy_run_id(strategy, ignore_timerange=True)
+    return backtest_dir / "snapshots" / f"{strategy.get_strategy_name()}-{run_id}.pkl"
+
+
 def get_backtest_metadata_filename(filename: Path | str) -> Path:
     """Return metadata filename for specified backtest results file."""
     filename = Path(filename)
@@ -4,13 +4,20 @@
 This module contains the backtesting logic
 """
 
+import hashlib
 import logging
+import pickle
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta
+from multiprocessing import Manager
+from pathlib import Path
+from typing import Any
 
-from numpy import nan
-from pandas import DataFrame
+from joblib import Parallel, delayed, dump, load, wrap_non_picklable_objects
+from numpy import argsort, array, flatnonzero, int64, nan, ndarray
+from pandas import DataFrame, read_feather, to_datetime
+from pandas.arrays import DatetimeArray
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -43,15 +50,25 @@ from freqtrade.ft_types import (
     get_BacktestResultType_default,
 )
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
+from freqtrade.loggers.mp_logging import logging_mp_handle, logging_mp_setup
+from freqtrade.misc import register_strategy_pickle_by_value
 from freqtrade.mixins import LoggingMixin
-from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_caching import (
+    get_backtest_snapshot_filename,
+    get_indicator_cache_filename,
+    get_indicator_hash,
+    get_strategy_run_id,
+)
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.columnar_data import ColumnarPairData
+from freqtrade.optimize.event_index import PairEventIndex
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
     generate_rejected_signals,
     generate_trade_signal_candles,
     show_backtest_results,
     store_backtest_results,
+    text_table_strategy,
 )
 from freqtrade.persistence import (
     CustomDataWrapper,
@@ -74,6 +91,12 @@ from freqtrade.wallets import Wallets
 
 logger = logging.getLogger(__name__)
 
+log_queue: Any
+
+# Converted backtest data of the latest backtest with a signal key - see _get_ohlcv_as_lists().
+# Module level, so hyperopt worker processes keep it across epochs.
+_signal_cache: dict[str, tuple[dict[str, DataFrame], dict, dict]] = {}
+
 # Indexes for backtest tuples
 DATE_IDX = 0
 OPEN_IDX = 1
@@ -87,6 +110,22 @@ ESHORT_IDX = 8  # Exit short
 ENTER_TAG_IDX = 9
 EXIT_TAG_IDX = 10
 
+# Version of incremental backtest snapshots - snapshots of other versions are ignored.
+SNAPSHOT_VERSION = 2
+# Backtesting counters which are part of the result - and of the snapshot.
+SNAPSHOT_COUNTERS = (
+    "trade_id_counter",
+    "order_id_counter",
+    "rejected_trades",
+    "timedout_entry_orders",
+    "timedout_exit_orders",
+    "canceled_trade_entries",
+    "canceled_entry_orders",
+    "replaced_entry_orders",
+    "canceled_exit_orders",
+    "replaced_exit_orders",
+)
+
 # Every change to this headers list must evaluate further usages of the resulting tuple
 # and eventually change the constants for indexes at the top
 HEADERS = [
@@ -104,6 +143,21 @@ HEADERS = [
 ]
 
 
+def _rows_digest(rows: list | ColumnarPairData, count: int) -> str:
+    """
+    Digest of the first `count` backtest rows - dates, prices, signals and tags.
+    Identical for list and columnar rows.
+    """
+    selected = rows[:count]
+    digest = hashlib.sha256()
+    digest.update(array([row[DATE_IDX].value for row in selected], dtype=int64).tobytes())
+    digest.update(
+        array([row[OPEN_IDX : ESHORT_IDX + 1] for row in selected], dtype=float).tobytes()
+    )
+    digest.update(repr([tuple(row[ENTER_TAG_IDX:]) for row in selected]).encode())
+    return digest.hexdigest()
+
+
 class Backtesting:
     """
     Backtesting class, this class contains all the logic to run a backtest
@@ -218,6 +272,16 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
+        self._columnar_data: bool = self.config.get("backtest_columnar_data", False)
+        self._event_driven: bool = self.config.get("backtest_event_driven", False)
+        self._event_data: dict[str, tuple[ndarray, ndarray]] = {}
+        # Incremental backtests don't apply to hyperopt / lookahead analysis.
+        self._incremental: bool = (
+            self.config.get("backtest_incremental", False)
+            and self.config.get("runmode") == RunMode.BACKTEST
+        )
+        self._resume_snapshot: dict[str, Any] | None = None
+        self._backtest_snapshot: bytes | None = None
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -252,6 +316,8 @@ class Backtesting:
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
         self.detail_data: dict[str, DataFrame] = {}
+        # Sorted detail dates (int64 ns), timestamps and prices per pair - see get_detail_data
+        self._detail_index: dict[str, tuple[DataFrame, ndarray, DatetimeArray, ndarray]] = {}
         self.futures_data: dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -334,6 +400,7 @@ class Backtesting:
             )
         else:
             self.detail_data = {}
+        self._detail_index = {}
         if self.trading_mode == TradingMode.FUTURES:
             funding_fee_timeframe: str = self.exchange.get_option("funding_fee_timeframe")
             self.funding_fee_timeframe_secs: int = timeframe_to_seconds(funding_fee_timeframe)
@@ -416,17 +483,35 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, tuple]:
+    def _get_ohlcv_as_lists(
+        self,
+        processed: dict[str, DataFrame],
+        columnar: bool | None = None,
+        signal_key: str | None = None,
+    ) -> dict[str, tuple]:
         """
         Helper function to convert a processed dataframes into lists for performance reasons.
+        With `backtest_columnar_data`, pairs are stored as ColumnarPairData instead,
+        which is indexed like the lists but uses a fraction of the memory.
+        With `backtest_event_driven`, row dates and entry signals are kept for the event index.
 
         Used by backtest() - so keep this optimized for performance.
 
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
         optimize memory usage!
+        :param columnar: Override `backtest_columnar_data`
+        :param signal_key: Identifies the processed data and the entry / exit parameters.
+            Keeps the converted data for the next backtest with the same key.
         """
+        if columnar is None:
+            columnar = self._columnar_data
+        # Free the prior signals before generating new ones
+        _signal_cache.clear()
 
+        analyzed: dict[str, DataFrame] = {}
         data: dict = {}
+        timestamps: dict = {}
+        self._event_data = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
         # Create dict with data
@@ -438,7 +523,9 @@ class Backtesting:
             if not pair_data.empty:
                 # Cleanup from prior runs
                 pair_data.drop(HEADERS[5:] + ["buy", "sell"], axis=1, errors="ignore")
-            df_analyzed = self.strategy.ft_advise_signals(pair_data, {"pair": pair})
+            df_analyzed = analyzed[pair] = self.strategy.ft_advise_signals(
+                pair_data, {"pair": pair}
+            )
             # Update dataprovider cache
             self.dataprovider._set_cached_df(
                 pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
@@ -468,9 +555,47 @@ class Backtesting:
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
 
+            if self._event_driven and not df_analyzed.empty:
+                dates = to_datetime(df_analyzed["date"], utc=True).to_numpy(dtype="datetime64[ns]")
+                entries = (df_analyzed["enter_long"] == 1) | (df_analyzed["enter_short"] == 1)
+                self._event_data[pair] = (dates.view(int64), flatnonzero(entries.to_numpy()))
+
             # Convert from Pandas to list for performance reasons
             # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+            if df_analyzed.empty:
+                data[pair] = []
+            elif columnar:
+                data[pair] = ColumnarPairData(
+                    df_analyzed,
+                    HEADERS[OPEN_IDX : CLOSE_IDX + 1],
+                    HEADERS[LONG_IDX : ESHORT_IDX + 1],
+                    HEADERS[ENTER_TAG_IDX:],
+                    timestamps,
+                )
+            else:
+                data[pair] = df_analyzed[HEADERS].values.tolist()
+        if signal_key is not None:
+            _signal_cache[signal_key] = (analyzed, data, self._event_data)
+        return data
+
+    @staticmethod
+    def signals_cached(signal_key: str) -> bool:
+        """Check if _get_ohlcv_as_lists() holds converted data for this signal key."""
+        return signal_key in _signal_cache
+
+    def _load_cached_signals(self, processed: dict[str, DataFrame], signal_key: str) -> dict:
+        """
+        Load converted data stored by _get_ohlcv_as_lists().
+        Replaces processed dataframes and dataprovider cache the same way.
+        """
+        analyzed, data, self._event_data = _signal_cache[signal_key]
+        for pair, df_analyzed in analyzed.items():
+            self.dataprovider._set_cached_df(
+                pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+            )
+            processed[pair] = trim_dataframe(
+                df_analyzed, self.timerange, startup_candles=self.required_startup
+            )
         return data
 
     def _get_close_rate(
@@ -1455,26 +1580,198 @@ class Backtesting:
             return exiting_dir
         return None
 
-    def get_detail_data(self, pair: str, row: tuple) -> list[tuple] | None:
+    def _get_detail_index(self, pair: str) -> tuple[ndarray, DatetimeArray, ndarray]:
         """
-        Spread into detail data
+        Sorted detail dates (as int64 nanoseconds), the matching timestamps and
+        the [open, high, low, close] array for a pair.
+        Built once per detail dataframe, so each main candle only needs a binary search.
+        Rows are only built for the slice returned by get_detail_data.
         """
-        current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-        exit_candle_end = current_detail_time + self.timeframe_td
         detail_data = self.detail_data[pair]
-        detail_data = detail_data.loc[
-            (detail_data["date"] >= current_detail_time) & (detail_data["date"] < exit_candle_end)
-        ].copy()
+        cached = self._detail_index.get(pair)
+        if cached is None or cached[0] is not detail_data:
+            timestamps = to_datetime(detail_data["date"], utc=True)
+            dates = timestamps.to_numpy(dtype="datetime64[ns]").view(int64)
+            timestamps = timestamps.array
+            prices = detail_data[HEADERS[DATE_IDX + 1 : CLOSE_IDX + 1]].to_numpy(dtype=float)
+            if len(dates) > 1 and (dates[1:] < dates[:-1]).any():
+                order = argsort(dates, kind="stable")
+                dates, timestamps, prices = dates[order], timestamps[order], prices[order]
+            cached = (detail_data, dates, timestamps, prices)
+            self._detail_index[pair] = cached
+        return cached[1], cached[2], cached[3]
 
-        if len(detail_data) == 0:
+    def get_detail_data(self, pair: str, row: tuple) -> list[tuple] | None:
+        """
+        Spread into detail data
+        """
+        dates, timestamps, prices = self._get_detail_index(pair)
+        current_detail_time = row[DATE_IDX].value
+        exit_candle_end = current_detail_time + self.timeframe_secs * 1_000_000_000
+        start, end = dates.searchsorted([current_detail_time, exit_candle_end])
+        if start == end:
             return None
-        detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-        detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-        detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-        detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-        detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-        detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-        return detail_data[HEADERS].values.tolist()
+        signals = list(row[LONG_IDX : EXIT_TAG_IDX + 1])
+        return [
+            [date, *candle, *signals]
+            for date, candle in zip(timestamps[start:end], prices[start:end].tolist(), strict=True)
+        ]
+
+    def _init_event_index(
+        self, start_date: datetime, end_date: datetime, pairs: list[str], data: dict
+    ) -> PairEventIndex | None:
+        """
+        Build the event index for the event-driven backtest loop (None if disabled).
+        Uses dates and entry signals collected by _get_ohlcv_as_lists, falling back to the rows.
+        """
+        if not self._event_driven:
+            self.dataprovider._set_dataframe_max_index_func(None)
+            return None
+        pair_data = {}
+        for pair in pairs:
+            if pair in self._event_data:
+                pair_data[pair] = self._event_data[pair]
+            else:
+                rows = data[pair]
+                dates = [row[DATE_IDX].value for row in rows]
+                entries = [
+                    i for i, row in enumerate(rows) if row[LONG_IDX] == 1 or row[SHORT_IDX] == 1
+                ]
+                pair_data[pair] = (array(dates, dtype=int64), array(entries, dtype=int64))
+        events = PairEventIndex(
+            pairs,
+            pair_data,
+            start_ns=to_datetime(start_date, utc=True).value,
+            step_ns=self.timeframe_secs * 1_000_000_000,
+            num_steps=(end_date - start_date) // self.timeframe_td,
+            startup_candles=self.required_startup,
+        )
+        # Pairs which aren't visited on a candle still show up-to-date dataframes in callbacks.
+        self.dataprovider._set_dataframe_max_index_func(events.slice_index)
+        return events
+
+    def _event_candle_pairs(
+        self,
+        events: PairEventIndex | None,
+        step: int,
+        current_time: datetime,
+        pairs: list[str],
+        pairs_with_open_trades: list[str],
+        indexes: dict,
+    ) -> list[str]:
+        """
+        Pairs to visit on this candle - only pairs with an entry signal or open trades
+        if the event index is used, all pairs otherwise.
+        """
+        if not events:
+            return pairs
+        candle_pairs = events.candle_pairs(step, pairs_with_open_trades)
+        for pair in candle_pairs:
+            indexes[pair] = events.row_index(pair, step)
+        if events.has_rows(step):
+            # Pairs which aren't visited would have set this in the dense loop.
+            self.dataprovider._set_dataframe_max_date(current_time)
+        return candle_pairs
+
+    def _finish_event_index(self, events: PairEventIndex | None) -> None:
+        """Leave the dataprovider in the same state as the dense loop does"""
+        if not events:
+            return
+        self.dataprovider._set_dataframe_max_index_func(None)
+        for pair, max_index in events.final_slice_indexes().items():
+            self.dataprovider._set_dataframe_max_index(pair, max_index)
+
+    def _capture_snapshot(
+        self,
+        start_date: datetime,
+        current_time: datetime,
+        step: int,
+        pairs: list[str],
+        data: dict,
+        indexes: dict,
+        events: PairEventIndex | None,
+    ) -> bytes:
+        """
+        Serialize the backtest state at the start of a main candle, for incremental backtests.
+        """
+        if events:
+            indexes = {pair: events.row_index(pair, step) for pair in pairs}
+        row_digests = {
+            pair: _rows_digest(data[pair], index) for pair, index in indexes.items() if index > 0
+        }
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "start_date": start_date,
+            "resume_date": current_time,
+            "step": step,
+            "pairs": pairs,
+            "indexes": dict(indexes),
+            "row_digests": row_digests,
+            "max_date": self.dataprovider._get_dataframe_max_date(),
+            "trades": LocalTrade.bt_trades,
+            "open_trades": LocalTrade.bt_trades_open,
+            "total_profit": LocalTrade.bt_total_profit,
+            "locks": PairLocks.locks,
+            "custom_data": CustomDataWrapper.custom_data,
+            "rejected_dict": self.rejected_dict,
+            "counters": {counter: getattr(self, counter) for counter in SNAPSHOT_COUNTERS},
+        }
+        return pickle.dumps(snapshot)
+
+    def _resume_from_snapshot(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        pairs: list[str],
+        data: dict,
+        indexes: dict,
+    ) -> int:
+        """
+        Restore the backtest state from the snapshot of a prior backtest (if one is loaded)
+        - provided it covers the same start date, pairs, candles and signals.
+        :return: First main candle (step) to simulate.
+        """
+        snapshot = self._resume_snapshot
+        self._resume_snapshot = None
+        if not snapshot:
+            return 1
+        resume_date = snapshot["resume_date"]
+        if (
+            snapshot["start_date"] != start_date
+            or snapshot["pairs"] != pairs
+            or not start_date < resume_date <= end_date
+            or any(
+                len(data[pair]) < snapshot["indexes"][pair]
+                or _rows_digest(data[pair], snapshot["indexes"][pair]) != digest
+                for pair, digest in snapshot["row_digests"].items()
+            )
+        ):
+            logger.info("Backtest snapshot doesn't match the data, running a full backtest.")
+            return 1
+
+        LocalTrade.bt_trades = snapshot["trades"]
+        for trade in snapshot["open_trades"]:
+            LocalTrade.add_bt_trade(trade)
+        LocalTrade.bt_total_profit = snapshot["total_profit"]
+        PairLocks.locks = snapshot["locks"]
+        CustomDataWrapper.custom_data = snapshot["custom_data"]
+        self.rejected_dict = snapshot["rejected_dict"]
+        for counter, value in snapshot["counters"].items():
+            setattr(self, counter, value)
+        self.wallets.update()
+
+        step = snapshot["step"]
+        indexes.update(snapshot["indexes"])
+        for pair, index in indexes.items():
+            if index > 0:
+                self.dataprovider._set_dataframe_max_index(pair, self.required_startup + index)
+        if snapshot["max_date"]:
+            self.dataprovider._set_dataframe_max_date(snapshot["max_date"])
+        logger.info(
+            f"Resuming backtest from {resume_date.strftime(DATETIME_PRINT_FORMAT)}, "
+            f"{len(LocalTrade.bt_trades)} closed and {len(LocalTrade.bt_trades_open)} open trades."
+        )
+        return step
 
     def _time_generator(self, start_date: datetime, end_date: datetime):
         current_time = start_date + self.timeframe_td
@@ -1498,14 +1795,20 @@ class Backtesting:
             i += 1
             current_time += self.timeframe_detail_td
 
-    def _time_pair_generator_det(self, current_time: datetime, pairs: list[str]):
+    def _time_pair_generator_det(
+        self, current_time: datetime, pairs: list[str], events: PairEventIndex | None = None
+    ):
         for current_time_det, is_first, has_detail, idx in self._time_generator_det(
             current_time, current_time + self.timeframe_td
         ):
             # Pairs that have open trades should be processed first
             new_pairlist = list(dict.fromkeys([t.pair for t in LocalTrade.bt_trades_open] + pairs))
             for pair in new_pairlist:
+                if events:
+                    events.processing(pair if is_first else None)
                 yield current_time_det, is_first, has_detail, idx, pair
+        if events:
+            events.processing(None)
 
     def time_pair_generator(
         self,
@@ -1516,19 +1819,28 @@ class Backtesting:
     ):
         """
         Backtest time and pair generator
+        With `backtest_event_driven`, only pairs with an entry signal or an open trade
+        are visited on each candle - with identical results.
         :returns: generator of (current_time, pair, row, is_last_row, trade_dir)
             where is_last_row is a boolean indicating if this is the data end date.
         """
-        current_time = start_date + self.timeframe_td
         self.progress.init_step(
             BacktestState.BACKTEST, int((end_date - start_date) / self.timeframe_td)
         )
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: dict = defaultdict(int)
+        events = self._init_event_index(start_date, end_date, pairs, data)
+        first_step = self._resume_from_snapshot(start_date, end_date, pairs, data, indexes)
+        loop_start = start_date + (first_step - 1) * self.timeframe_td
 
-        for current_time in self._time_generator(start_date, end_date):
+        for step, current_time in enumerate(self._time_generator(loop_start, end_date), first_step):
             # Loop for each main candle.
             self.check_abort()
+            if self._incremental and current_time == end_date:
+                # State before the last candle - which doesn't allow entries in this run.
+                self._backtest_snapshot = self._capture_snapshot(
+                    start_date, current_time, step, pairs, data, indexes, events
+                )
             # Reset open trade count for this candle
             # Critical to avoid exceeding max_open_trades in backtesting
             # when timeframe-detail is used and trades close within the opening candle.
@@ -1538,9 +1850,12 @@ class Backtesting:
             pair_detail_cache: dict[str, list[tuple]] = {}
             pair_tradedir_cache: dict[str, LongShort | None] = {}
             pairs_with_open_trades = [t.pair for t in LocalTrade.bt_trades_open]
+            candle_pairs = self._event_candle_pairs(
+                events, step, current_time, pairs, pairs_with_open_trades, indexes
+            )
 
             for current_time_det, is_first, has_detail, idx, pair in self._time_pair_generator_det(
-                current_time, pairs
+                current_time, candle_pairs, events
             ):
                 # Loop for each detail candle (if necessary) and pair
                 # Yields only the main date if no detail timeframe is set.
@@ -1615,8 +1930,14 @@ class Backtesting:
                 yield current_time_det, pair, row, is_last_row, trade_dir
             self.progress.increment()
 
+        self._finish_event_index(events)
+
     def backtest(
-        self, processed: dict, start_date: datetime, end_date: datetime
+        self,
+        processed: dict,
+        start_date: datetime,
+        end_date: datetime,
+        signal_key: str | None = None,
     ) -> BacktestContentTypeIcomplete:
         """
         Implement backtesting functionality
@@ -1629,6 +1950,8 @@ class Backtesting:
         optimize memory usage!
         :param start_date: backtesting timerange start datetime
         :param end_date: backtesting timerange end datetime
+        :param signal_key: Reuse entry / exit signals of the prior backtest with the same key
+            (used by hyperopt, see _get_ohlcv_as_lists)
         :return: DataFrame with trades (results of backtesting)
         """
         self.prepare_backtest(self.enable_protections)
@@ -1636,7 +1959,10 @@ class Backtesting:
         self.wallets.update()
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
-        data: dict = self._get_ohlcv_as_lists(processed)
+        if signal_key is not None and self.signals_cached(signal_key):
+            data: dict = self._load_cached_signals(processed, signal_key)
+        else:
+            data = self._get_ohlcv_as_lists(processed, signal_key=signal_key)
 
         # Loop timerange and get candle for each pair at that point in time
         for (
@@ -1676,6 +2002,66 @@ class Backtesting:
             "final_balance": self.wallets.get_total(self.strategy.config["stake_currency"]),
         }
 
+    def _advise_all_indicators(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Populate indicators for all pairs.
+        With "backtest_indicator_cache", analyzed dataframes are loaded from / stored to
+        feather files keyed by the indicator hash of the strategy.
+        """
+        if not self.config.get("backtest_indicator_cache", False):
+            return self.strategy.advise_all_indicators(data)
+        if self.config.get("freqai", {}).get("enabled", False):
+            logger.warning("Indicator cache is not supported with FreqAI, populating indicators.")
+            return self.strategy.advise_all_indicators(data)
+
+        cache_dir = (
+            self.config["user_data_dir"]
+            / "backtest_results"
+            / "indicator_cache"
+            / get_indicator_hash(self.strategy)
+        )
+        cache_files = {
+            pair: get_indicator_cache_filename(cache_dir, pair, self.timeframe, pair_data)
+            for pair, pair_data in data.items()
+        }
+        cached = {}
+        for pair, cache_file in cache_files.items():
+            if cache_file.is_file():
+                try:
+                    cached[pair] = read_feather(cache_file)
+                except Exception as e:
+                    logger.warning(f"Could not load cached indicators for {pair}: {e}")
+        logger.info(f"Loaded cached indicators for {len(cached)} of {len(data)} pairs.")
+
+        missing = {pair: pair_data for pair, pair_data in data.items() if pair not in cached}
+        analyzed = self.strategy.advise_all_indicators(missing) if missing else {}
+        if analyzed:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        for pair, dataframe in analyzed.items():
+            try:
+                dataframe.to_feather(cache_files[pair], compression="lz4")
+            except Exception as e:
+                cache_files[pair].unlink(missing_ok=True)
+                logger.warning(f"Could not cache indicators for {pair}: {e}")
+        return {pair: cached[pair] if pair in cached else analyzed[pair] for pair in data}
+
+    @staticmethod
+    def _load_backtest_snapshot(snapshot_file: Path) -> dict[str, Any] | None:
+        """
+        Load the incremental backtest snapshot written by a prior backtest.
+        """
+        if not snapshot_file.is_file():
+            return None
+        try:
+            snapshot = pickle.loads(snapshot_file.read_bytes())  # noqa: S301
+        except Exception as e:
+            logger.warning(f"Could not load backtest snapshot {snapshot_file}: {e}")
+            return None
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        logger.info(f"Loaded backtest snapshot {snapshot_file}.")
+        return snapshot
+
     def backtest_one_strategy(
         self, strat: IStrategy, data: dict[str, DataFrame], timerange: TimeRange
     ):
@@ -1686,7 +2072,7 @@ class Backtesting:
         self._set_strategy(strat)
 
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        preprocessed = self._advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe
         # This only used to determine if trimming would result in an empty dataframe
@@ -1703,12 +2089,22 @@ class Backtesting:
             f"up to {max_date.strftime(DATETIME_PRINT_FORMAT)} "
             f"({(max_date - min_date).days} days)."
         )
+        snapshot_file = None
+        if self._incremental:
+            snapshot_file = get_backtest_snapshot_filename(
+                self.config["user_data_dir"] / "backtest_results", self.strategy
+            )
+            self._resume_snapshot = self._load_backtest_snapshot(snapshot_file)
         # Execute backtest and store results
         results = self.backtest(
             processed=preprocessed,
             start_date=min_date,
             end_date=max_date,
         )
+        if snapshot_file and self._backtest_snapshot:
+            snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            snapshot_file.write_bytes(self._backtest_snapshot)
+            self._backtest_snapshot = None
         backtest_end_time = dt_now()
         results.update(
             {
@@ -1733,6 +2129,163 @@ class Backtesting:
 
         return min_date, max_date
 
+    def _setup_logging_mp_workaround(self) -> None:
+        """
+        Workaround for logging in child processes.
+        log_queue must be a global in the file that initializes Parallel.
+        """
+        global log_queue
+        m = Manager()
+        log_queue = m.Queue()
+
+    def backtest_strategy_worker(
+        self, strategy_index: int, timerange: TimeRange, data_file: Path
+    ) -> tuple[str, BacktestContentType, dict[str, DataFrame], datetime, datetime]:
+        """
+        Backtest one strategy of the strategy list in a worker process.
+        :param strategy_index: Index of the strategy in strategylist
+        :param timerange: Backtest timerange
+        :param data_file: File with candle data, loaded memory-mapped
+        :return: Tuple of (strategy name, backtest content, analysis results, min date, max date)
+        """
+        with data_file.open("rb") as f:
+            shared = load(f, mmap_mode="r")
+        self.detail_data = shared["detail_data"]
+        self.futures_data = shared["futures_data"]
+        strat = self.strategylist[strategy_index]
+        min_date, max_date = self.backtest_one_strategy(strat, shared["data"], timerange)
+        strategy_name = strat.get_strategy_name()
+        analysis = {
+            key: results[strategy_name]
+            for key, results in self.analysis_results.items()
+            if strategy_name in results
+        }
+        return strategy_name, self.all_bt_content[strategy_name], analysis, min_date, max_date
+
+    def run_strategies_parallel(
+        self,
+        parallel: Parallel,
+        strategy_indexes: list[int],
+        timerange: TimeRange,
+        data_file: Path,
+    ) -> list[tuple[str, BacktestContentType, dict[str, DataFrame], datetime, datetime]]:
+        """Backtest strategies in a parallel way"""
+
+        def backtest_wrapper(*args, **kwargs):
+            # global log queue. This must happen in the file that initializes Parallel
+            logging_mp_setup(
+                log_queue, logging.INFO if self.config.get("verbosity", 0) < 1 else logging.DEBUG
+            )
+            return self.backtest_strategy_worker(*args, **kwargs)
+
+        return parallel(
+            delayed(wrap_non_picklable_objects(backtest_wrapper))(i, timerange, data_file)
+            for i in strategy_indexes
+        )
+
+    def backtest_strategies_parallel(
+        self, strategies: list[IStrategy], data: dict[str, DataFrame], timerange: TimeRange
+    ) -> tuple[datetime, datetime]:
+        """
+        Backtest multiple strategies in worker processes (``backtest_jobs``).
+        Candle data is loaded once, and shared with all workers through a memory-mapped file.
+        Results are merged as if the strategies were backtested one after the other.
+        """
+        for strat in strategies:
+            register_strategy_pickle_by_value(strat.__class__.__bases__)
+        # We don't need exchange instance anymore while running the backtests
+        self.exchange.close()
+        self.exchange._api = None
+        self.exchange._api_async = None
+        self.exchange.loop = None  # type: ignore
+        self.exchange._loop_lock = None  # type: ignore
+        self.exchange._cache_lock = None  # type: ignore
+
+        data_file = self.config["user_data_dir"] / "backtest_results" / "backtest_tickerdata.pkl"
+        data_file.parent.mkdir(parents=True, exist_ok=True)
+        dump(
+            {"data": data, "detail_data": self.detail_data, "futures_data": self.futures_data},
+            data_file,
+        )
+        # Don't send candle data with every task - workers load it from data_file.
+        detail_data, futures_data = self.detail_data, self.futures_data
+        self.detail_data, self.futures_data = {}, {}
+        strategy_indexes = [self.strategylist.index(strat) for strat in strategies]
+        self._setup_logging_mp_workaround()
+        try:
+            with Parallel(n_jobs=self.config.get("backtest_jobs", 1)) as parallel:
+                jobs = min(parallel._effective_n_jobs(), len(strategies))
+                logger.info(f"Backtesting {len(strategies)} strategies in {jobs} worker processes.")
+                results = self.run_strategies_parallel(
+                    parallel, strategy_indexes, timerange, data_file
+                )
+                logging_mp_handle(log_queue)
+        finally:
+            self.detail_data, self.futures_data = detail_data, futures_data
+            data_file.unlink(missing_ok=True)
+
+        for strategy_name, bt_content, analysis, min_date, max_date in results:
+            self.all_bt_content[strategy_name] = bt_content
+            for key, analysis_result in analysis.items():
+                self.analysis_results[key][strategy_name] = analysis_result
+        return min_date, max_date
+
+    def screen_strategies(
+        self, strategies: list[IStrategy], data: dict[str, DataFrame], timerange: TimeRange
+    ) -> list[IStrategy]:
+        """
+        Backtest strategies with the vectorized fast screen engine first.
+        Only the ``backtest_fast_screen`` most profitable ones are returned for the full
+        backtest - as well as all strategies which can't be screened.
+        """
+        from freqtrade.optimize.fast_screen import FastScreen
+
+        fast_screen = FastScreen(self)
+        selected = []
+        screened: dict[str, BacktestContentType] = {}
+        for strat in strategies:
+            strategy_name = strat.get_strategy_name()
+            unsupported = fast_screen.unsupported_features(strat)
+            if unsupported:
+                logger.warning(
+                    f"Fast screen doesn't support {', '.join(unsupported)} "
+                    f"of {strategy_name}, running the full backtest for it."
+                )
+                selected.append(strat)
+                continue
+            self._set_strategy(strat)
+            preprocessed = self._advise_all_indicators(data)
+            preprocessed_tmp = trim_dataframes(preprocessed, timerange, self.required_startup)
+            if not preprocessed_tmp:
+                raise OperationalException("No data left after adjusting for startup candles.")
+            min_date, max_date = history.get_timerange(preprocessed_tmp)
+            screen_start_time = int(dt_now().timestamp())
+            results = fast_screen.backtest(preprocessed, min_date, max_date)
+            screened[strategy_name] = {
+                **results,
+                "run_id": "",
+                "backtest_start_time": screen_start_time,
+                "backtest_end_time": int(dt_now().timestamp()),
+            }
+        if not screened:
+            return strategies
+
+        logger.warning(
+            "Fast screen results are approximate: " + "; ".join(fast_screen.divergences()) + "."
+        )
+        stats = generate_backtest_stats(data, screened, min_date=min_date, max_date=max_date)
+        text_table_strategy(
+            stats["strategy_comparison"], self.config["stake_currency"], "FAST SCREEN SUMMARY"
+        )
+        ranked = sorted(
+            screened, key=lambda name: stats["strategy"][name]["profit_total_abs"], reverse=True
+        )
+        top = ranked[: self.config["backtest_fast_screen"]]
+        logger.info(f"Fast screen selected {', '.join(top)} for the full backtest.")
+        return [
+            strat for strat in strategies if strat in selected or strat.get_strategy_name() in top
+        ]
+
     def _get_min_cached_backtest_date(self):
         min_backtest_date = None
         backtest_cache_age = self.config.get("backtest_cache", constants.BACKTEST_CACHE_DEFAULT)
@@ -1772,12 +2325,22 @@ class Backtesting:
 
         self.load_prior_backtest()
 
+        strategies = []
         for strat in self.strategylist:
             if self.results and strat.get_strategy_name() in self.results["strategy"]:
                 # When previous result hash matches - reuse that result and skip backtesting.
                 logger.info(f"Reusing result of previous backtest for {strat.get_strategy_name()}")
                 continue
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+            strategies.append(strat)
+
+        if len(strategies) > self.config.get("backtest_fast_screen", len(strategies)):
+            strategies = self.screen_strategies(strategies, data, timerange)
+
+        if self.config.get("backtest_jobs", 1) != 1 and len(strategies) > 1:
+            min_date, max_date = self.backtest_strategies_parallel(strategies, data, timerange)
+        else:
+            for strat in strategies:
+                min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
 
         # Update old results with new ones.
         if len(self.all_bt_content) > 0:
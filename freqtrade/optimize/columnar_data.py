@@ -0,0 +1,130 @@
+"""
+Columnar storage for backtest candles
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+from pandas import DataFrame, DatetimeIndex, Timestamp, factorize
+
+
+# Rows are materialized in blocks of 2**ROW_BLOCK_SHIFT candles.
+ROW_BLOCK_SHIFT = 10
+
+
+class ColumnarPairData(Sequence):
+    """
+    Read-only, columnar replacement for the list-of-lists rows used by backtesting.
+
+    Candles are stored as NumPy arrays - int64 dates, float64 prices, int8 signals
+    (float64 if a signal doesn't fit into int8) and int32 codes for the tag columns.
+    Rows are returned as tuples in the order
+    ``(date, *price_columns, *signal_columns, *tag_columns)``, so the backtest loop keeps
+    indexing rows the same way. They are materialized one block of candles at a time
+    (the backtest walks each pair forward), and only the current block is kept.
+
+    Timestamp objects are shared through ``timestamps``, which should be the same dict
+    for all pairs of one backtest - so each candle date exists only once in memory.
+    Signals are returned as int instead of float, which doesn't change their comparisons.
+    """
+
+    __slots__ = (
+        "_block",
+        "_block_rows",
+        "_dates",
+        "_len",
+        "_prices",
+        "_signals",
+        "_tag_codes",
+        "_tags",
+        "_timestamps",
+    )
+
+    def __init__(
+        self,
+        dataframe: DataFrame,
+        price_columns: list[str],
+        signal_columns: list[str],
+        tag_columns: list[str],
+        timestamps: dict[int, Timestamp],
+    ):
+        self._timestamps = timestamps
+        dates = dataframe["date"].to_numpy(dtype="datetime64[ns]")
+        self._dates = dates.view(np.int64)
+        self._len = len(self._dates)
+        missing = [i for i, date in enumerate(self._dates.tolist()) if date not in timestamps]
+        if missing:
+            new_dates = dates[missing]
+            timestamps.update(
+                zip(
+                    new_dates.view(np.int64).tolist(),
+                    DatetimeIndex(new_dates, tz="UTC"),
+                    strict=True,
+                )
+            )
+        self._prices = np.ascontiguousarray(dataframe[price_columns].to_numpy(dtype=np.float64))
+
+        signals = dataframe[signal_columns].to_numpy(dtype=np.float64)
+        if np.array_equal(signals, signals.astype(np.int8)):
+            self._signals = signals.astype(np.int8)
+        else:
+            self._signals = np.ascontiguousarray(signals)
+
+        codes, uniques = factorize(dataframe[tag_columns].to_numpy().ravel(), use_na_sentinel=True)
+        # Code -1 (missing tag) points to the trailing None.
+        self._tags = [*uniques.tolist(), None]
+        self._tag_codes = codes.astype(np.int32).reshape(-1, len(tag_columns))
+        self._block = -1
+        self._block_rows: list[tuple] = []
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _materialize(self, block: int) -> list[tuple]:
+        start = block << ROW_BLOCK_SHIFT
+        end = start + (1 << ROW_BLOCK_SHIFT)
+        get_tag = self._tags.__getitem__
+        return list(
+            zip(
+                map(self._timestamps.__getitem__, self._dates[start:end].tolist()),
+                *self._prices[start:end].T.tolist(),
+                *self._signals[start:end].T.tolist(),
+                *(map(get_tag, codes) for codes in self._tag_codes[start:end].T.tolist()),
+                strict=True,
+            )
+        )
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("ColumnarPairData index out of range")
+        block = index >> ROW_BLOCK_SHIFT
+        if block != self._block:
+            self._block_rows = self._materialize(block)
+            self._block = block
+        return self._block_rows[index - (block << ROW_BLOCK_SHIFT)]
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Candle dates as int64 nanoseconds"""
+        return self._dates
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Price columns, one row per candle"""
+        return self._prices
+
+    @property
+    def signals(self) -> np.ndarray:
+        """Signal columns, one row per candle"""
+        return self._signals
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the candle arrays (excluding shared timestamps and tag values)"""
+        return (
+            self._dates.nbytes + self._prices.nbytes + self._signals.nbytes + self._tag_codes.nbytes
+        )
@@ -0,0 +1,135 @@
+"""
+Event index for signal-sparse backtesting
+"""
+
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+
+class PairEventIndex:
+    """
+    Precomputed candle events, so the backtest loop only needs to visit pairs with an
+    entry signal or an open trade - instead of every pair on every candle.
+
+    Steps are the main candles of the backtest loop, counted from 1
+    (step ``k`` is ``start_date + k * timeframe``).
+    For every pair, the step at which each row is consumed is computed exactly like the
+    dense loop does it: one row per step at most, and only once the row's date is reached.
+    This reproduces the per-pair row indexes of the dense loop, including gaps and
+    pairs which start late or end early.
+    """
+
+    def __init__(
+        self,
+        pairs: list[str],
+        pair_data: dict[str, tuple[np.ndarray, np.ndarray]],
+        start_ns: int,
+        step_ns: int,
+        num_steps: int,
+        startup_candles: int,
+    ):
+        """
+        :param pairs: Pairs in backtest order
+        :param pair_data: Per pair, a tuple of (row dates as int64 nanoseconds,
+            indexes of rows with an entry signal)
+        :param start_ns: Backtest start date as nanoseconds
+        :param step_ns: Timeframe in nanoseconds
+        :param num_steps: Number of main candles in the backtest loop
+        :param startup_candles: Startup candles trimmed from the analyzed dataframes
+        """
+        self._pair_rank = {pair: i for i, pair in enumerate(pairs)}
+        self._startup = startup_candles
+        self._steps: dict[str, list[int]] = {}
+        self._entries: dict[int, list[str]] = {}
+        rows_at_step = np.zeros(num_steps + 1, dtype=bool)
+        grid = start_ns + step_ns * np.arange(1, num_steps + 1, dtype=np.int64)
+
+        for pair in pairs:
+            dates, entry_rows = pair_data[pair]
+            steps = self._consume_steps(dates, grid)
+            rows_at_step[steps] = True
+            self._steps[pair] = steps.tolist()
+            for step in steps[entry_rows[entry_rows < len(steps)]].tolist():
+                self._entries.setdefault(step, []).append(pair)
+        self._rows_at_step = rows_at_step.tolist()
+
+        self._step = 0
+        self._open_rank: dict[str, int] = {}
+        self._current_rank: float = -1
+
+    @staticmethod
+    def _consume_steps(dates: np.ndarray, grid: np.ndarray) -> np.ndarray:
+        """
+        Step at which each row is consumed by the dense loop.
+        The dense loop consumes the next row on step k if its date is <= grid[k],
+        so the consumed row count follows consumed[k] = min(consumed[k - 1] + 1, available[k]).
+        """
+        if len(dates) == 0 or len(grid) == 0:
+            return np.zeros(0, dtype=np.int64)
+        if (dates[1:] < dates[:-1]).any():
+            # Unsorted data - walk the loop.
+            consumed_steps = []
+            row = 0
+            for step, date in enumerate(grid.tolist(), 1):
+                if row < len(dates) and dates[row] <= date:
+                    consumed_steps.append(step)
+                    row += 1
+            return np.array(consumed_steps, dtype=np.int64)
+
+        step_nr = np.arange(1, len(grid) + 1, dtype=np.int64)
+        available = dates.searchsorted(grid, side="right")
+        consumed = step_nr + np.minimum(0, np.minimum.accumulate(available - step_nr))
+        return consumed.searchsorted(np.arange(1, consumed[-1] + 1), side="left") + 1
+
+    def has_rows(self, step: int) -> bool:
+        """Any pair has a row on this step"""
+        return self._rows_at_step[step]
+
+    def row_index(self, pair: str, step: int) -> int:
+        """
+        Row index of the pair at the start of this step (the dense loop's ``indexes[pair]``).
+        The row is only valid if it's consumed on this step - which validate_row() checks.
+        """
+        return bisect_left(self._steps[pair], step)
+
+    def candle_pairs(self, step: int, open_trade_pairs: list[str]) -> list[str]:
+        """
+        Start a new step.
+        :param open_trade_pairs: Pairs with open trades, in dense loop order.
+        :return: Pairs to visit on this step, in backtest order.
+        """
+        self._step = step
+        self._open_rank = {pair: i for i, pair in enumerate(dict.fromkeys(open_trade_pairs))}
+        self._current_rank = -1
+        active = self._open_rank.keys() | self._entries.get(step, [])
+        return sorted(active, key=self._pair_rank.__getitem__)
+
+    def _rank(self, pair: str) -> int:
+        if pair in self._open_rank:
+            return self._open_rank[pair]
+        return len(self._open_rank) + self._pair_rank[pair]
+
+    def processing(self, pair: str | None) -> None:
+        """
+        Mark pair as the one currently processed on the first (main) candle of this step.
+        None marks all pairs as processed for this step.
+        """
+        self._current_rank = float("inf") if pair is None else self._rank(pair)
+
+    def slice_index(self, pair: str) -> int | None:
+        """
+        Analyzed dataframe max index of the pair, as the dense loop would have it set right now:
+        pairs processed before the current pair on this step are on this step's row,
+        all others still on the prior step's row.
+        """
+        steps = self._steps.get(pair)
+        if steps is None:
+            return None
+        step = self._step if self._rank(pair) <= self._current_rank else self._step - 1
+        consumed = bisect_right(steps, step)
+        return self._startup + consumed if consumed else None
+
+    def final_slice_indexes(self) -> dict[str, int]:
+        """Analyzed dataframe max index per pair after the last step"""
+        return {pair: self._startup + len(steps) for pair, steps in self._steps.items() if steps}
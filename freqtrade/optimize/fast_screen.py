@@ -0,0 +1,425 @@
+"""
+Vectorized backtest engine to screen strategies quickly
+"""
+
+from datetime import datetime
+from heapq import heappop, heappush
+from typing import Any
+
+import numpy as np
+from pandas import DataFrame, Timestamp, to_datetime
+
+from freqtrade.constants import UNLIMITED_STAKE_AMOUNT
+from freqtrade.data.btanalysis import BT_DATA_COLUMNS
+from freqtrade.enums import ExitType, TradingMode
+from freqtrade.ft_types import BacktestContentTypeIcomplete
+from freqtrade.optimize.backtesting import (
+    ELONG_IDX,
+    ENTER_TAG_IDX,
+    EXIT_TAG_IDX,
+    HIGH_IDX,
+    LONG_IDX,
+    LOW_IDX,
+    OPEN_IDX,
+    Backtesting,
+)
+from freqtrade.optimize.columnar_data import ColumnarPairData
+from freqtrade.resolvers.strategy_resolver import check_override
+from freqtrade.strategy.interface import IStrategy
+
+
+# Callbacks which change trades in ways the vectorized engine can't reproduce.
+UNSUPPORTED_CALLBACKS = (
+    "custom_entry_price",
+    "custom_exit_price",
+    "adjust_entry_price",
+    "adjust_exit_price",
+    "adjust_order_price",
+    "check_entry_timeout",
+    "check_exit_timeout",
+    "confirm_trade_entry",
+    "confirm_trade_exit",
+    "custom_exit",
+    "custom_stake_amount",
+)
+
+# Candles searched for the exit of a trade at once - grows 4-fold for every further search.
+EXIT_WINDOW = 256
+
+NS_PER_MINUTE = 60_000_000_000
+
+# Columns of ColumnarPairData.prices and ColumnarPairData.signals
+OPEN_COL, HIGH_COL, LOW_COL = (idx - OPEN_IDX for idx in (OPEN_IDX, HIGH_IDX, LOW_IDX))
+ENTER_COL, EXIT_COL = (idx - LONG_IDX for idx in (LONG_IDX, ELONG_IDX))
+
+
+class FastScreen:
+    """
+    Vectorized approximation of Backtesting.backtest(), to screen many strategies quickly.
+
+    Exits are searched with NumPy over the candles following each entry - exit signals,
+    stoploss, ROI and trailing stoploss are evaluated like the full engine does it,
+    including its close rates. Entries are then taken in chronological order,
+    respecting max_open_trades and the available stake.
+    Only long trades in spot markets are supported, and no callbacks are called -
+    strategies relying on them are reported by unsupported_features().
+    """
+
+    def __init__(self, backtesting: Backtesting):
+        self.backtesting = backtesting
+        self._roi_entries = np.zeros(0, dtype=np.int64)
+        self._roi_values = np.zeros(0, dtype=np.float64)
+
+    def unsupported_features(self, strategy: IStrategy) -> list[str]:
+        """
+        Features of the strategy which the fast screen can't reproduce.
+        :return: List of feature names - empty if the strategy can be screened.
+        """
+        unsupported = [
+            callback
+            for callback in UNSUPPORTED_CALLBACKS
+            if check_override(strategy, IStrategy, callback)
+        ]
+        if strategy.position_adjustment_enable:
+            unsupported.append("position_adjustment_enable")
+        if strategy.use_custom_stoploss:
+            unsupported.append("use_custom_stoploss")
+        if self.backtesting.trading_mode != TradingMode.SPOT:
+            unsupported.append(f"trading_mode {self.backtesting.trading_mode}")
+        if self.backtesting.config.get("position_stacking", False):
+            unsupported.append("position_stacking")
+        return unsupported
+
+    def divergences(self) -> list[str]:
+        """Differences to the full backtest engine, which apply to all screened strategies"""
+        divergences = [
+            "amount and price precision and minimum stake amounts are not applied",
+            "bot_loop_start() and order_filled() are not called",
+        ]
+        if self.backtesting.enable_protections:
+            divergences.append("protections are ignored")
+        if self.backtesting.timeframe_detail:
+            divergences.append("timeframe_detail is ignored")
+        return divergences
+
+    def backtest(
+        self, processed: dict, start_date: datetime, end_date: datetime
+    ) -> BacktestContentTypeIcomplete:
+        """
+        Fast screen counterpart of Backtesting.backtest() for the current strategy.
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param start_date: backtesting timerange start datetime
+        :param end_date: backtesting timerange end datetime
+        :return: Backtest content with the same keys as Backtesting.backtest()
+        """
+        bt = self.backtesting
+        strategy = bt.strategy
+        bt.prepare_backtest(False)
+        bt.wallets.update()
+        start_balance = bt.wallets.get_total(bt.config["stake_currency"])
+        stake_balance = bt.wallets.get_total_stake_amount()
+        profit_ratio = (
+            1.0 if "available_capital" in bt.config else bt.config["tradable_balance_ratio"]
+        )
+        data: dict = bt._get_ohlcv_as_lists(processed, columnar=True)
+        pairs = [pair for pair, pair_data in data.items() if len(pair_data) > 0]
+
+        self._roi_entries = np.array(sorted(strategy.minimal_roi), dtype=np.int64)
+        self._roi_values = np.array(
+            [strategy.minimal_roi[entry] for entry in self._roi_entries.tolist()], dtype=np.float64
+        )
+
+        open_trades: list[tuple[int, int]] = []
+        trades: list[dict[str, Any]] = []
+        busy_until = dict.fromkeys(pairs, -1)
+        closed_profit = 0.0
+        tied_up = 0.0
+        rejected = 0
+        max_open_trades = strategy.max_open_trades
+        for date, pair_nr, row in self._entry_candidates(data, pairs, end_date):
+            while open_trades and open_trades[0][0] <= date:
+                trade = trades[heappop(open_trades)[1]]
+                closed_profit += trade["profit_abs"]
+                tied_up -= trade["stake_amount"]
+            pair = pairs[pair_nr]
+            if row <= busy_until[pair]:
+                continue
+            if 0 < max_open_trades <= len(open_trades):
+                rejected += 1
+                continue
+            stake_amount = self._stake_amount(stake_balance + closed_profit * profit_ratio, tied_up)
+            if stake_amount <= 0:
+                continue
+            trade = self._simulate_trade(pair, data[pair], row, stake_amount)
+            busy_until[pair] = trade["exit_row"]
+            heappush(open_trades, (trade["close_date"], len(trades)))
+            tied_up += stake_amount
+            trades.append(trade)
+
+        results = DataFrame.from_records(trades, columns=BT_DATA_COLUMNS)
+        if len(results) > 0:
+            results["open_date"] = to_datetime(results["open_date"], utc=True)
+            results["close_date"] = to_datetime(results["close_date"], utc=True)
+            results = results.sort_values("close_date", kind="stable", ignore_index=True)
+        return {
+            "results": results,
+            "config": strategy.config,
+            "locks": [],
+            "rejected_signals": rejected,
+            "timedout_entry_orders": 0,
+            "timedout_exit_orders": 0,
+            "canceled_trade_entries": 0,
+            "canceled_entry_orders": 0,
+            "replaced_entry_orders": 0,
+            "final_balance": start_balance + sum(trade["profit_abs"] for trade in trades),
+        }
+
+    @staticmethod
+    def _entry_candidates(
+        data: dict[str, ColumnarPairData], pairs: list[str], end_date: datetime
+    ) -> list[tuple[int, int, int]]:
+        """
+        Rows with a long entry signal of all pairs, as (date, pair number, row index)
+        in the order the full engine visits them. No trades are opened on the last candle.
+        """
+        end_ns = Timestamp(end_date).value
+        dates, pair_nrs, rows = [], [], []
+        for pair_nr, pair in enumerate(pairs):
+            pair_data = data[pair]
+            signals = pair_data.signals
+            entry_rows = np.flatnonzero((signals[:, ENTER_COL] == 1) & (signals[:, EXIT_COL] != 1))
+            entry_rows = entry_rows[pair_data.dates[entry_rows] != end_ns]
+            dates.append(pair_data.dates[entry_rows])
+            pair_nrs.append(np.full(len(entry_rows), pair_nr, dtype=np.int64))
+            rows.append(entry_rows)
+        if not rows:
+            return []
+        all_dates, all_pair_nrs, all_rows = (
+            np.concatenate(dates),
+            np.concatenate(pair_nrs),
+            np.concatenate(rows),
+        )
+        order = np.lexsort((all_pair_nrs, all_dates))
+        return list(
+            zip(
+                all_dates[order].tolist(),
+                all_pair_nrs[order].tolist(),
+                all_rows[order].tolist(),
+                strict=True,
+            )
+        )
+
+    def _stake_amount(self, total_stake: float, tied_up: float) -> float:
+        """Stake amount for a new trade - like Wallets.get_trade_stake_amount()"""
+        config = self.backtesting.config
+        available = total_stake - tied_up
+        stake_amount = config["stake_amount"]
+        if stake_amount == UNLIMITED_STAKE_AMOUNT:
+            max_open_trades = self.backtesting.strategy.max_open_trades
+            if max_open_trades == 0:
+                return 0
+            stake_amount = min((available + tied_up) / max_open_trades, available)
+        if config.get("amend_last_stake_amount", False):
+            if available > stake_amount * config.get("last_stake_amount_min_ratio", 0.5):
+                stake_amount = min(stake_amount, available)
+            else:
+                stake_amount = 0
+        return stake_amount if available >= stake_amount else 0
+
+    def _simulate_trade(
+        self, pair: str, pair_data: ColumnarPairData, entry_row: int, stake_amount: float
+    ) -> dict[str, Any]:
+        """
+        Simulate one trade entering on the open of entry_row.
+        :return: Trade in the format of trade_list_to_dataframe(), plus its exit row
+        """
+        strategy = self.backtesting.strategy
+        fee = self.backtesting.fee
+        dates, prices = pair_data.dates, pair_data.prices
+        open_rate = float(prices[entry_row, OPEN_COL])
+        initial_stop = open_rate * (1 - abs(strategy.stoploss))
+
+        stop = initial_stop
+        window = EXIT_WINDOW
+        start = entry_row
+        exit_ = None
+        while exit_ is None and start < len(dates):
+            end = min(start + window, len(dates))
+            exit_, stop = self._find_exit(
+                pair_data, entry_row, open_rate, initial_stop, stop, start, end
+            )
+            start = end
+            window *= 4
+        if exit_ is None:
+            # Left open at the end of the backtest
+            exit_row = len(dates) - 1
+            close_rate = float(prices[exit_row, OPEN_COL])
+            exit_ = (exit_row, close_rate, ExitType.FORCE_EXIT.value, stop, strategy.stoploss)
+        exit_row, close_rate, exit_reason, stop, stop_ratio = exit_
+
+        amount = stake_amount / open_rate
+        open_value = amount * open_rate * (1 + fee)
+        profit_abs = amount * close_rate * (1 - fee) - open_value
+        open_date = int(dates[entry_row])
+        close_date = int(dates[exit_row])
+        return {
+            "pair": pair,
+            "stake_amount": stake_amount,
+            "max_stake_amount": stake_amount,
+            "amount": amount,
+            "open_date": open_date,
+            "close_date": close_date,
+            "open_rate": open_rate,
+            "close_rate": close_rate,
+            "fee_open": fee,
+            "fee_close": fee,
+            "trade_duration": (close_date - open_date) // NS_PER_MINUTE,
+            "profit_ratio": profit_abs / open_value,
+            "profit_abs": profit_abs,
+            "exit_reason": exit_reason,
+            "initial_stop_loss_abs": initial_stop,
+            "initial_stop_loss_ratio": -abs(strategy.stoploss),
+            "stop_loss_abs": stop,
+            "stop_loss_ratio": -abs(stop_ratio),
+            "min_rate": float(prices[entry_row : exit_row + 1, LOW_COL].min()),
+            "max_rate": float(prices[entry_row : exit_row + 1, HIGH_COL].max()),
+            "is_open": False,
+            "enter_tag": pair_data[entry_row][ENTER_TAG_IDX],
+            "leverage": 1.0,
+            "is_short": False,
+            "open_timestamp": open_date // 1_000_000,
+            "close_timestamp": close_date // 1_000_000,
+            "orders": [],
+            "exit_row": exit_row,
+        }
+
+    def _find_exit(
+        self,
+        pair_data: ColumnarPairData,
+        entry_row: int,
+        open_rate: float,
+        initial_stop: float,
+        stop: float,
+        start: int,
+        end: int,
+    ) -> tuple[tuple | None, float]:
+        """
+        Search the first exit in rows [start, end) - in the order of IStrategy.should_exit().
+        :param stop: Stoploss rate before row start
+        :return: Tuple of (exit row, close rate, exit reason, stoploss rate, stoploss ratio)
+            or None if there's no exit in these rows - and the stoploss rate after the rows.
+        """
+        strategy = self.backtesting.strategy
+        fee = self.backtesting.fee
+        prices = pair_data.prices[start:end]
+        signals = pair_data.signals[start:end]
+        open_, high, low = (
+            prices[:, OPEN_COL],
+            prices[:, HIGH_COL],
+            prices[:, LOW_COL],
+        )
+        enter = signals[:, ENTER_COL] == 1
+        open_value = open_rate * (1 + fee)
+        duration = (pair_data.dates[start:end] - pair_data.dates[entry_row]) // NS_PER_MINUTE
+
+        # ROI, on the candle high
+        roi_nr = self._roi_entries.searchsorted(duration, side="right") - 1
+        roi = np.where(roi_nr >= 0, self._roi_values[roi_nr], np.inf)
+        profit_high = high * (1 - fee) / open_value - 1
+        roi_hit = profit_high > roi
+        if strategy.ignore_roi_if_entry_signal:
+            roi_hit &= ~enter
+
+        # Exit signal
+        if strategy.use_exit_signal:
+            signal_hit = (signals[:, EXIT_COL] == 1) & ~enter
+            if strategy.exit_profit_only:
+                signal_hit &= open_ * (1 - fee) / open_value - 1 > strategy.exit_profit_offset
+        else:
+            signal_hit = np.zeros(len(prices), dtype=bool)
+
+        # Stoploss - trailing moves it up from the candle high, unless the candle hits it.
+        stop_ratio = np.full(len(prices), strategy.stoploss, dtype=np.float64)
+        if strategy.trailing_stop:
+            offset = strategy.trailing_stop_positive_offset
+            if strategy.trailing_stop_positive is not None:
+                stop_ratio[profit_high > offset] = strategy.trailing_stop_positive
+            candidate = high * (1 - np.abs(stop_ratio))
+            if strategy.trailing_only_offset_is_reached:
+                candidate[profit_high < offset] = -np.inf
+            stop_before = np.maximum.accumulate(np.concatenate(([stop], candidate[:-1])))
+            stop_now = np.where(stop_before < low, np.maximum(stop_before, candidate), stop_before)
+        else:
+            stop_now = np.full(len(prices), stop)
+        stop_hit = stop_now >= low
+
+        hits = np.flatnonzero(signal_hit | stop_hit | roi_hit)
+        if len(hits) == 0:
+            return None, float(stop_now[-1])
+
+        k = int(hits[0])
+        row = start + k
+        stop_k = float(stop_now[k])
+        trailing = stop_k > initial_stop
+        if signal_hit[k]:
+            exit_tag = pair_data[row][EXIT_TAG_IDX]
+            exit_reason = exit_tag if exit_tag else ExitType.EXIT_SIGNAL.value
+            close_rate = float(open_[k])
+        elif stop_hit[k] and not trailing:
+            exit_reason = ExitType.STOP_LOSS.value
+            close_rate = stop_k if stop_k <= high[k] else float(open_[k])
+        elif roi_hit[k]:
+            exit_reason = ExitType.ROI.value
+            close_rate = self._roi_close_rate(
+                open_rate, int(duration[k]), int(roi_nr[k]), float(open_[k]), low[k], high[k]
+            )
+        else:
+            exit_reason = ExitType.TRAILING_STOP_LOSS.value
+            close_rate = self._trailing_close_rate(
+                stop_k, float(stop_ratio[k]), int(duration[k]), float(open_[k]), low[k], high[k]
+            )
+        return (row, close_rate, exit_reason, stop_k, float(stop_ratio[k])), stop_k
+
+    def _roi_close_rate(
+        self, open_rate: float, trade_dur: int, roi_nr: int, open_: float, low: float, high: float
+    ) -> float:
+        """Close rate of a ROI exit - see Backtesting._get_close_rate_for_roi()"""
+        fee = self.backtesting.fee
+        timeframe_min = self.backtesting.timeframe_min
+        roi_entry = int(self._roi_entries[roi_nr])
+        roi = float(self._roi_values[roi_nr])
+        if roi == -1 and roi_entry % timeframe_min == 0:
+            return open_
+        close_rate = -(open_rate * roi + open_rate * (1 + fee)) / (fee - 1)
+        if (
+            trade_dur > 0
+            and trade_dur == roi_entry
+            and roi_entry % timeframe_min == 0
+            and open_ > close_rate
+        ):
+            return open_
+        return float(min(max(close_rate, low), high))
+
+    def _trailing_close_rate(
+        self, stop: float, stop_ratio: float, trade_dur: int, open_: float, low: float, high: float
+    ) -> float:
+        """Close rate of a trailing stop exit - see Backtesting._get_close_rate_for_stoploss()"""
+        strategy = self.backtesting.strategy
+        if stop > high:
+            return open_
+        if trade_dur != 0:
+            return stop
+        if (
+            strategy.trailing_only_offset_is_reached
+            and strategy.trailing_stop_positive_offset is not None
+            and strategy.trailing_stop_positive
+        ):
+            stop_rate = open_ * (
+                1
+                + abs(strategy.trailing_stop_positive_offset)
+                - abs(strategy.trailing_stop_positive)
+            )
+        else:
+            stop_rate = open_ * (1 - abs(stop_ratio))
+        return float(max(low, stop_rate))
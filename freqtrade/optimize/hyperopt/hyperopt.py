@@ -6,6 +6,7 @@ This module contains the hyperopt logic
 
 import logging
 import random
+import shutil
 from datetime import datetime
 from math import ceil
 from multiprocessing import Manager
@@ -18,10 +19,14 @@ from joblib import Parallel, cpu_count, delayed, wrap_non_picklable_objects
 from freqtrade.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
+from freqtrade.loggers.mp_logging import logging_mp_handle, logging_mp_setup
 from freqtrade.misc import file_dump_json, plural
-from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_handle, logging_mp_setup
 from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
 from freqtrade.optimize.hyperopt.hyperopt_output import HyperoptOutput
+from freqtrade.optimize.hyperopt_results_index import (
+    append_results_index,
+    get_results_index_filename,
+)
 from freqtrade.optimize.hyperopt_tools import (
     HyperoptStateContainer,
     HyperoptTools,
@@ -39,6 +44,9 @@ INITIAL_POINTS = 30
 # in the skopt model queue, to optimize memory consumption
 SKOPT_MODEL_QUEUE_SIZE = 10
 
+# Number of timerange slices used by successive halving (factor^-2, factor^-1, full timerange)
+HALVING_RUNGS = 3
+
 log_queue: Any
 
 
@@ -72,10 +80,11 @@ class Hyperopt:
             / "hyperopt_results"
             / f"strategy_{strategy}_{time_now}.fthypt"
         )
-        self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
+        self.shared_data_dir = (
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata"
         )
         self.total_epochs = config.get("epochs", 0)
+        self.halving_factor = config.get("hyperopt_halving_factor", 1)
 
         self.current_best_loss = 100
 
@@ -93,6 +102,9 @@ class Hyperopt:
         self.print_json = self.config.get("print_json", False)
 
         self.hyperopter = HyperOptimizer(self.config)
+        # Points told to the optimizer (opt.Xi), see get_asked_points
+        self.evaluated_points: set[tuple[Any, ...]] = set()
+        self._evaluated_count = 0
 
     @staticmethod
     def get_lock_filename(config: Config) -> str:
@@ -100,11 +112,18 @@ class Hyperopt:
 
     def clean_hyperopt(self) -> None:
         """
-        Remove hyperopt pickle files to restart hyperopt.
+        Remove hyperopt data and result files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
+        for f in [
+            self.shared_data_dir,
+            self.results_file,
+            get_results_index_filename(self.results_file),
+        ]:
             p = Path(f)
-            if p.is_file():
+            if p.is_dir():
+                logger.info(f"Removing `{p}`.")
+                shutil.rmtree(p)
+            elif p.is_file():
                 logger.info(f"Removing `{p}`.")
                 p.unlink()
 
@@ -113,9 +132,11 @@ class Hyperopt:
         Save hyperopt results to file
         Store one line per epoch.
         While not a valid json object - this allows appending easily.
+        Metrics and position of the epoch are added to the index of the results file.
         :param epoch: result dictionary for this epoch.
         """
         epoch[FTHYPT_FILEVERSION] = 2
+        offset = self.results_file.stat().st_size if self.results_file.is_file() else 0
         with self.results_file.open("a") as f:
             rapidjson.dump(
                 epoch,
@@ -124,6 +145,7 @@ class Hyperopt:
                 number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
             )
             f.write("\n")
+        append_results_index(self.results_file, epoch, offset)
 
         self.num_epochs_saved += 1
         logger.debug(
@@ -149,7 +171,9 @@ class Hyperopt:
                 self.print_all,
             )
 
-    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
+    def run_optimizer_parallel(
+        self, parallel: Parallel, asked: list[list], timerange_fraction: float = 1.0
+    ) -> list[dict[str, Any]]:
         """Start optimizer in a parallel way"""
 
         def optimizer_wrapper(*args, **kwargs):
@@ -160,11 +184,70 @@ class Hyperopt:
 
             return self.hyperopter.generate_optimizer(*args, **kwargs)
 
-        return parallel(delayed(wrap_non_picklable_objects(optimizer_wrapper))(v) for v in asked)
+        return parallel(
+            delayed(wrap_non_picklable_objects(optimizer_wrapper))(v, timerange_fraction)
+            for v in asked
+        )
+
+    def run_successive_halving(
+        self, parallel: Parallel, asked: list[list]
+    ) -> tuple[list[int], list[dict[str, Any]]]:
+        """
+        Evaluate points with successive halving.
+        All points are evaluated on the first 1/factor^2 of the timerange, the best 1/factor
+        of them on the first 1/factor of the timerange, and the best 1/factor of those
+        on the full timerange.
+        The optimizer is only told full timerange losses, as losses of shorter timeranges
+        aren't comparable. Points eliminated on a shorter timerange are told the worst
+        full timerange loss of the batch - they ranked below all points which got there.
+        :return: Indexes of the points evaluated on the full timerange, and their results
+        """
+        promoted = list(range(len(asked)))
+        f_val: list[dict[str, Any]] = []
+        for rung in reversed(range(HALVING_RUNGS)):
+            f_val = self.run_optimizer_parallel(
+                parallel, [asked[i] for i in promoted], 1 / self.halving_factor**rung
+            )
+            if rung > 0:
+                losses = dict(zip(promoted, (val["loss"] for val in f_val), strict=True))
+                promoted = sorted(promoted, key=lambda i: losses[i])
+                promoted = promoted[: ceil(len(promoted) / self.halving_factor)]
+        full_losses = dict(zip(promoted, (val["loss"] for val in f_val), strict=True))
+        worst_loss = max(full_losses.values())
+        self.opt.tell(asked, [full_losses.get(i, worst_loss) for i in range(len(asked))])
+        return promoted, f_val
+
+    def evaluate_points(
+        self, parallel: Parallel, n_points: int
+    ) -> tuple[list[dict[str, Any]], list[bool]]:
+        """
+        Ask the optimizer for new points, evaluate them and tell the optimizer the results.
+        :return: Results evaluated on the full timerange, and whether the points were random
+        """
+        if self.halving_factor > 1:
+            asked, is_random = self.get_asked_points(
+                n_points=n_points * self.halving_factor ** (HALVING_RUNGS - 1)
+            )
+            promoted, f_val = self.run_successive_halving(parallel, asked)
+            return f_val, [is_random[i] for i in promoted]
+
+        asked, is_random = self.get_asked_points(n_points=n_points)
+        f_val = self.run_optimizer_parallel(parallel, asked)
+        self.opt.tell(asked, [v["loss"] for v in f_val])
+        return f_val, is_random
 
     def _set_random_state(self, random_state: int | None) -> int:
         return random_state or random.randint(1, 2**16 - 1)  # noqa: S311
 
+    def _update_evaluated_points(self) -> None:
+        """
+        Add points told to the optimizer since the last call to self.evaluated_points.
+        Points are stored as tuples, so checking for evaluated points doesn't scan opt.Xi.
+        """
+        new_points = self.opt.Xi[self._evaluated_count :]
+        self.evaluated_points.update(tuple(x) for x in new_points)
+        self._evaluated_count += len(new_points)
+
     def get_asked_points(self, n_points: int) -> tuple[list[list[Any]], list[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
@@ -177,33 +260,26 @@ class Hyperopt:
         5. Repeat until at least `n_points` points in the `asked_non_tried` list
         6. Return a list with length truncated at `n_points`
         """
-
-        def unique_list(a_list):
-            new_list = []
-            for item in a_list:
-                if item not in new_list:
-                    new_list.append(item)
-            return new_list
-
+        self._update_evaluated_points()
         i = 0
         asked_non_tried: list[list[Any]] = []
         is_random_non_tried: list[bool] = []
+        # Points in asked_non_tried, as tuples
+        asked_points: set[tuple[Any, ...]] = set()
         while i < 5 and len(asked_non_tried) < n_points:
             if i < 3:
                 self.opt.cache_ = {}
-                asked = unique_list(self.opt.ask(n_points=n_points * 5 if i > 0 else n_points))
-                is_random = [False for _ in range(len(asked))]
+                asked = self.opt.ask(n_points=n_points * 5 if i > 0 else n_points)
+                is_random = False
             else:
-                asked = unique_list(self.opt.space.rvs(n_samples=n_points * 5))
-                is_random = [True for _ in range(len(asked))]
-            is_random_non_tried += [
-                rand
-                for x, rand in zip(asked, is_random, strict=False)
-                if x not in self.opt.Xi and x not in asked_non_tried
-            ]
-            asked_non_tried += [
-                x for x in asked if x not in self.opt.Xi and x not in asked_non_tried
-            ]
+                asked = self.opt.space.rvs(n_samples=n_points * 5)
+                is_random = True
+            for x in asked:
+                point = tuple(x)
+                if point not in self.evaluated_points and point not in asked_points:
+                    asked_points.add(point)
+                    asked_non_tried.append(x)
+                    is_random_non_tried.append(is_random)
             i += 1
 
         if asked_non_tried:
@@ -266,6 +342,11 @@ class Hyperopt:
             with Parallel(n_jobs=config_jobs) as parallel:
                 jobs = parallel._effective_n_jobs()
                 logger.info(f"Effective number of parallel workers used: {jobs}")
+                if self.halving_factor > 1:
+                    logger.info(
+                        "Using successive halving, evaluating "
+                        f"{self.halving_factor ** (HALVING_RUNGS - 1)} parameter sets per epoch."
+                    )
 
                 # Define progressbar
                 with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
@@ -290,9 +371,7 @@ class Hyperopt:
                         n_rest = (i + 1) * jobs - (self.total_epochs - start)
                         current_jobs = jobs - n_rest if n_rest > 0 else jobs
 
-                        asked, is_random = self.get_asked_points(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked)
-                        self.opt.tell(asked, [v["loss"] for v in f_val])
+                        f_val, is_random = self.evaluate_points(parallel, current_jobs)
 
                         for j, val in enumerate(f_val):
                             # Use human-friendly indexes here (starting from 1)
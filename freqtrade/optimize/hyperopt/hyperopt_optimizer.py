@@ -3,13 +3,16 @@ This module contains the hyperopt optimizer class, which needs to be pickled
 and will be sent to the hyperopt worker processes.
 """
 
+import hashlib
 import logging
 import sys
 import warnings
 from datetime import datetime, timezone
+from math import ceil
 from typing import Any
+from uuid import uuid4
 
-from joblib import dump, load
+import rapidjson
 from joblib.externals import cloudpickle
 from pandas import DataFrame
 
@@ -19,6 +22,7 @@ from freqtrade.data.history import get_timerange
 from freqtrade.data.metrics import calculate_market_change
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
+from freqtrade.exchange import timeframe_to_prev_date
 from freqtrade.ft_types import BacktestContentType
 from freqtrade.misc import deep_merge_dicts
 from freqtrade.optimize.backtesting import Backtesting
@@ -28,6 +32,7 @@ from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.shared_data import load_shared_dataframes, store_shared_dataframes
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
 from freqtrade.util.dry_run_wallet import get_dry_run_wallet
 
@@ -86,9 +91,13 @@ class HyperOptimizer:
         )
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
 
-        self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
+        self.shared_data_dir = (
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata"
         )
+        # Backtesting attributes (detail / futures data) loaded from shared_data_dir in workers
+        self.shared_backtest_data: list[str] = []
+        # Identifies the hyperopt data in signal keys
+        self.data_id = uuid4().hex
 
         self.market_change = 0.0
 
@@ -246,11 +255,16 @@ class HyperOptimizer:
                 # noinspection PyProtectedMember
                 attr.value = params_dict[attr_name]
 
-    def generate_optimizer(self, raw_params: list[Any]) -> dict[str, Any]:
+    def generate_optimizer(
+        self, raw_params: list[Any], timerange_fraction: float = 1.0
+    ) -> dict[str, Any]:
         """
         Used Optimize function.
         Called once per epoch to optimize whatever is configured.
         Keep this function as optimized as possible!
+        :param raw_params: Point to evaluate
+        :param timerange_fraction: Evaluate on this fraction of the timerange only,
+            starting at the beginning of the timerange (used by successive halving).
         """
         HyperoptStateContainer.set_state(HyperoptState.OPTIMIZE)
         backtest_start_time = datetime.now(timezone.utc)
@@ -302,14 +316,23 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
-            if self.analyze_per_epoch:
-                # Data is not yet analyzed, rerun populate_indicators.
-                processed = self.advise_and_trim(processed)
+        signal_key = self.get_signal_key(timerange_fraction)
+        processed = self.load_shared_data()
+        if self.analyze_per_epoch and not Backtesting.signals_cached(signal_key):
+            # Data is not yet analyzed, rerun populate_indicators.
+            processed = self.advise_and_trim(processed)
+
+        end_date = self.max_date
+        if timerange_fraction < 1:
+            # Aligned to a candle, so the slice ends on its last candle like a full backtest
+            end_date = timeframe_to_prev_date(
+                self.backtesting.timeframe,
+                self.min_date + (self.max_date - self.min_date) * timerange_fraction,
+            )
+            processed = {pair: df[df["date"] <= end_date] for pair, df in processed.items()}
 
         bt_results = self.backtesting.backtest(
-            processed=processed, start_date=self.min_date, end_date=self.max_date
+            processed=processed, start_date=self.min_date, end_date=end_date, signal_key=signal_key
         )
         backtest_end_time = datetime.now(timezone.utc)
         bt_results.update(
@@ -320,9 +343,38 @@ class HyperOptimizer:
         )
 
         return self._get_results_dict(
-            bt_results, self.min_date, self.max_date, params_dict, processed=processed
+            bt_results,
+            self.min_date,
+            end_date,
+            params_dict,
+            processed=processed,
+            timerange_fraction=timerange_fraction,
         )
 
+    def get_signal_key(self, timerange_fraction: float = 1.0) -> str:
+        """
+        Identify the entry / exit signals of an epoch.
+        Signals only change with buy / sell parameters - epochs with identical buy / sell
+        parameters (e.g. when optimizing roi / stoploss only) reuse the signals
+        of the prior epoch in the same worker process.
+        :param timerange_fraction: Fraction of the timerange which is evaluated
+        :return: hex string id.
+        """
+        params = {
+            name: param.value
+            for category in ("buy", "sell")
+            for name, param in self.backtesting.strategy.enumerate_parameters(category)
+        }
+        digest = hashlib.sha1()  # noqa: S324
+        digest.update(
+            rapidjson.dumps(
+                [self.data_id, timerange_fraction, params],
+                default=str,
+                number_mode=rapidjson.NM_NAN,
+            ).encode("utf-8")
+        )
+        return digest.hexdigest().lower()
+
     def _get_results_dict(
         self,
         backtesting_results: BacktestContentType,
@@ -330,6 +382,7 @@ class HyperOptimizer:
         max_date: datetime,
         params_dict: dict[str, Any],
         processed: dict[str, DataFrame],
+        timerange_fraction: float = 1.0,
     ) -> dict[str, Any]:
         params_details = self._get_params_details(params_dict)
 
@@ -356,8 +409,9 @@ class HyperOptimizer:
         # interesting -- consider it as 'bad' (assigned max. loss value)
         # in order to cast this hyperspace point away from optimization
         # path. We do not want to optimize 'hodl' strategies.
+        # Shorter timeranges (successive halving) require proportionally fewer trades.
         loss: float = MAX_LOSS
-        if trade_count >= self.config["hyperopt_min_trades"]:
+        if trade_count >= ceil(self.config["hyperopt_min_trades"] * timerange_fraction):
             loss = self.calculate_loss(
                 results=backtesting_results["results"],
                 trade_count=trade_count,
@@ -438,6 +492,27 @@ class HyperOptimizer:
                 f"({(self.max_date - self.min_date).days} days).."
             )
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            store_shared_dataframes(preprocessed, self.shared_data_dir / "data")
         else:
-            dump(data, self.data_pickle_file)
+            store_shared_dataframes(data, self.shared_data_dir / "data")
+
+        # Don't send detail / futures data with every epoch - workers load it memory-mapped.
+        self.shared_backtest_data = []
+        for name in ("detail_data", "futures_data"):
+            if getattr(self.backtesting, name):
+                store_shared_dataframes(
+                    getattr(self.backtesting, name), self.shared_data_dir / name
+                )
+                setattr(self.backtesting, name, {})
+                self.shared_backtest_data.append(name)
+
+    def load_shared_data(self) -> dict[str, DataFrame]:
+        """
+        Load the data stored by prepare_hyperopt_data().
+        Files are memory-mapped, so all worker processes share one copy of the candle data.
+        :return: Candle data (analyzed unless analyze_per_epoch is set)
+        """
+        for name in self.shared_backtest_data:
+            if not getattr(self.backtesting, name):
+                setattr(self.backtesting, name, load_shared_dataframes(self.shared_data_dir / name))
+        return load_shared_dataframes(self.shared_data_dir / "data")
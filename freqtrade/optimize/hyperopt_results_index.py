@@ -0,0 +1,188 @@
+"""
+SQLite index of hyperopt results files.
+Stores the metrics used to filter epochs as columns, and the position of every epoch in the
+results file - so filtering epochs and loading single epochs doesn't parse the whole file.
+"""
+
+import logging
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+import rapidjson
+
+from freqtrade.exceptions import OperationalException
+
+
+logger = logging.getLogger(__name__)
+
+
+# Metrics stored as columns - these are available to filters.
+INDEX_METRICS = (
+    "total_trades",
+    "profit_mean",
+    "profit_total",
+    "profit_total_abs",
+    "holding_avg_s",
+)
+
+CREATE_TABLE = (
+    "CREATE TABLE IF NOT EXISTS epochs ("
+    "epoch INTEGER PRIMARY KEY, offset INTEGER NOT NULL, length INTEGER NOT NULL, "
+    "loss REAL, is_best INTEGER, " + ", ".join(f"{m} REAL" for m in INDEX_METRICS) + ")"
+)
+
+
+def get_results_index_filename(results_file: Path) -> Path:
+    """Return the index filename for a hyperopt results file."""
+    return results_file.parent / f"{results_file.stem}.sqlite"
+
+
+def append_results_index(results_file: Path, epoch: dict[str, Any], offset: int) -> None:
+    """
+    Add an epoch to the index of a results file.
+    :param results_file: Results file the epoch was appended to
+    :param epoch: Epoch result dict
+    :param offset: Position of the epoch in the results file
+    """
+    length = results_file.stat().st_size - offset
+    metrics = epoch.get("results_metrics", {})
+    with closing(sqlite3.connect(get_results_index_filename(results_file))) as conn, conn:
+        conn.execute(CREATE_TABLE)
+        conn.execute(
+            f"INSERT INTO epochs (offset, length, loss, is_best, {', '.join(INDEX_METRICS)}) "
+            f"VALUES ({', '.join('?' * (len(INDEX_METRICS) + 4))})",
+            (
+                offset,
+                length,
+                epoch["loss"],
+                epoch["is_best"],
+                *(metrics.get(m) for m in INDEX_METRICS),
+            ),
+        )
+
+
+def _connect(results_file: Path) -> sqlite3.Connection | None:
+    """
+    Open the index of a results file.
+    :return: Connection, or None if there's no index, or it doesn't cover the whole file
+        (e.g. results files written by older versions).
+    """
+    index_file = get_results_index_filename(results_file)
+    if not index_file.is_file() or not results_file.is_file():
+        return None
+    conn = sqlite3.connect(index_file)
+    try:
+        (indexed_size,) = conn.execute("SELECT MAX(offset + length) FROM epochs").fetchone()
+    except sqlite3.Error:
+        indexed_size = None
+    if indexed_size != results_file.stat().st_size:
+        conn.close()
+        return None
+    return conn
+
+
+def _filter_conditions(conn: sqlite3.Connection, filteroptions: dict) -> tuple[str, list]:
+    """
+    Translate epoch filters (see hyperopt_filter_epochs) into a where clause.
+    :return: Where clause and its parameters
+    """
+    conditions = ["1"]
+    params: list[Any] = []
+
+    def add(condition: str, value: Any = None) -> None:
+        conditions.append(condition)
+        if value is not None:
+            params.append(value)
+
+    if filteroptions["only_best"]:
+        add("is_best")
+    if filteroptions["only_profitable"]:
+        add("COALESCE(profit_total, 0) > 0")
+    if filteroptions["filter_min_trades"] > 0:
+        add("COALESCE(total_trades, 0) > ?", filteroptions["filter_min_trades"])
+    if filteroptions["filter_max_trades"] > 0:
+        add("total_trades < ?", filteroptions["filter_max_trades"])
+
+    with_trades = "COALESCE(total_trades, 0) > 0"
+    for key, condition in (
+        ("filter_min_avg_time", "CAST(holding_avg_s / 60 AS INTEGER) > ?"),
+        ("filter_max_avg_time", "CAST(holding_avg_s / 60 AS INTEGER) < ?"),
+    ):
+        if filteroptions[key] is not None:
+            add(with_trades)
+            (missing,) = conn.execute(
+                f"SELECT COUNT(*) FROM epochs WHERE {' AND '.join(conditions)} "
+                "AND holding_avg_s IS NULL",
+                params,
+            ).fetchone()
+            if missing:
+                raise OperationalException(
+                    "Holding-average not available. Please omit the filter on average time, "
+                    "or rerun hyperopt with this version"
+                )
+            add(condition, filteroptions[key])
+
+    for key, condition in (
+        ("filter_min_avg_profit", "COALESCE(profit_mean, 0) * 100 > ?"),
+        ("filter_max_avg_profit", "COALESCE(profit_mean, 0) * 100 < ?"),
+        ("filter_min_total_profit", "COALESCE(profit_total_abs, 0) > ?"),
+        ("filter_max_total_profit", "COALESCE(profit_total_abs, 0) < ?"),
+        ("filter_min_objective", "loss < ?"),
+        ("filter_max_objective", "loss > ?"),
+    ):
+        if filteroptions[key] is not None:
+            add(with_trades)
+            add(condition, filteroptions[key])
+    return " AND ".join(conditions), params
+
+
+def _read_epochs(results_file: Path, positions: list[tuple[int, int]]) -> list[dict[str, Any]]:
+    """Read the epochs at the given positions (offset, length) from the results file."""
+    epochs = []
+    with results_file.open("rb") as f:
+        for offset, length in positions:
+            f.seek(offset)
+            epochs.append(rapidjson.loads(f.read(length)))
+    return epochs
+
+
+def load_indexed_results(
+    results_file: Path, filteroptions: dict, index: int | None = None
+) -> tuple[list[dict[str, Any]], int, int] | None:
+    """
+    Load filtered epochs using the index of the results file.
+    :param results_file: Hyperopt results file
+    :param filteroptions: Epoch filters, see hyperopt_filter_epochs
+    :param index: Only load the epoch at this index of the filtered epochs (starting at 1,
+        negative indexes count from the end). No epoch is loaded if it's out of range.
+    :return: Tuple of (epochs, number of filtered epochs, total number of epochs),
+        or None if the results file isn't indexed.
+    """
+    conn = _connect(results_file)
+    if conn is None:
+        return None
+    with closing(conn):
+        logger.info(f"Reading epochs from '{get_results_index_filename(results_file)}'")
+        (total_epochs,) = conn.execute("SELECT COUNT(*) FROM epochs").fetchone()
+        logger.info(f"Loaded {total_epochs} previous evaluations from disk.")
+        where, params = _filter_conditions(conn, filteroptions)
+        (filtered_epochs,) = conn.execute(
+            f"SELECT COUNT(*) FROM epochs WHERE {where}", params
+        ).fetchone()
+        logger.info(
+            f"{filtered_epochs} "
+            + ("best " if filteroptions["only_best"] else "")
+            + ("profitable " if filteroptions["only_profitable"] else "")
+            + "epochs found."
+        )
+
+        query = f"SELECT offset, length FROM epochs WHERE {where} ORDER BY epoch"
+        if index is not None:
+            if filtered_epochs == 0 or not -filtered_epochs <= index <= filtered_epochs:
+                return [], filtered_epochs, total_epochs
+            query += " LIMIT 1 OFFSET ?"
+            params.append(index - 1 if index > 0 else index % filtered_epochs)
+        positions = conn.execute(query, params).fetchall()
+    return _read_epochs(results_file, positions), filtered_epochs, total_epochs
@@ -14,6 +14,7 @@ from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import deep_merge_dicts, round_dict, safe_value_fallback2
 from freqtrade.optimize.hyperopt_epoch_filters import hyperopt_filter_epochs
+from freqtrade.optimize.hyperopt_results_index import load_indexed_results
 
 
 logger = logging.getLogger(__name__)
@@ -144,8 +145,8 @@ class HyperoptTools:
             return False
 
     @staticmethod
-    def load_filtered_results(results_file: Path, config: Config) -> tuple[list, int]:
-        filteroptions = {
+    def _get_filteroptions(config: Config) -> dict[str, Any]:
+        return {
             "only_best": config.get("hyperopt_list_best", False),
             "only_profitable": config.get("hyperopt_list_profitable", False),
             "filter_min_trades": config.get("hyperopt_list_min_trades", 0),
@@ -159,11 +160,19 @@ class HyperoptTools:
             "filter_min_objective": config.get("hyperopt_list_min_objective"),
             "filter_max_objective": config.get("hyperopt_list_max_objective"),
         }
+
+    @staticmethod
+    def load_filtered_results(results_file: Path, config: Config) -> tuple[list, int]:
+        filteroptions = HyperoptTools._get_filteroptions(config)
         if not HyperoptTools._test_hyperopt_results_exist(results_file):
             # No file found.
             logger.warning(f"Hyperopt file {results_file} not found.")
             return [], 0
 
+        indexed = load_indexed_results(results_file, filteroptions)
+        if indexed is not None:
+            return indexed[0], indexed[2]
+
         epochs = []
         total_epochs = 0
         for epochs_tmp in HyperoptTools._read_results(results_file):
@@ -182,6 +191,29 @@ class HyperoptTools:
 
         return epochs, total_epochs
 
+    @staticmethod
+    def load_filtered_epoch(
+        results_file: Path, config: Config, index: int
+    ) -> tuple[dict | None, int, int]:
+        """
+        Load a single epoch of the filtered epochs.
+        Reads only this epoch if the results file is indexed.
+        :param index: Human-readable index (starting at 1), negative indexes count from the end
+        :return: Tuple of (epoch or None if index is out of range, number of filtered epochs,
+            total number of epochs)
+        """
+        if HyperoptTools._test_hyperopt_results_exist(results_file):
+            filteroptions = HyperoptTools._get_filteroptions(config)
+            indexed = load_indexed_results(results_file, filteroptions, index)
+            if indexed is not None:
+                epochs, filtered_epochs, total_epochs = indexed
+                return (epochs[0] if epochs else None), filtered_epochs, total_epochs
+
+        epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+        if not epochs or not -len(epochs) <= index <= len(epochs):
+            return None, len(epochs), total_epochs
+        return epochs[index - 1 if index > 0 else index], len(epochs), total_epochs
+
     @staticmethod
     def show_epoch_details(
         results,
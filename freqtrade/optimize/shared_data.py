@@ -0,0 +1,65 @@
+"""
+Candle data shared by optimize worker processes through memory-mapped feather files
+"""
+
+import shutil
+from pathlib import Path
+
+import pyarrow as pa
+from pandas import DataFrame
+from pyarrow import feather
+
+from freqtrade.misc import file_dump_json, file_load_json
+
+
+PAIRS_FILE = "pairs.json"
+
+
+def _dataframe_to_table(dataframe: DataFrame) -> pa.Table:
+    """
+    Convert a dataframe to an arrow table, keeping NaN in float columns as values.
+    Arrow would convert them to nulls otherwise - which would require a copy when loading.
+    """
+    table = pa.Table.from_pandas(dataframe)
+    for i, name in enumerate(table.column_names):
+        if name in dataframe.columns and dataframe[name].dtype.kind == "f":
+            column = pa.array(dataframe[name].to_numpy(), from_pandas=False)
+            table = table.set_column(i, table.field(i), column)
+    return table
+
+
+def store_shared_dataframes(data: dict[str, DataFrame], directory: Path) -> None:
+    """
+    Store dataframes as uncompressed feather files with a single record batch each,
+    replacing prior content of the directory.
+    Loaded with load_shared_dataframes(), all worker processes share one copy of the data
+    through the page cache - instead of each worker loading its own copy.
+    :param data: Dict of pair: dataframe
+    :param directory: Directory to store the dataframes in
+    """
+    shutil.rmtree(directory, ignore_errors=True)
+    directory.mkdir(parents=True)
+    files = {}
+    for number, (pair, dataframe) in enumerate(data.items()):
+        files[pair] = f"{number}.feather"
+        feather.write_feather(
+            _dataframe_to_table(dataframe),
+            directory / files[pair],
+            compression="uncompressed",
+            chunksize=max(len(dataframe), 1),
+        )
+    file_dump_json(directory / PAIRS_FILE, files, log=False)
+
+
+def load_shared_dataframes(directory: Path) -> dict[str, DataFrame]:
+    """
+    Memory-map dataframes stored by store_shared_dataframes().
+    Numeric and date columns are not copied - they are read-only.
+    :param directory: Directory the dataframes were stored in
+    :return: Dict of pair: dataframe
+    """
+    files = file_load_json(directory / PAIRS_FILE)
+    return {
+        pair: feather.read_table(directory / file, memory_map=True).to_pandas(split_blocks=True)
+        for pair, file in files.items()
+    }
@@ -0,0 +1,125 @@
+"""
+Push Pair List provider
+
+Provides a pair whitelist which is replaced at runtime through the REST API
+"""
+
+import logging
+from typing import Any
+
+from freqtrade.exchange.exchange_types import Tickers
+from freqtrade.plugins.pairlist.IPairList import IPairList, PairlistParameter, SupportsBacktesting
+
+
+logger = logging.getLogger(__name__)
+
+
+class PushPairList(IPairList):
+    """
+    PairList plugin for whitelists pushed by an external process.
+    Starts with the configured pair_whitelist. A new list pushed via
+    `POST /api/v1/whitelist` is used from the next bot iteration on, without
+    reloading the bot - only pairs that were not traded before need to download
+    their startup candles.
+    Data pushed alongside the pairs (e.g. per-pair trade plans) is available to
+    the strategy through `self.dp.pushed_data()`.
+
+    Usage:
+        "pairlists": [
+            {
+                "method": "PushPairList",
+            }
+        ],
+    """
+
+    is_pairlist_generator = True
+    supports_backtesting = SupportsBacktesting.NO_ACTION
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._allow_inactive = self._pairlistconfig.get("allow_inactive", False)
+        self._pairs: list[str] = list(self._config["exchange"].get("pair_whitelist", []))
+        self._data: dict[str, Any] = {}
+
+    @property
+    def needstickers(self) -> bool:
+        """
+        Boolean property defining if tickers are necessary.
+        If no Pairlist requires tickers, an empty Dict is passed
+        as tickers argument to filter_pairlist
+        """
+        return False
+
+    @property
+    def pairs(self) -> list[str]:
+        """The pushed pairlist, as received (before validation)"""
+        return self._pairs
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """The data pushed with the last pairlist which contained data"""
+        return self._data
+
+    def short_desc(self) -> str:
+        """
+        Short whitelist method description - used for startup-messages
+        -> Please overwrite in subclasses
+        """
+        return f"{self.name} - {len(self._pairs)} pairs."
+
+    @staticmethod
+    def description() -> str:
+        return "Use a pairlist pushed through the REST API."
+
+    @staticmethod
+    def available_parameters() -> dict[str, PairlistParameter]:
+        return {
+            "allow_inactive": {
+                "type": "boolean",
+                "default": False,
+                "description": "Allow inactive pairs",
+                "help": "Allow inactive pairs to be in the whitelist.",
+            },
+        }
+
+    def push_pairs(
+        self, pairs: list[str], data: dict[str, Any] | None = None
+    ) -> tuple[list[str], list[str]]:
+        """
+        Replace the pushed pairlist.
+        :param pairs: New pairlist. Duplicates are removed, order is kept.
+        :param data: Optional data for the strategy. Replaces previously pushed data,
+            None keeps it.
+        :return: Tuple of (added pairs, removed pairs)
+        """
+        if data is not None:
+            self._data = data
+        pairs = list(dict.fromkeys(pairs))
+        added = [pair for pair in pairs if pair not in self._pairs]
+        removed = [pair for pair in self._pairs if pair not in pairs]
+        self._pairs = pairs
+        if added or removed:
+            logger.info(f"Received new pairlist. Added: {added}, removed: {removed}.")
+        return added, removed
+
+    def gen_pairlist(self, tickers: Tickers) -> list[str]:
+        """
+        Generate the pairlist
+        :param tickers: Tickers (from exchange.get_tickers). May be cached.
+        :return: List of pairs
+        """
+        wl = self.verify_whitelist(self._pairs, logger.info, keep_invalid=True)
+        if self._allow_inactive:
+            return wl
+        return self._whitelist_for_active_markets(wl)
+
+    def filter_pairlist(self, pairlist: list[str], tickers: Tickers) -> list[str]:
+        """
+        Filters and sorts pairlist and returns the whitelist again.
+        Called on each bot iteration - please use internal caching if necessary
+        :param pairlist: pairlist to filter or sort
+        :param tickers: Tickers (from exchange.get_tickers). May be cached.
+        :return: new whitelist
+        """
+        return list(dict.fromkeys(pairlist + self.gen_pairlist(tickers)))
@@ -432,6 +432,17 @@ class WhitelistResponse(BaseModel):
     method: list[str]
 
 
+class WhitelistPayload(BaseModel):
+    whitelist: list[str]
+    data: dict[str, Any] | None = None
+
+
+class WhitelistPushResponse(WhitelistResponse):
+    added: list[str]
+    removed: list[str]
+    errors: dict
+
+
 class WhitelistEvaluateResponse(BackgroundTaskResult):
     result: WhitelistResponse | None = None
 
@@ -524,6 +535,10 @@ class PairCandlesRequest(BaseModel):
     columns: list[str] | None = None
 
 
+class PairCandlesBatchRequest(BaseModel):
+    candles: list[PairCandlesRequest]
+
+
 class PairHistoryRequest(PairCandlesRequest, ExchangeModePayloadMixin):
     timerange: str
     strategy: str | None = None
@@ -554,6 +569,22 @@ class PairHistory(BaseModel):
     data_stop_ts: int
 
 
+class PairCandlesColumnar(BaseModel):
+    pair: str
+    timeframe: str
+    timeframe_ms: int
+    analyzed: bool
+    columns: list[str]
+    data: SerializeAsAny[dict[str, list[Any]]]
+    length: int
+    last_analyzed_ts: int
+
+
+class PairCandlesBatch(BaseModel):
+    strategy: str
+    candles: list[PairCandlesColumnar]
+
+
 class BacktestFreqAIInputs(BaseModel):
     identifier: str
 
@@ -37,6 +37,8 @@ from freqtrade.rpc.api_server.api_schemas import (
     MarketResponse,
     MixTag,
     OpenTradeSchema,
+    PairCandlesBatch,
+    PairCandlesBatchRequest,
     PairCandlesRequest,
     PairHistory,
     PerformanceEntry,
@@ -51,6 +53,8 @@ from freqtrade.rpc.api_server.api_schemas import (
     StrategyResponse,
     SysInfo,
     Version,
+    WhitelistPayload,
+    WhitelistPushResponse,
     WhitelistResponse,
 )
 from freqtrade.rpc.api_server.deps import get_config, get_exchange, get_rpc, get_rpc_optional
@@ -89,7 +93,10 @@ logger = logging.getLogger(__name__)
 # 2.40: Add hyperopt-loss endpoint
 # 2.41: Add download-data endpoint
 # 2.42: Add /pair_history endpoint with live data
-API_VERSION = 2.42
+# 2.43: Add POST /whitelist endpoint (PushPairList)
+# 2.44: Add POST /pair_candles/batch endpoint
+# 2.45: Add strategy data to POST /whitelist
+API_VERSION = 2.45
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -335,6 +342,12 @@ def whitelist(rpc: RPC = Depends(get_rpc)):
     return rpc._rpc_whitelist()
 
 
+@router.post("/whitelist", response_model=WhitelistPushResponse, tags=["info", "pairlist"])
+def whitelist_post(payload: WhitelistPayload, rpc: RPC = Depends(get_rpc)):
+    """Replace the pairs of the PushPairList - applied on the next bot iteration"""
+    return rpc._rpc_whitelist_push(payload.whitelist, payload.data)
+
+
 @router.get("/locks", response_model=Locks, tags=["info", "locks"])
 def locks(rpc: RPC = Depends(get_rpc)):
     return rpc._rpc_locks()
@@ -397,6 +410,12 @@ def pair_candles_filtered(payload: PairCandlesRequest, rpc: RPC = Depends(get_rp
     )
 
 
+@router.post("/pair_candles/batch", response_model=PairCandlesBatch, tags=["candle data"])
+def pair_candles_batch(payload: PairCandlesBatchRequest, rpc: RPC = Depends(get_rpc)):
+    # Multiple pair / timeframe combinations in one call, in column-major form
+    return rpc._rpc_analysed_dataframes_batch([c.model_dump() for c in payload.candles])
+
+
 @router.get("/plot_config", response_model=PlotConfig, tags=["candle data"])
 def plot_config(
     strategy: str | None = None,
@@ -11,8 +11,9 @@ from typing import TYPE_CHECKING, Any
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import inf, int64, isnan, mean, nan
+from numpy import flatnonzero, float64, inf, int64, isfinite, isnan, mean, nan
 from pandas import DataFrame, NaT
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
 from sqlalchemy import func, select
 
 from freqtrade import __version__
@@ -1280,6 +1281,35 @@ class RPC:
         }
         return res
 
+    def _rpc_whitelist_push(self, pairs: list[str], data: dict[str, Any] | None = None) -> dict:
+        """
+        Replaces the pairs (and optionally the strategy data) of the PushPairList handler.
+        The new whitelist becomes active with the next bot iteration, without a reload.
+        """
+        handler = next(
+            (h for h in self._freqtrade.pairlists._pairlist_handlers if h.name == "PushPairList"),
+            None,
+        )
+        if handler is None:
+            raise RPCException("PushPairList is not configured.")
+        markets = self._freqtrade.exchange.get_markets()
+        errors = {}
+        valid_pairs = []
+        for pair in pairs:
+            if pair in markets:
+                valid_pairs.append(pair)
+            else:
+                errors[pair] = {"error_msg": f"Pair {pair} is not available on the exchange."}
+        added, removed = handler.push_pairs(valid_pairs, data)
+        return {
+            "method": self._freqtrade.pairlists.name_list,
+            "length": len(handler.pairs),
+            "whitelist": handler.pairs,
+            "added": added,
+            "removed": removed,
+            "errors": errors,
+        }
+
     def _rpc_blacklist_delete(self, delete: list[str]) -> dict:
         """Removes pairs from currently active blacklist"""
         errors = {}
@@ -1433,6 +1463,66 @@ class RPC:
             self._freqtrade.config["strategy"], pair, timeframe, _data, last_analyzed, selected_cols
         )
 
+    def _rpc_analysed_dataframes_batch(self, candles: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Analyzed dataframes for multiple pair / timeframe combinations, in column-major form.
+        Falls back to the raw candles of the dataprovider for combinations the strategy
+        does not analyze (e.g. an informative timeframe).
+        :param candles: List of dicts with pair, timeframe, and optional limit and columns
+        """
+        results = []
+        for item in candles:
+            pair, timeframe = item["pair"], item["timeframe"]
+            dataframe, last_analyzed = self._freqtrade.dataprovider.get_analyzed_dataframe(
+                pair, timeframe
+            )
+            analyzed = len(dataframe) > 0
+            if not analyzed:
+                dataframe = self._freqtrade.dataprovider.ohlcv(pair, timeframe, copy=False)
+            if item.get("limit"):
+                dataframe = dataframe.iloc[-item["limit"] :]
+            if (selected_cols := item.get("columns")) is not None:
+                cols_set = set(DEFAULT_DATAFRAME_COLUMNS + selected_cols)
+                dataframe = dataframe.loc[:, [col for col in dataframe.columns if col in cols_set]]
+            results.append(
+                {
+                    "pair": pair,
+                    "timeframe": timeframe,
+                    "timeframe_ms": timeframe_to_msecs(timeframe),
+                    "analyzed": analyzed,
+                    "columns": list(dataframe.columns),
+                    "data": RPC._convert_dataframe_to_columns(dataframe),
+                    "length": len(dataframe),
+                    "last_analyzed_ts": int(last_analyzed.timestamp()),
+                }
+            )
+        return {"strategy": self._freqtrade.config["strategy"], "candles": results}
+
+    @staticmethod
+    def _convert_dataframe_to_columns(dataframe: DataFrame) -> dict[str, list[Any]]:
+        """
+        Convert a dataframe to column-major lists.
+        Datetime columns become epoch milliseconds, NaN / inf / NaT become None.
+        """
+        columns: dict[str, list[Any]] = {}
+        for col in dataframe.columns:
+            series = dataframe[col]
+            if is_datetime64_any_dtype(series.dtype):
+                mask = series.isna().to_numpy()
+                values = series.dt.as_unit("ms").array.asi8.tolist()
+            elif is_numeric_dtype(series.dtype) and not is_bool_dtype(series.dtype):
+                array = series.to_numpy(dtype=float64)
+                mask = ~isfinite(array)
+                values = series.tolist()
+            else:
+                mask = series.isna().to_numpy()
+                values = series.tolist()
+            if mask.any():
+                for idx in flatnonzero(mask):
+                    values[idx] = None
+            columns[col] = values
+        return columns
+
     def __rpc_analysed_dataframe_raw(
         self, pair: str, timeframe: str, limit: int | None
     ) -> tuple[DataFrame, datetime]:
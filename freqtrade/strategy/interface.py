@@ -5,9 +5,11 @@ This module defines the interface to apply for strategies
 
 import logging
 from abc import ABC, abstractmethod
+from copy import copy
 from datetime import datetime, timedelta, timezone
 from math import isinf, isnan
 
+from joblib import Parallel, delayed, wrap_non_picklable_objects
 from pandas import DataFrame
 
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
@@ -27,7 +29,7 @@ from freqtrade.enums import (
 )
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_next_date, timeframe_to_seconds
-from freqtrade.misc import remove_entry_exit_signals
+from freqtrade.misc import register_strategy_pickle_by_value, remove_entry_exit_signals
 from freqtrade.persistence import Order, PairLocks, Trade
 from freqtrade.strategy.hyper import HyperStrategyMixin
 from freqtrade.strategy.informative_decorator import (
@@ -103,6 +105,11 @@ class IStrategy(ABC, HyperStrategyMixin):
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = True
 
+    # "populate_indicators" only uses the dataframe of the pair it's called for
+    # (no dataprovider, no state shared between pairs).
+    # Allows backtesting / hyperopt to populate pairs in parallel (`indicator_jobs`).
+    pair_independent_indicators: bool = False
+
     use_exit_signal: bool
     exit_profit_only: bool
     exit_profit_offset: float
@@ -1681,11 +1688,54 @@ class IStrategy(ABC, HyperStrategyMixin):
         Has positive effects on memory usage for whatever reason - also when
         using only one strategy.
         """
+        jobs = self.config.get("indicator_jobs", 1)
+        if jobs != 1 and len(data) > 1 and self._can_advise_indicators_in_parallel():
+            return self._advise_all_indicators_parallel(data, jobs)
         return {
-            pair: self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
-            for pair, pair_data in data.items()
+            pair: self._advise_pair_indicators(pair_data, pair) for pair, pair_data in data.items()
         }
 
+    def _advise_pair_indicators(self, pair_data: DataFrame, pair: str) -> DataFrame:
+        return self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
+
+    def _can_advise_indicators_in_parallel(self) -> bool:
+        """
+        Pairs can only be populated in separate processes if the strategy declares
+        its indicators as pair independent - and nothing requires the dataprovider.
+        """
+        if not self.pair_independent_indicators:
+            return False
+        if self._ft_informative or self.config.get("exchange", {}).get("use_public_trades"):
+            logger.warning(
+                "Informative pairs and public trades require the dataprovider, "
+                "populating indicators sequentially."
+            )
+            return False
+        return True
+
+    def _advise_all_indicators_parallel(
+        self, data: dict[str, DataFrame], jobs: int
+    ) -> dict[str, DataFrame]:
+        """
+        Populate indicators for all pairs in worker processes.
+        joblib memory-maps the large candle arrays, so workers read them from shared memory.
+        Results are returned in the order of ``data`` - identical to the sequential run.
+        """
+        # The dataprovider and wallets hold the exchange, which can't be sent to workers.
+        strategy = copy(self)
+        strategy.dp = None  # type: ignore[assignment]
+        strategy.wallets = None
+        register_strategy_pickle_by_value(self.__class__.__bases__)
+        logger.info(f"Populating indicators for {len(data)} pairs in {jobs} worker processes.")
+        with Parallel(n_jobs=jobs) as parallel:
+            results = parallel(
+                delayed(wrap_non_picklable_objects(strategy._advise_pair_indicators))(
+                    pair_data, pair
+                )
+                for pair, pair_data in data.items()
+            )
+        return dict(zip(data.keys(), results, strict=True))
+
     def ft_advise_signals(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Call advise_entry and advise_exit and return the resulting dataframe.
@@ -334,6 +334,19 @@ class FtRestClient:
         """
         return self._get("whitelist")
 
+    def push_whitelist(self, pairs, data=None):
+        """Replace the whitelist of a bot using the PushPairList.
+        Takes effect on the bot's next iteration, without a reload.
+
+        :param pairs: List of pairs (example: ["BNB/BTC", "ETH/BTC"])
+        :param data: Optional dict of data for the strategy (``dp.pushed_data()``)
+        :return: json object
+        """
+        payload = {"whitelist": pairs}
+        if data is not None:
+            payload["data"] = data
+        return self._post("whitelist", data=payload)
+
     def blacklist(self, *args):
         """Show the current blacklist.
 
@@ -483,6 +496,16 @@ class FtRestClient:
 
         return self._get("pair_candles", params=params)
 
+    def pair_candles_batch(self, candles):
+        """Return live dataframes for multiple <pair><timeframe> combinations in one call.
+        Data is returned column-major (one list per column).
+
+        :param candles: List of dicts with "pair", "timeframe" and optionally
+            "limit" and "columns" (example: [{"pair": "BTC/USDT", "timeframe": "15m"}])
+        :return: json object
+        """
+        return self._post("pair_candles/batch", data={"candles": candles})
+
     def pair_history(self, pair, timeframe, strategy, timerange=None, freqaimodel=None):
         """Return historic, analyzed dataframe
 
@@ -91,6 +91,8 @@ def test_FtRestClient_call_invalid(caplog):
         ("delete_trade", [1], {}),
         ("cancel_open_order", [1], {}),
         ("whitelist", [], {}),
+        ("push_whitelist", [["XRP/USDT", "BTC/USDT"]], {}),
+        ("push_whitelist", [["XRP/USDT"], {"XRP/USDT": {"entry": 0.5}}], {}),
         ("blacklist", [], {}),
         ("blacklist", ["XRP/USDT"], {}),
         ("blacklist", ["XRP/USDT", "BTC/USDT"], {}),
@@ -127,6 +129,7 @@ def test_FtRestClient_call_invalid(caplog):
         ("pair_candles", ["XRP/USDT", "5m"], {}),
         ("pair_candles", ["XRP/USDT", "5m", 500], {}),
         ("pair_candles", ["XRP/USDT", "5m", 500], {"columns": ["close_time,close"]}),
+        ("pair_candles_batch", [[{"pair": "XRP/USDT", "timeframe": "5m", "limit": 500}]], {}),
         ("pair_history", ["XRP/USDT", "5m", "SampleStrategy"], {}),
         ("pair_history", ["XRP/USDT", "5m"], {"strategy": "SampleStrategy"}),
         ("trades", [], {"order_by_id": True}),
@@ -9,6 +9,26 @@ import random
 from collections import defaultdict
 import logging
 import asyncio
+import threading
+import functools
+import itertools
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import multiprocessing
+from pathlib import Path
+from typing import Callable, Iterator, Iterable
+from numpy.lib.stride_tricks import sliding_window_view
+try:
+    from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
+    from freqtrade.enums import CandleType
+    from freqtrade.util import PeriodicCache
+except ImportError:
+    get_datahandler = None
+    PeriodicCache = None
+try:
+    from scipy.signal import find_peaks
+except ImportError:
+    find_peaks = None
 EXCHANGE = 'binance'
 QUOTE_CURRENCY = 'USDT'
 TIMEFRAMES = ['4h', '1h', '15m', '5m']
@@ -32,6 +52,23 @@ WARHORSE_CANDIDATE_MIN_RANGE_POSITION = 0.85
 WARHORSE_CANDIDATE_MAX_24H_CHANGE = 40.0
 MAX_PRE_BREAKOUT_DEVIATION_PERCENT = 4.0
 ETH_SYMBOL = 'ETH/USDT'
+SCAN_TIMEFRAMES = ['1w', '1d', '4h', '1h', '15m', '5m']
+SCAN_GATE_TIMEFRAMES = ['4h', '1h', '15m', '5m']
+SCAN_LAZY_TIMEFRAMES = ['1w', '1d']
+# calculate_indicators drops the rows without an ema_200 - and returns None for shorter frames.
+LAZY_INDICATOR_MIN_CANDLES = 200
+OHLCV_FETCH_LIMIT = 300
+FETCH_MAX_CONCURRENCY = 8
+FETCH_MIN_REQUEST_INTERVAL_MS = 60
+FETCH_MAX_RETRIES = 3
+FETCH_RATE_LIMIT_BACKOFF_SECONDS = 5.0
+CANDLE_CACHE_ENABLED = True
+CANDLE_CACHE_DIR = 'user_data/data/scanner_cache'
+CANDLE_CACHE_DATA_FORMAT = 'feather'
+CANDLE_CACHE_MAX_CANDLES = 1000
+SCAN_INDICATOR_BATCH_SIZE = 25
+SCAN_CONTEXT_TTL_SECONDS = 3600
+SCORING_WORKERS = 0
 warnings.filterwarnings('ignore', category=RuntimeWarning)
 
 def initialize_exchange(exchange_id: str) -> Optional[ccxt.Exchange]:
@@ -190,19 +227,79 @@ def get_altcoin_market_snapshot(tickers: Dict[str, Any]) -> Dict[str, Any]:
     snapshot['verdict'] = verdict
     return snapshot
 
-def get_all_usdt_pairs(exchange: ccxt.Exchange) -> Tuple[List[str], Dict[str, Any], Dict[str, Any]]:
+class ScanContext:
+    """Cycle-scoped market snapshot shared by every scanner entry point.
+Holds the exchange instance (with its loaded markets), the `fetch_tickers` snapshot,
+the market context and the BTC 4h/1h reference frames. Entries live in a
+`PeriodicCache`, so they all expire together at the next candle close (every full
+hour with the default TTL) - `run_scan`, `analyze_specific_pairs` and
+`analyze_open_trades` called within one automation cycle share one set of downloads.
+Failed loads are not cached. Without freqtrade installed, nothing is cached."""
+
+    def __init__(self, exchange_id: str, ttl: int=SCAN_CONTEXT_TTL_SECONDS):
+        self.exchange_id = exchange_id
+        self.ttl = ttl
+        self._cache = PeriodicCache(maxsize=16, ttl=ttl) if PeriodicCache is not None else None
+        self._lock = threading.RLock()
+
+    def _get(self, key: str, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            value = self._cache.get(key) if self._cache is not None else None
+            if value is not None:
+                return value
+            value = loader()
+            if self._cache is not None and value is not None:
+                self._cache[key] = value
+            return value
+
+    def get_exchange(self) -> Optional[ccxt.Exchange]:
+        return self._get('exchange', lambda: initialize_exchange(self.exchange_id))
+
+    def get_tickers(self) -> Dict[str, Any]:
+        return self._get('tickers', lambda: self.get_exchange().fetch_tickers())
+
+    def get_market_context(self) -> Dict[str, Any]:
+        return self._get('market_context', lambda: analyze_market_context(self.get_exchange()))
+
+    def get_btc_frames(self) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+        """BTC 4h/1h reference frames for the relative-strength analysis, (None, None) on failure."""
+
+        def load() -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+            exchange = self.get_exchange()
+            btc_data_4h = fetch_ohlcv_data(exchange, BTC_SYMBOL, '4h', 300)
+            btc_data_1h = fetch_ohlcv_data(exchange, BTC_SYMBOL, '1h', 300)
+            if btc_data_4h is None or btc_data_1h is None:
+                return None
+            return (btc_data_4h, btc_data_1h)
+        return self._get('btc_frames', load) or (None, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._cache is not None:
+                self._cache.clear()
+_scan_context: Optional[ScanContext] = None
+
+def get_scan_context() -> ScanContext:
+    """Return the process-wide `ScanContext` for `EXCHANGE`."""
+    global _scan_context
+    if _scan_context is None or _scan_context.exchange_id != EXCHANGE:
+        _scan_context = ScanContext(EXCHANGE)
+    return _scan_context
+
+def get_all_usdt_pairs(exchange: ccxt.Exchange, context: Optional[ScanContext]=None) -> Tuple[List[str], Dict[str, Any], Dict[str, Any]]:
     """v2.7 - Use static Top CoinMarketCap list.
 - UPDATE:
   - Completely remove logic for calculating top 15 by volume.
   - Replaced with a predefined list of top coins (TOP_CMC_COINS).
-  - This ensures the bot is always monitoring a stable group of "blue-chip" coins."""
-    market_context = analyze_market_context(exchange)
+  - This ensures the bot is always monitoring a stable group of "blue-chip" coins.
+- With a `ScanContext`, market context and tickers come from the shared cycle snapshot."""
+    market_context = context.get_market_context() if context else analyze_market_context(exchange)
     base_threshold = market_context['btc_context']['filter_threshold']
     all_pairs_for_scan = []
     bypass_count = 0
     try:
         print('Đang tải dữ liệu ticker từ sàn...')
-        tickers = exchange.fetch_tickers()
+        tickers = context.get_tickers() if context else exchange.fetch_tickers()
         print('Tải dữ liệu ticker hoàn tất.')
         top_15_cmc_pairs = [f'{coin}/{QUOTE_CURRENCY}' for coin in TOP_CMC_COINS]
         print(f'  -> [THÀNH CÔNG] Đã xác định danh sách theo dõi Top CoinMarketCap: {', '.join(top_15_cmc_pairs)}')
@@ -247,17 +344,242 @@ def get_all_usdt_pairs(exchange: ccxt.Exchange) -> Tuple[List[str], Dict[str, An
         empty_context = {'btc_context': {}, 'eth_context': {}}
         return ([], {'market_context': empty_context, 'total_pairs_in_universe': 0, 'altcoin_snapshot': {}, 'tickers': {}, 'top_15_by_volume': []}, {})
 
+def _ohlcv_to_dataframe(ohlcv: List[List[Any]]) -> pd.DataFrame:
+    df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    return df.set_index('timestamp')
+
 def fetch_ohlcv_data(exchange: ccxt.Exchange, pair: str, timeframe: str, limit: int=300) -> Optional[pd.DataFrame]:
     try:
         if not exchange.has['fetchOHLCV']:
             return None
         ohlcv = exchange.fetch_ohlcv(pair, timeframe, limit=limit)
-        df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        return df.set_index('timestamp')
+        return _ohlcv_to_dataframe(ohlcv)
     except Exception:
         return None
 
+class RequestThrottle:
+    """Thread-safe request pacing shared by all fetch workers.
+Each call to `wait` reserves the next free time slot, so N concurrent workers together
+never send more than one request per `min_interval` seconds. `penalize` pushes the
+next free slot back after the exchange answered with a rate-limit error (HTTP 429/418)."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def penalize(self, seconds: float) -> None:
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+def create_request_throttle(exchange: ccxt.Exchange) -> RequestThrottle:
+    """Build a throttle that respects both our own floor and the exchange's declared `rateLimit`."""
+    interval_ms = max(FETCH_MIN_REQUEST_INTERVAL_MS, getattr(exchange, 'rateLimit', 0) or 0)
+    return RequestThrottle(interval_ms / 1000)
+
+class CandleCache:
+    """Persistent per-(pair, timeframe) candle store v1.0 - Incremental downloads.
+
+Candles are stored on disk through freqtrade's `IDataHandler` (feather by default), so the
+files can also be inspected with `freqtrade list-data --datadir <CANDLE_CACHE_DIR>`.
+Every cycle only the candles newer than the last stored timestamp are requested (the last
+stored candle is requested again, as it was most likely still open when it was saved).
+A full `limit` download only happens for new pairs or when the cache is too old to be extended."""
+
+    def __init__(self, datadir: Path, data_format: str=CANDLE_CACHE_DATA_FORMAT, max_candles: int=CANDLE_CACHE_MAX_CANDLES):
+        self.datadir = Path(datadir)
+        self.max_candles = max_candles
+        self._handler: IDataHandler = get_datahandler(self.datadir, data_format)
+
+    def load(self, pair: str, timeframe: str) -> pd.DataFrame:
+        data = self._handler.ohlcv_load(pair, timeframe, CandleType.SPOT, fill_missing=False, warn_no_data=False)
+        if data.empty:
+            return _ohlcv_to_dataframe([])
+        data = data.rename(columns={'date': 'timestamp'})
+        data['timestamp'] = data['timestamp'].dt.tz_convert(None)
+        return data.set_index('timestamp')
+
+    def store(self, pair: str, timeframe: str, df: pd.DataFrame) -> None:
+        data = df[['open', 'high', 'low', 'close', 'volume']].tail(self.max_candles).reset_index()
+        data = data.rename(columns={'timestamp': 'date'})
+        data['date'] = data['date'].dt.tz_localize('UTC')
+        self._handler.ohlcv_store(pair, timeframe, data, CandleType.SPOT)
+
+    def plan_request(self, pair: str, timeframe: str, limit: int) -> Tuple[pd.DataFrame, Optional[int], int]:
+        """Return `(cached_frame, since_ms, request_limit)` for the next exchange request.
+Whether to extend the cache only depends on the age of the last cached candle - a cache
+shorter than `limit` holds the complete history of a young pair (the exchange returned fewer
+than `limit` candles), so it is extended like any other cache."""
+        cached = self.load(pair, timeframe)
+        if cached.empty:
+            return (cached, None, limit)
+        timeframe_ms = ccxt.Exchange.parse_timeframe(timeframe) * 1000
+        last_ms = int(cached.index[-1].value // 1000000)
+        missing_candles = int((time.time() * 1000 - last_ms) // timeframe_ms) + 1
+        if missing_candles + 1 >= limit:
+            return (cached, None, limit)
+        return (cached, last_ms, missing_candles + 1)
+
+    def update(self, pair: str, timeframe: str, cached: pd.DataFrame, new_data: pd.DataFrame, limit: int) -> pd.DataFrame:
+        """Merge freshly downloaded candles into the cached frame, persist it and return the last `limit` candles."""
+        if cached.empty:
+            merged = new_data
+        elif new_data.empty:
+            merged = cached
+        else:
+            merged = pd.concat([cached, new_data])
+            merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+        if not merged.empty:
+            try:
+                self.store(pair, timeframe, merged)
+            except Exception as e:
+                print(f'Cảnh báo: Không thể lưu bộ nhớ đệm nến {pair} {timeframe}: {e}')
+        return merged.tail(limit).copy()
+_candle_cache: Optional[CandleCache] = None
+
+def get_candle_cache() -> Optional[CandleCache]:
+    """Return the shared `CandleCache`, or None if it is disabled or freqtrade is not installed."""
+    global _candle_cache
+    if not CANDLE_CACHE_ENABLED or get_datahandler is None:
+        return None
+    if _candle_cache is None or _candle_cache.datadir != Path(CANDLE_CACHE_DIR):
+        _candle_cache = CandleCache(Path(CANDLE_CACHE_DIR))
+    return _candle_cache
+
+def fetch_ohlcv_throttled(exchange: ccxt.Exchange, pair: str, timeframe: str, limit: int, throttle: RequestThrottle, cache: Optional[CandleCache]=None) -> Optional[pd.DataFrame]:
+    """Variant of `fetch_ohlcv_data` for the concurrent engine.
+- Waits for a free slot from the shared throttle before every request.
+- On rate-limit errors it backs off (for all workers) and retries, instead of silently
+  dropping the pair like the sequential helper does.
+- With a `CandleCache`, only candles newer than the cached data are downloaded."""
+    if not exchange.has['fetchOHLCV']:
+        return None
+    cached, since, request_limit = (None, None, limit)
+    if cache is not None:
+        try:
+            cached, since, request_limit = cache.plan_request(pair, timeframe, limit)
+        except Exception:
+            cache = None
+    for attempt in range(FETCH_MAX_RETRIES + 1):
+        throttle.wait()
+        try:
+            ohlcv = exchange.fetch_ohlcv(pair, timeframe, since=since, limit=request_limit)
+            df = _ohlcv_to_dataframe(ohlcv)
+            if cache is not None:
+                return cache.update(pair, timeframe, cached, df, limit)
+            return df
+        except (ccxt.DDoSProtection, ccxt.RateLimitExceeded):
+            throttle.penalize(FETCH_RATE_LIMIT_BACKOFF_SECONDS * (attempt + 1))
+        except ccxt.NetworkError:
+            continue
+        except Exception:
+            return None
+    return None
+
+def fetch_ohlcv_concurrently(exchange: ccxt.Exchange, pairs: List[str], timeframes: List[str], limit: int=OHLCV_FETCH_LIMIT, max_concurrency: int=FETCH_MAX_CONCURRENCY, use_cache: bool=True, throttle: Optional[RequestThrottle]=None) -> Iterator[Tuple[str, Dict[str, Optional[pd.DataFrame]]]]:
+    """Concurrent OHLCV fetch engine v1.0.
+
+Schedules every (pair, timeframe) request on a bounded thread pool. All workers share
+one `RequestThrottle`, so the concurrency limit only hides network latency and never
+exceeds the exchange rate limit.
+Yields `(pair, {timeframe: DataFrame | None})` as soon as ALL timeframes of a pair have
+arrived, so the scoring stage can start while the rest of the universe is still downloading.
+Requests are submitted pair by pair, therefore pairs complete roughly in input order.
+With `use_cache`, requests go through the shared `CandleCache` and only download new candles.
+Pass `throttle` to share the request budget with other fetchers (e.g. `create_timeframe_loader`)."""
+    if not pairs or not timeframes:
+        return
+    throttle = throttle or create_request_throttle(exchange)
+    cache = get_candle_cache() if use_cache else None
+    remaining = {pair: len(timeframes) for pair in pairs}
+    frames: Dict[str, Dict[str, Optional[pd.DataFrame]]] = defaultdict(dict)
+    executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix='ohlcv_fetch')
+    try:
+        futures = {executor.submit(fetch_ohlcv_throttled, exchange, pair, timeframe, limit, throttle, cache): (pair, timeframe) for pair in pairs for timeframe in timeframes}
+        for future in as_completed(futures):
+            pair, timeframe = futures[future]
+            frames[pair][timeframe] = future.result()
+            remaining[pair] -= 1
+            if remaining[pair] == 0:
+                yield (pair, frames.pop(pair))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+class LazyTimeframe:
+    """Lazy, memoized indicator frame for one pair/timeframe.
+Indicators are not computed until the scorer touches the frame for the first time
+(any attribute, column or `len`). The result is kept, so later accesses are free.
+A loader returning None resolves to an empty DataFrame.
+Passes `isinstance(frame, pd.DataFrame)` checks like the frame it stands in for.
+Pickling keeps an unresolved frame unresolved (the loader is sent instead of the result),
+so the indicators are computed by whichever process reads the frame."""
+
+    def __init__(self, loader: Callable[[], Optional[pd.DataFrame]]):
+        self._loader = loader
+        self._frame: Optional[pd.DataFrame] = None
+        self._lock = threading.Lock()
+
+    @property
+    def __class__(self) -> type:
+        return pd.DataFrame
+
+    @property
+    def resolved(self) -> bool:
+        return self._frame is not None
+
+    def resolve(self) -> pd.DataFrame:
+        with self._lock:
+            if self._frame is None:
+                frame = self._loader()
+                self._frame = frame if frame is not None else pd.DataFrame()
+                self._loader = None
+        return self._frame
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Explicit, as pickle would otherwise rebuild the object as `__class__`
+        with self._lock:
+            return (LazyTimeframe, (self._loader,), {'_frame': self._frame})
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._frame = state['_frame']
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__') or name in ('_loader', '_frame', '_lock'):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.resolve()[key]
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.resolve()
+
+TimeframeLoader = Callable[[List[str], List[str]], Dict[str, Dict[str, Optional[pd.DataFrame]]]]
+
+def create_timeframe_loader(exchange: ccxt.Exchange, throttle: RequestThrottle, use_cache: bool=True) -> TimeframeLoader:
+    """Build `load(pairs, timeframes) -> {pair: {timeframe: DataFrame | None}}` for the 1w/1d frames.
+All pairs of a call are fetched at once through `fetch_ohlcv_concurrently`, sharing the scan's
+throttle and candle cache."""
+
+    def load(pairs: List[str], timeframes: List[str]) -> Dict[str, Dict[str, Optional[pd.DataFrame]]]:
+        return dict(fetch_ohlcv_concurrently(exchange, pairs, timeframes, use_cache=use_cache, throttle=throttle))
+    return load
+
 def add_relative_strength_data(df: pd.DataFrame, btc_df: pd.DataFrame) -> Optional[pd.DataFrame]:
     if df is None:
         return None
@@ -310,7 +632,7 @@ def calculate_indicators(df: pd.DataFrame) -> Optional[pd.DataFrame]:
     df['bb_middle'] = bollinger['middleband']
     df['bb_lower'] = bollinger['lowerband']
     df['bb_width'] = np.where(df['bb_middle'] > 0, (df['bb_upper'] - df['bb_lower']) / df['bb_middle'], 0)
-    df['bbw_percentile'] = df['bb_width'].rolling(100).apply(lambda x: pd.Series(x).rank(pct=True).iloc[-1], raw=False) * 100
+    df['bbw_percentile'] = rolling_percentile_rank(df['bb_width'].to_numpy(dtype='float64')[np.newaxis, :], 100)[0] * 100
     df['rsi'] = ta.RSI(df, timeperiod=14)
     df['rsi_21'] = ta.RSI(df, timeperiod=21)
     df['cdl_shootingstar'] = ta.CDLSHOOTINGSTAR(df)
@@ -332,6 +654,106 @@ def calculate_indicators(df: pd.DataFrame) -> Optional[pd.DataFrame]:
         return None
     return df
 
+def rolling_percentile_rank(panel: np.ndarray, window: int) -> np.ndarray:
+    """Vectorized rolling percentile rank of the LAST value of each window, row by row.
+Bit-identical to `series.rolling(window).apply(lambda x: pd.Series(x).rank(pct=True).iloc[-1])`:
+average rank for ties, NaN while the window is incomplete or contains NaN.
+`panel` has the shape (pairs, candles)."""
+    out = np.full(panel.shape, np.nan)
+    if panel.shape[1] < window:
+        return out
+    windows = sliding_window_view(panel, window, axis=1)
+    last = windows[..., -1:]
+    rank = (windows < last).sum(axis=-1) + ((windows == last).sum(axis=-1) + 1) / 2
+    valid = ~np.isnan(windows).any(axis=-1)
+    out[:, window - 1:] = np.where(valid, rank / window, np.nan)
+    return out
+
+def rolling_max(panel: np.ndarray, window: int) -> np.ndarray:
+    """Row-wise equivalent of `rolling(window).max()` for a (pairs, candles) panel."""
+    out = np.full(panel.shape, np.nan)
+    if panel.shape[1] >= window:
+        out[:, window - 1:] = sliding_window_view(panel, window, axis=1).max(axis=-1)
+    return out
+
+def rolling_min(panel: np.ndarray, window: int) -> np.ndarray:
+    """Row-wise equivalent of `rolling(window).min()` for a (pairs, candles) panel."""
+    out = np.full(panel.shape, np.nan)
+    if panel.shape[1] >= window:
+        out[:, window - 1:] = sliding_window_view(panel, window, axis=1).min(axis=-1)
+    return out
+
+def shift_panel(panel: np.ndarray, periods: int) -> np.ndarray:
+    """Row-wise equivalent of `Series.shift(periods)` for a float (pairs, candles) panel."""
+    out = np.full(panel.shape, np.nan)
+    if periods > 0:
+        out[:, periods:] = panel[:, :-periods]
+    elif periods < 0:
+        out[:, :periods] = panel[:, -periods:]
+    else:
+        out[:] = panel
+    return out
+
+def _calculate_talib_columns(df: pd.DataFrame) -> Dict[str, Any]:
+    """TA-Lib part of `calculate_indicators` for one pair (TA-Lib only works on 1-D series)."""
+    bollinger = ta.BBANDS(df, timeperiod=20, nbdevup=2.0, nbdevdn=2.0)
+    stoch = ta.STOCH(df, fastk_period=14, slowk_period=3, slowk_matype=0, slowd_period=3, slowd_matype=0)
+    return {'atr': ta.ATR(df, timeperiod=14), 'vol_ma_20': ta.SMA(df['volume'], timeperiod=20), 'ema_7': ta.EMA(df['close'], timeperiod=7), 'ema_8': ta.EMA(df['close'], timeperiod=8), 'ema_9': ta.EMA(df['close'], timeperiod=9), 'ema_21': ta.EMA(df, timeperiod=21), 'ema_50': ta.EMA(df, timeperiod=50), 'ema_200': ta.EMA(df, timeperiod=200), 'adx': ta.ADX(df, timeperiod=14), 'plus_di': ta.PLUS_DI(df, timeperiod=14), 'minus_di': ta.MINUS_DI(df, timeperiod=14), 'bb_upper': bollinger['upperband'], 'bb_middle': bollinger['middleband'], 'bb_lower': bollinger['lowerband'], 'rsi': ta.RSI(df, timeperiod=14), 'rsi_21': ta.RSI(df, timeperiod=21), 'cdl_shootingstar': ta.CDLSHOOTINGSTAR(df), 'cdl_hangingman': ta.CDLHANGINGMAN(df), 'cdl_engulfing': ta.CDLENGULFING(df), 'ma_trend': ta.EMA(df, timeperiod=27), 'cdl_hammer': ta.CDLHAMMER(df), 'cdl_doji': ta.CDLDOJI(df), 'cdl_piercing': ta.CDLPIERCING(df), 'slowk': stoch['slowk'], 'slowd': stoch['slowd']}
+
+def _calculate_panel_indicators(keys: List[str], frames: Dict[str, pd.DataFrame]) -> Dict[str, Optional[pd.DataFrame]]:
+    """Compute all indicators for frames of equal length, stacked as a (pairs, candles) panel."""
+    tenkan_period, kijun_period, senkou_b_period, displacement = (9, 26, 52, 26)
+    talib_columns = {key: _calculate_talib_columns(frames[key]) for key in keys}
+    high = np.vstack([frames[key]['high'].to_numpy(dtype='float64') for key in keys])
+    low = np.vstack([frames[key]['low'].to_numpy(dtype='float64') for key in keys])
+    close = np.vstack([frames[key]['close'].to_numpy(dtype='float64') for key in keys])
+    open_ = np.vstack([frames[key]['open'].to_numpy(dtype='float64') for key in keys])
+    bb_upper = np.vstack([talib_columns[key]['bb_upper'].to_numpy(dtype='float64') for key in keys])
+    bb_middle = np.vstack([talib_columns[key]['bb_middle'].to_numpy(dtype='float64') for key in keys])
+    bb_lower = np.vstack([talib_columns[key]['bb_lower'].to_numpy(dtype='float64') for key in keys])
+    ma_trend = np.vstack([talib_columns[key]['ma_trend'].to_numpy(dtype='float64') for key in keys])
+    tenkan_sen = (rolling_max(high, tenkan_period) + rolling_min(low, tenkan_period)) / 2
+    kijun_sen = (rolling_max(high, kijun_period) + rolling_min(low, kijun_period)) / 2
+    senkou_a = shift_panel((tenkan_sen + kijun_sen) / 2, displacement - 1)
+    senkou_b = shift_panel((rolling_max(high, senkou_b_period) + rolling_min(low, senkou_b_period)) / 2, displacement - 1)
+    chikou_span = shift_panel(close, -(displacement - 1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        bb_width = np.where(bb_middle > 0, (bb_upper - bb_lower) / bb_middle, 0)
+    bbw_percentile = rolling_percentile_rank(bb_width, 100) * 100
+    ma_trend_rising = ma_trend > shift_panel(ma_trend, 1)
+    body_size = np.abs(close - open_)
+    body_size_ma = pd.DataFrame(body_size.T).rolling(window=20).mean().to_numpy().T
+    local_high_20 = shift_panel(rolling_max(high, 20), 1)
+    results = {}
+    for row, key in enumerate(keys):
+        df = frames[key]
+        ta_cols = talib_columns[key]
+        columns = {'atr': ta_cols['atr'], 'vol_ma_20': ta_cols['vol_ma_20'], 'ema_7': ta_cols['ema_7'], 'ema_8': ta_cols['ema_8'], 'ema_9': ta_cols['ema_9'], 'ema_21': ta_cols['ema_21'], 'ema_50': ta_cols['ema_50'], 'ema_200': ta_cols['ema_200'], 'tenkan_sen': tenkan_sen[row], 'kijun_sen': kijun_sen[row], 'senkou_a': senkou_a[row], 'senkou_b': senkou_b[row], 'chikou_span': chikou_span[row], 'adx': ta_cols['adx'], 'plus_di': ta_cols['plus_di'], 'minus_di': ta_cols['minus_di'], 'bb_upper': ta_cols['bb_upper'], 'bb_middle': ta_cols['bb_middle'], 'bb_lower': ta_cols['bb_lower'], 'bb_width': bb_width[row], 'bbw_percentile': bbw_percentile[row], 'rsi': ta_cols['rsi'], 'rsi_21': ta_cols['rsi_21'], 'cdl_shootingstar': ta_cols['cdl_shootingstar'], 'cdl_hangingman': ta_cols['cdl_hangingman'], 'cdl_engulfing': ta_cols['cdl_engulfing'], 'ma_trend': ta_cols['ma_trend'], 'ma_trend_rising': ma_trend_rising[row], 'body_size': body_size[row], 'body_size_ma': body_size_ma[row], 'local_high_20': local_high_20[row], 'cdl_hammer': ta_cols['cdl_hammer'], 'cdl_doji': ta_cols['cdl_doji'], 'cdl_piercing': ta_cols['cdl_piercing'], 'slowk': ta_cols['slowk'], 'slowd': ta_cols['slowd']}
+        if df.columns.intersection(list(columns)).empty:
+            result = pd.concat([df, pd.DataFrame(columns, index=df.index)], axis=1)
+        else:
+            result = df.assign(**columns)
+        result.dropna(subset=['atr', 'vol_ma_20', 'ema_200', 'tenkan_sen', 'kijun_sen', 'adx', 'bb_middle', 'rsi', 'slowk', 'slowd'], inplace=True)
+        results[key] = None if result.empty else result
+    return results
+
+def calculate_indicators_batch(frames: Dict[str, Optional[pd.DataFrame]]) -> Dict[str, Optional[pd.DataFrame]]:
+    """Batched indicator engine v1.0 - Same output as `calculate_indicators`, many pairs at once.
+
+Frames of equal length are stacked into a (pairs, candles) NumPy panel, so the rolling
+windows (Ichimoku lines, local highs, BB-width percentile) are computed for all pairs
+in one vectorized pass. TA-Lib indicators are still computed per pair.
+Input frames are not modified. Returns `{key: DataFrame | None}` for every input key,
+None where `calculate_indicators` would return None."""
+    results: Dict[str, Optional[pd.DataFrame]] = {key: None for key in frames}
+    groups: Dict[int, List[str]] = defaultdict(list)
+    for key, df in frames.items():
+        if df is not None and len(df) >= 100:
+            groups[len(df)].append(key)
+    for keys in groups.values():
+        results.update(_calculate_panel_indicators(keys, frames))
+    return results
+
 def _calculate_btc_volatility(df: pd.DataFrame, atr_period: int=14, atr_ma_period: int=50) -> Dict[str, Any]:
     """Volatility analysis based on ATR.
 Compare the short-term ATR with the long-term average ATR to determine
@@ -831,95 +1253,176 @@ def calculate_success_probability(*args, **kwargs):
     '[PROPRIETARY LOGIC HIDDEN]\n---------------------------------------------------------\nThis function contains advanced algorithmic logic for:\n- Pattern Recognition & Signal Processing\n- Dynamic Risk Management (DEFCON System)\n- Automated Trade Execution\n\nThe implementation details and specific parameters have been\nremoved to protect Intellectual Property (IP).\n---------------------------------------------------------'
     pass
 
-def run_scan() -> Dict[str, Any]:
-    print('--- Bắt đầu phiên quét mới ---')
-    exchange = initialize_exchange(EXCHANGE)
-    if not exchange:
-        return {'recommendations': [], 'summary': {}}
-    pairs, scan_summary, tickers = get_all_usdt_pairs(exchange)
+def _iter_batches(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _passes_gate(frames: Dict[str, Any], timeframes: List[str]) -> bool:
+    return not any((frames.get(tf) is None or frames[tf].empty or len(frames[tf]) < 2 for tf in timeframes))
+
+def _score_pair(pair: str, frames: Dict[str, Any], market_context: Dict[str, Any], tickers: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not _passes_gate(frames, SCAN_GATE_TIMEFRAMES):
+        return None
+    data_1w, data_1d, data_4h, data_1h, data_15m, data_5m = (frames.get(tf) for tf in SCAN_TIMEFRAMES)
+    ticker_info = tickers.get(pair)
+    current_price = ticker_info.get('last') if ticker_info else None
+    return analyze_and_score(pair, data_1w, data_1d, data_4h, data_1h, data_15m, data_5m, market_context, current_price, minimum_score=1)
+
+def create_scoring_pool(workers: Optional[int]=None) -> Optional[ProcessPoolExecutor]:
+    """Process pool for the CPU-bound scoring stage, or None (score in-process) for `workers` <= 1.
+Uses the 'spawn' start method, since the scanner process runs fetch threads."""
+    workers = SCORING_WORKERS if workers is None else workers
+    if workers <= 1:
+        return None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+def _score_pairs_in_pool(scoring_pool: Executor, pairs: List[str], frames: Dict[str, Dict[str, Any]], market_context: Dict[str, Any], tickers: Dict[str, Any]) -> List[Optional[Dict[str, Any]]]:
+    """Score `pairs` on `scoring_pool`, returning results in input order.
+Lazy frames are sent unresolved, so their indicators are computed in the workers, in parallel;
+each worker only receives its own pair's frames and ticker."""
+    pair_frames = [frames[pair] for pair in pairs]
+    pair_tickers = [{pair: tickers[pair]} if pair in tickers else {} for pair in pairs]
+    return list(scoring_pool.map(_score_pair, pairs, pair_frames, itertools.repeat(market_context), pair_tickers))
+
+def _analyze_pair_batch(batch: List[Tuple[str, Dict[str, Optional[pd.DataFrame]]]], btc_data_4h: pd.DataFrame, btc_data_1h: pd.DataFrame, market_context: Dict[str, Any], tickers: Dict[str, Any], load_timeframes: Optional[TimeframeLoader]=None, scoring_pool: Optional[Executor]=None) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Scoring stage for a chunk of pairs delivered by `fetch_ohlcv_concurrently`.
+Indicators are computed per timeframe for the whole chunk with `calculate_indicators_batch`,
+4h/1h first: pairs that already fail the gate there never get 15m/5m indicators.
+The 1w/1d frames missing from the batch are fetched (via `load_timeframes`) for all pairs that
+passed the gate at once. They are handed to the scorer as `LazyTimeframe` objects, so their
+indicators are only computed if the scorer actually reads them - or as None without data or
+with fewer than `LAZY_INDICATOR_MIN_CANDLES` candles, where `calculate_indicators` returns None.
+With a `scoring_pool` (see `create_scoring_pool`), the pairs that passed the gate are
+scored in worker processes; results are identical to and in the same order as the serial path.
+Shared by `run_scan` and `analyze_specific_pairs` so both paths compute identical results."""
+    btc_frames = {'4h': btc_data_4h, '1h': btc_data_1h}
+    indicator_frames: Dict[str, Dict[str, Any]] = {pair: {} for pair, _ in batch}
+    candidates = dict(batch)
+    for stage in (SCAN_GATE_TIMEFRAMES[:2], SCAN_GATE_TIMEFRAMES[2:]):
+        for timeframe in stage:
+            raw_frames = {}
+            for pair, frames in candidates.items():
+                df = frames.get(timeframe)
+                if timeframe in btc_frames:
+                    df = add_relative_strength_data(df, btc_frames[timeframe])
+                raw_frames[pair] = df
+            for pair, df in calculate_indicators_batch(raw_frames).items():
+                indicator_frames[pair][timeframe] = df
+        candidates = {pair: frames for pair, frames in candidates.items() if _passes_gate(indicator_frames[pair], stage)}
+    missing = [pair for pair, frames in candidates.items() if any((frames.get(tf) is None for tf in SCAN_LAZY_TIMEFRAMES))]
+    loaded = load_timeframes(missing, SCAN_LAZY_TIMEFRAMES) if load_timeframes is not None and missing else {}
+    for pair, frames in candidates.items():
+        for timeframe in SCAN_LAZY_TIMEFRAMES:
+            df = frames.get(timeframe)
+            if df is None:
+                df = loaded.get(pair, {}).get(timeframe)
+            indicator_frames[pair][timeframe] = LazyTimeframe(functools.partial(calculate_indicators, df)) if df is not None and len(df) >= LAZY_INDICATOR_MIN_CANDLES else None
+    if scoring_pool is None or not candidates:
+        return [(pair, _score_pair(pair, indicator_frames[pair], market_context, tickers)) for pair, _ in batch]
+    pool_results = dict(zip(candidates, _score_pairs_in_pool(scoring_pool, list(candidates), indicator_frames, market_context, tickers)))
+    return [(pair, pool_results.get(pair)) for pair, _ in batch]
+
+class ScanStream:
+    """Streaming scan session returned by `stream_scan`.
+`summary` (market context, tickers, universe size) is ready as soon as the stream is
+created; iterating yields each recommendation the moment its pair has been scored.
+`summary['found_targets']` is filled in once the stream is exhausted."""
+
+    def __init__(self, summary: Dict[str, Any], recommendations: Iterator[Dict[str, Any]]):
+        self.summary = summary
+        self._recommendations = recommendations
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self._recommendations
+
+def _iter_recommendations(context: ScanContext, exchange: ccxt.Exchange, pairs: List[str], scan_summary: Dict[str, Any], tickers: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
     market_context = scan_summary.get('market_context', {})
-    if not pairs:
-        print('Không tìm thấy cặp giao dịch nào để quét.')
-        return {'recommendations': [], 'summary': scan_summary}
     print('Đang tải dữ liệu BTC để phân tích Sức Mạnh Tương Đối...')
-    btc_data_4h = fetch_ohlcv_data(exchange, BTC_SYMBOL, '4h', 300)
-    btc_data_1h = fetch_ohlcv_data(exchange, BTC_SYMBOL, '1h', 300)
+    btc_data_4h, btc_data_1h = context.get_btc_frames()
     if btc_data_1h is None or btc_data_4h is None:
         print('CẢNH BÁO: Không thể lấy dữ liệu BTC, phân tích RS sẽ bị bỏ qua.')
         btc_data_4h, btc_data_1h = (pd.DataFrame(), pd.DataFrame())
-    results, total_pairs = ([], len(pairs))
+    total_pairs, found_targets = (len(pairs), 0)
     print(f'\nBắt đầu quá trình quét và phân tích sâu {total_pairs} mục tiêu...')
-    for i, pair in enumerate(pairs):
-        print(f'  Radar đang quét mục tiêu mới: {pair:<15} ({i + 1}/{total_pairs})', end='\r')
-        data_1w = fetch_ohlcv_data(exchange, pair, '1w', 300)
-        data_1d = fetch_ohlcv_data(exchange, pair, '1d', 300)
-        data_4h = fetch_ohlcv_data(exchange, pair, '4h', 300)
-        data_1h = fetch_ohlcv_data(exchange, pair, '1h', 300)
-        data_15m = fetch_ohlcv_data(exchange, pair, '15m', 300)
-        data_5m = fetch_ohlcv_data(exchange, pair, '5m', 300)
-        data_4h = add_relative_strength_data(data_4h, btc_data_4h)
-        data_1h = add_relative_strength_data(data_1h, btc_data_1h)
-        data_1w = calculate_indicators(data_1w)
-        data_1d = calculate_indicators(data_1d)
-        data_4h = calculate_indicators(data_4h)
-        data_1h = calculate_indicators(data_1h)
-        data_15m = calculate_indicators(data_15m)
-        data_5m = calculate_indicators(data_5m)
-        if any((d is None or d.empty or len(d) < 2 for d in [data_4h, data_1h, data_15m, data_5m])):
-            continue
-        ticker_info = tickers.get(pair)
-        current_price = ticker_info.get('last') if ticker_info else None
-        recommendation = analyze_and_score(pair, data_1w, data_1d, data_4h, data_1h, data_15m, data_5m, market_context, current_price, minimum_score=1)
-        if recommendation:
-            results.append(recommendation)
+    processed = 0
+    throttle = create_request_throttle(exchange)
+    load_timeframes = create_timeframe_loader(exchange, throttle)
+    scoring_pool = create_scoring_pool()
+    try:
+        for batch in _iter_batches(fetch_ohlcv_concurrently(exchange, pairs, SCAN_GATE_TIMEFRAMES, throttle=throttle), SCAN_INDICATOR_BATCH_SIZE):
+            for pair, recommendation in _analyze_pair_batch(batch, btc_data_4h, btc_data_1h, market_context, tickers, load_timeframes, scoring_pool):
+                processed += 1
+                print(f'  Radar đang quét mục tiêu mới: {pair:<15} ({processed}/{total_pairs})', end='\r')
+                if recommendation:
+                    found_targets += 1
+                    yield recommendation
+    finally:
+        if scoring_pool is not None:
+            scoring_pool.shutdown(wait=True, cancel_futures=True)
     print('\nQuét mới hoàn tất.' + ' ' * 40)
-    sorted_results = sorted(results, key=lambda x: x['final_score'], reverse=True)
-    scan_summary['found_targets'] = len(sorted_results)
-    return {'recommendations': sorted_results, 'summary': scan_summary}
+    scan_summary['found_targets'] = found_targets
+
+def stream_scan() -> ScanStream:
+    """Streaming variant of `run_scan`.
+Loads the universe and the market summary up front, then scores pairs lazily while
+they are iterated, so callers can act on early results while the tail of the universe
+is still downloading. Recommendations arrive in scan order, not sorted by score."""
+    print('--- Bắt đầu phiên quét mới ---')
+    context = get_scan_context()
+    exchange = context.get_exchange()
+    if not exchange:
+        return ScanStream({}, iter([]))
+    pairs, scan_summary, tickers = get_all_usdt_pairs(exchange, context)
+    if not pairs:
+        print('Không tìm thấy cặp giao dịch nào để quét.')
+        return ScanStream(scan_summary, iter([]))
+    return ScanStream(scan_summary, _iter_recommendations(context, exchange, pairs, scan_summary, tickers))
+
+def run_scan() -> Dict[str, Any]:
+    stream = stream_scan()
+    sorted_results = sorted(stream, key=lambda x: x['final_score'], reverse=True)
+    return {'recommendations': sorted_results, 'summary': stream.summary}
 
 def analyze_specific_pairs(pairs_to_analyze: List[str]) -> List[Dict[str, Any]]:
     if not pairs_to_analyze:
         return []
     print(f"\n--- Bắt đầu phân tích lại {len(pairs_to_analyze)} mục tiêu từ 'Bộ Nhớ' ---")
-    exchange = initialize_exchange(EXCHANGE)
+    context = get_scan_context()
+    exchange = context.get_exchange()
     if not exchange:
         return []
-    market_context = analyze_market_context(exchange)
+    market_context = context.get_market_context()
     try:
-        tickers = exchange.fetch_tickers()
+        tickers = context.get_tickers()
     except Exception:
         tickers = {}
         print('Cảnh báo: Không thể tải tickers khi phân tích lại, sẽ không có giá hiện tại.')
     print('Đang tải dữ liệu BTC để phân tích lại Sức Mạnh Tương Đối...')
-    btc_data_4h = fetch_ohlcv_data(exchange, BTC_SYMBOL, '4h', 300)
-    btc_data_1h = fetch_ohlcv_data(exchange, BTC_SYMBOL, '1h', 300)
+    btc_data_4h, btc_data_1h = context.get_btc_frames()
     if btc_data_1h is None or btc_data_4h is None:
         print('CẢNH BÁO: Không thể lấy dữ liệu BTC, phân tích RS sẽ bị bỏ qua.')
         btc_data_4h, btc_data_1h = (pd.DataFrame(), pd.DataFrame())
     results, total_pairs = ([], len(pairs_to_analyze))
-    for i, pair in enumerate(pairs_to_analyze):
-        print(f'  Đánh giá lại (Bộ nhớ): {pair:<15} ({i + 1}/{total_pairs})', end='\r')
-        data_1w = fetch_ohlcv_data(exchange, pair, '1w', 300)
-        data_1d = fetch_ohlcv_data(exchange, pair, '1d', 300)
-        data_4h = fetch_ohlcv_data(exchange, pair, '4h', 300)
-        data_1h = fetch_ohlcv_data(exchange, pair, '1h', 300)
-        data_15m = fetch_ohlcv_data(exchange, pair, '15m', 300)
-        data_5m = fetch_ohlcv_data(exchange, pair, '5m', 300)
-        data_4h = add_relative_strength_data(data_4h, btc_data_4h)
-        data_1h = add_relative_strength_data(data_1h, btc_data_1h)
-        data_1w = calculate_indicators(data_1w)
-        data_1d = calculate_indicators(data_1d)
-        data_4h = calculate_indicators(data_4h)
-        data_1h = calculate_indicators(data_1h)
-        data_15m = calculate_indicators(data_15m)
-        data_5m = calculate_indicators(data_5m)
-        if any((d is None or d.empty or len(d) < 2 for d in [data_4h, data_1h, data_15m, data_5m])):
-            continue
-        ticker_info = tickers.get(pair)
-        current_price = ticker_info.get('last') if ticker_info else None
-        recommendation = analyze_and_score(pair, data_1w, data_1d, data_4h, data_1h, data_15m, data_5m, market_context, current_price, minimum_score=1)
-        if recommendation:
-            results.append(recommendation)
+    processed = 0
+    throttle = create_request_throttle(exchange)
+    load_timeframes = create_timeframe_loader(exchange, throttle)
+    scoring_pool = create_scoring_pool()
+    try:
+        for batch in _iter_batches(fetch_ohlcv_concurrently(exchange, pairs_to_analyze, SCAN_GATE_TIMEFRAMES, throttle=throttle), SCAN_INDICATOR_BATCH_SIZE):
+            for pair, recommendation in _analyze_pair_batch(batch, btc_data_4h, btc_data_1h, market_context, tickers, load_timeframes, scoring_pool):
+                processed += 1
+                print(f'  Đánh giá lại (Bộ nhớ): {pair:<15} ({processed}/{total_pairs})', end='\r')
+                if recommendation:
+                    results.append(recommendation)
+    finally:
+        if scoring_pool is not None:
+            scoring_pool.shutdown(wait=True, cancel_futures=True)
     print("\nĐánh giá lại 'Bộ nhớ' hoàn tất." + ' ' * 40)
     return results
 
@@ -953,17 +1456,55 @@ def _evaluate_15m_health(pair: str, data_15m: pd.DataFrame) -> Optional[Dict[str
             reasons.append(f'RSI yếu ({last['rsi']:.0f})')
         return {'pair': pair, 'status': 'Weak', 'reason': f'Cấu trúc suy yếu: {', '.join(reasons)}.'}
 
-def analyze_open_trades(open_trade_pairs: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+CandleSource = Callable[[List[str], str, int], Dict[str, Optional[pd.DataFrame]]]
+
+def bot_candles_to_dataframe(payload: Dict[str, Any]) -> Optional[pd.DataFrame]:
+    """Convert one entry of a freqtrade `/api/v1/pair_candles/batch` response (column-major,
+dates in epoch ms) into the scanner's OHLCV frame.
+Only the OHLCV columns are kept - the scanner computes its own indicators."""
+    columns = payload.get('data') or {}
+    required = ['date', 'open', 'high', 'low', 'close', 'volume']
+    if not payload.get('length') or not all((col in columns for col in required)):
+        return None
+    df = pd.DataFrame({col: columns[col] for col in required}).rename(columns={'date': 'timestamp'})
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    return df.set_index('timestamp')
+
+def _load_open_trade_candles(open_trade_pairs: List[str], candle_source: Optional[CandleSource]) -> Tuple[Dict[str, Optional[pd.DataFrame]], List[str]]:
+    frames = {}
+    if candle_source is not None:
+        try:
+            frames = dict(candle_source(open_trade_pairs, '15m', OHLCV_FETCH_LIMIT) or {})
+        except Exception as e:
+            print(f'  -> [CẢNH BÁO] Không lấy được nến 15m từ bot ({e}). Chuyển sang tải từ sàn.')
+            frames = {}
+    missing = [pair for pair in open_trade_pairs if frames.get(pair) is None or len(frames[pair]) < 100]
+    if candle_source is not None:
+        print(f'  -> Nến 15m từ bot: {len(open_trade_pairs) - len(missing)}/{len(open_trade_pairs)} cặp.')
+    return (frames, missing)
+
+def analyze_open_trades(open_trade_pairs: List[str], candle_source: Optional[CandleSource]=None) -> Dict[str, Optional[Dict[str, Any]]]:
+    """15m health check of the open trades.
+`candle_source(pairs, timeframe, limit)` - typically the running freqtrade bot - is asked first,
+so candles the bot has already refreshed are reused. Only pairs it cannot serve are downloaded
+from the exchange (concurrently); without a source, every pair is downloaded."""
     if not open_trade_pairs:
         return {}
     print(f'\n--- Bắt đầu đánh giá tình trạng 15m của {len(open_trade_pairs)} lệnh đang mở ---')
-    exchange = initialize_exchange(EXCHANGE)
-    if not exchange:
-        return {pair: {'status': 'Weak', 'reason': 'Lỗi kết nối sàn.'} for pair in open_trade_pairs}
+    frames_15m, missing_pairs = _load_open_trade_candles(open_trade_pairs, candle_source)
     analysis_results, total_pairs = ({}, len(open_trade_pairs))
+    if missing_pairs:
+        exchange = get_scan_context().get_exchange()
+        if not exchange:
+            analysis_results.update({pair: {'status': 'Weak', 'reason': 'Lỗi kết nối sàn.'} for pair in missing_pairs})
+        else:
+            for pair, frames in fetch_ohlcv_concurrently(exchange, missing_pairs, ['15m']):
+                frames_15m[pair] = frames.get('15m')
     for i, pair in enumerate(open_trade_pairs):
+        if pair in analysis_results:
+            continue
         print(f'  Đánh giá (Lệnh mở 15m): {pair:<15} ({i + 1}/{total_pairs})', end='\r')
-        data_15m = fetch_ohlcv_data(exchange, pair, '15m', 300)
+        data_15m = frames_15m.get(pair)
         if data_15m is None or len(data_15m) < 100:
             analysis_results[pair] = {'status': 'Weak', 'reason': 'Không đủ dữ liệu 15m.'}
             continue
@@ -1010,13 +1551,13 @@ def _find_significant_swing_low(data: pd.DataFrame, lookback: int=20) -> Optiona
     df = data.tail(lookback).copy()
     if len(df) < 5:
         return None
-    try:
-        from scipy.signal import find_peaks
-        troughs, _ = find_peaks(-df['low'], distance=3, width=1)
-        if len(troughs) > 0:
-            return df['low'].iloc[troughs[-1]]
-    except (ImportError, Exception):
-        pass
+    if find_peaks is not None:
+        try:
+            troughs, _ = find_peaks(-df['low'], distance=3, width=1)
+            if len(troughs) > 0:
+                return df['low'].iloc[troughs[-1]]
+        except Exception:
+            pass
     df['swing_low'] = (df['low'] < df['low'].shift(1)) & (df['low'] < df['low'].shift(2)) & (df['low'] < df['low'].shift(-1)) & (df['low'] < df['low'].shift(-2))
     significant_lows = df[df['swing_low']]['low']
     if not significant_lows.empty:
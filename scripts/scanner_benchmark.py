@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for ichimoku_scanner.
+
+Replays OHLCV / ticker fixtures through a fake ccxt exchange injected into the real
+scanner entry points, and reports wall time and peak memory per stage (universe filter,
+streaming scan, open-trade health check, formatting) for several universe sizes.
+
+Record fixtures once (needs network):
+    python scripts/scanner_benchmark.py record --pairs 100 --fixtures user_data/scanner_bench
+
+Run the benchmark (uses synthetic candles when no fixtures are given):
+    python scripts/scanner_benchmark.py run --fixtures user_data/scanner_bench --sizes 50 150 500
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ichimoku_scanner as scanner
+
+
+STAGES = ["universe", "scan", "open_trades", "formatting"]
+TIMEFRAME_MS = {
+    "5m": 300_000,
+    "15m": 900_000,
+    "1h": 3_600_000,
+    "4h": 14_400_000,
+    "1d": 86_400_000,
+    "1w": 604_800_000,
+}
+START_MS = 1_700_000_000_000
+
+
+class FakeExchange:
+    """
+    Minimal stand-in for a ccxt spot exchange.
+    Serves recorded fixtures when available. Universes larger than the recording reuse
+    the recorded series under synthetic pair names, and missing series are generated
+    from a seeded random walk, so results are reproducible.
+    """
+
+    id = "fake"
+    rateLimit = 0
+    has = {"fetchOHLCV": True, "fetchTickers": True}
+
+    def __init__(self, num_pairs: int, fixtures: dict | None = None, seed: int = 42):
+        fixtures = fixtures or {}
+        recorded = [p for p in fixtures.get("tickers", {}) if p != scanner.BTC_SYMBOL]
+        self._ohlcv = fixtures.get("ohlcv", {})
+        self._seed = seed
+        self._source: dict[str, str] = {scanner.BTC_SYMBOL: scanner.BTC_SYMBOL}
+        self.tickers: dict[str, dict] = {}
+        for i in range(num_pairs):
+            pair = recorded[i] if i < len(recorded) else f"BENCH{i:04d}/{scanner.QUOTE_CURRENCY}"
+            source = recorded[i % len(recorded)] if recorded else pair
+            self._source[pair] = source
+            self.tickers[pair] = fixtures.get("tickers", {}).get(source) or self._ticker(i)
+        self.tickers[scanner.BTC_SYMBOL] = fixtures.get("tickers", {}).get(
+            scanner.BTC_SYMBOL
+        ) or self._ticker(num_pairs)
+        self.markets = {
+            pair: {"symbol": pair, "spot": True, "active": True} for pair in self.tickers
+        }
+
+    def _ticker(self, i: int) -> dict:
+        rng = np.random.default_rng(self._seed + i)
+        low = float(rng.uniform(1, 100))
+        high = low * float(rng.uniform(1.01, 1.2))
+        last = float(rng.uniform(low, high))
+        return {
+            "last": last,
+            "open": float(rng.uniform(low, high)),
+            "high": high,
+            "low": low,
+            "percentage": float(rng.uniform(-8, 8)),
+            "quoteVolume": float(rng.uniform(1e6, 5e8)),
+        }
+
+    def load_markets(self, reload: bool = False) -> dict:
+        return self.markets
+
+    def market(self, symbol: str) -> dict:
+        return self.markets[symbol]
+
+    def fetch_tickers(self) -> dict:
+        return self.tickers
+
+    def fetch_ohlcv(self, pair: str, timeframe: str, since=None, limit: int = 300) -> list:
+        source = self._source.get(pair, pair)
+        recorded = self._ohlcv.get(source, {}).get(timeframe)
+        if recorded:
+            return recorded[-limit:]
+        return synthetic_ohlcv(f"{source}-{timeframe}", timeframe, limit, self._seed)
+
+
+def synthetic_ohlcv(key: str, timeframe: str, limit: int, seed: int = 42) -> list:
+    rng = np.random.default_rng([seed, *key.encode()])
+    step = TIMEFRAME_MS[timeframe]
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, limit)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.005, limit)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.uniform(1_000, 100_000, limit)
+    return [
+        [START_MS + i * step, open_[i], high[i], low[i], close[i], volume[i]] for i in range(limit)
+    ]
+
+
+def load_fixtures(path: Path | None) -> dict:
+    if path is None:
+        return {}
+    tickers = json.loads((path / "tickers.json").read_text())
+    ohlcv: dict[str, dict] = {}
+    for file in sorted((path / "ohlcv").glob("*.json")):
+        pair_key, timeframe = file.stem.rsplit("-", 1)
+        ohlcv.setdefault(pair_key.replace("_", "/"), {})[timeframe] = json.loads(file.read_text())
+    return {"tickers": tickers, "ohlcv": ohlcv}
+
+
+def record_fixtures(exchange_id: str, num_pairs: int, path: Path) -> None:
+    exchange = scanner.initialize_exchange(exchange_id)
+    if exchange is None:
+        raise SystemExit(f"Could not connect to {exchange_id}.")
+    tickers = exchange.fetch_tickers()
+    usdt = sorted(
+        (
+            (t.get("quoteVolume") or 0, pair)
+            for pair, t in tickers.items()
+            if pair.endswith(f"/{scanner.QUOTE_CURRENCY}") and t
+        ),
+        reverse=True,
+    )
+    pairs = [scanner.BTC_SYMBOL] + [p for _, p in usdt if p != scanner.BTC_SYMBOL][:num_pairs]
+    (path / "ohlcv").mkdir(parents=True, exist_ok=True)
+    (path / "tickers.json").write_text(json.dumps({p: tickers[p] for p in pairs}))
+    for pair, frames in scanner.fetch_ohlcv_concurrently(
+        exchange, pairs, scanner.SCAN_TIMEFRAMES, use_cache=False
+    ):
+        for timeframe, df in frames.items():
+            if df is None:
+                continue
+            rows = [
+                [int(ts.value // 1_000_000), *row]
+                for ts, row in zip(df.index, df.values.tolist(), strict=True)
+            ]
+            file = path / "ohlcv" / f"{pair.replace('/', '_')}-{timeframe}.json"
+            file.write_text(json.dumps(rows))
+    print(f"Recorded {len(pairs)} pairs into {path}.")
+
+
+def _market_context_or_neutral(original):
+    """
+    analyze_market_context is not part of the public scanner and returns None there.
+    Fall back to a neutral context so the universe filter can run.
+    """
+
+    def wrapper(*args, **kwargs):
+        context = original(*args, **kwargs)
+        if context is None:
+            threshold = scanner.FILTER_THRESHOLDS["neutral"]
+            return {"btc_context": {"filter_threshold": threshold}, "eth_context": {}}
+        return context
+
+    return wrapper
+
+
+@contextmanager
+def measure(results: dict, stage: str, trace_memory: bool):
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if trace_memory:
+            results[stage]["peak_mib"] = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+        else:
+            results[stage]["seconds"] = elapsed
+
+
+def _timed(original, totals: dict, key: str):
+    """Wrap a scanner function, adding the time spent in it to totals[key]."""
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            totals[key] = totals.get(key, 0.0) + time.perf_counter() - start
+
+    return wrapper
+
+
+def run_stages(exchange: FakeExchange, results: dict, trace_memory: bool) -> None:
+    """
+    Drive the real scanner entry points (stream_scan, analyze_open_trades) against the
+    fake exchange. Fetching, indicators and scoring are interleaved by the streaming scan,
+    so the time spent in the indicator and scoring functions is reported within "scan".
+    """
+    totals: dict[str, float] = {}
+    with (
+        Path(os.devnull).open("w") as devnull,
+        redirect_stdout(devnull),
+        patch.object(scanner, "initialize_exchange", return_value=exchange),
+        patch.object(scanner, "_scan_context", None),
+        patch.object(scanner, "CANDLE_CACHE_ENABLED", False),
+        patch.object(scanner, "FETCH_MIN_REQUEST_INTERVAL_MS", 0),
+        patch.object(
+            scanner,
+            "analyze_market_context",
+            _market_context_or_neutral(scanner.analyze_market_context),
+        ),
+        patch.object(
+            scanner,
+            "calculate_indicators_batch",
+            _timed(scanner.calculate_indicators_batch, totals, "indicators_s"),
+        ),
+        patch.object(scanner, "_score_pair", _timed(scanner._score_pair, totals, "scoring_s")),
+    ):
+        with measure(results, "universe", trace_memory):
+            stream = scanner.stream_scan()
+        results["universe"]["pairs"] = stream.summary.get("total_pairs_in_universe", 0)
+
+        with measure(results, "scan", trace_memory):
+            recommendations = list(stream)
+        results["scan"]["recommendations"] = len(recommendations)
+        if not trace_memory:
+            results["scan"].update(totals)
+
+        with measure(results, "open_trades", trace_memory):
+            health = scanner.analyze_open_trades(list(exchange.tickers))
+
+        with measure(results, "formatting", trace_memory):
+            scanner.format_15m_trade_status_telegram(health)
+
+
+def benchmark(num_pairs: int, fixtures: dict, trace_memory: bool = True) -> dict:
+    results: dict[str, dict] = {stage: {} for stage in STAGES}
+    run_stages(FakeExchange(num_pairs, fixtures), results, trace_memory=False)
+    if trace_memory:
+        run_stages(FakeExchange(num_pairs, fixtures), results, trace_memory=True)
+    return results
+
+
+def print_report(report: dict) -> None:
+    print(f"\n{'pairs':>6} {'stage':<12} {'seconds':>10} {'peak MiB':>10}")
+    for size, stages in report.items():
+        for stage, values in stages.items():
+            peak = values.get("peak_mib")
+            print(
+                f"{size:>6} {stage:<12} {values['seconds']:>10.3f} "
+                f"{peak if peak is not None else float('nan'):>10.1f}"
+            )
+            for part in ("indicators", "scoring"):
+                if f"{part}_s" in values:
+                    print(f"{size:>6} {'  ' + part:<12} {values[f'{part}_s']:>10.3f}")
+        total = sum(values["seconds"] for values in stages.values())
+        print(f"{size:>6} {'total':<12} {total:>10.3f}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    sub = parser.add_subparsers(dest="command", required=True)
+    record = sub.add_parser("record", help="Record fixtures from the live exchange.")
+    record.add_argument("--exchange", default=scanner.EXCHANGE)
+    record.add_argument("--pairs", type=int, default=100)
+    record.add_argument("--fixtures", type=Path, required=True)
+    run = sub.add_parser("run", help="Run the benchmark against the fake exchange.")
+    run.add_argument("--fixtures", type=Path, default=None)
+    run.add_argument("--sizes", type=int, nargs="+", default=[50, 150, 500])
+    run.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass.")
+    run.add_argument("--json", type=Path, default=None, help="Also write the report to a file.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.command == "record":
+        record_fixtures(args.exchange, args.pairs, args.fixtures)
+        return
+    fixtures = load_fixtures(args.fixtures)
+    report = {
+        size: benchmark(size, fixtures, trace_memory=not args.no_memory) for size in args.sizes
+    }
+    print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""State Store v1.0 - Atomic, append-only storage for the automation state files.
+
+Event logs (Telegram messages, market history) are JSONL files that only ever grow by one
+line per event and are indexed by timestamp in memory. Snapshots (watchlist, managed trades)
+are rewritten atomically through a temp file + os.replace, so a crash never leaves a
+half-written file behind."""
+import bisect
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _atomic_write(path: Path, write: Callable[[Any], None]):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_json(path: Path, data: Any, **dump_kwargs):
+    """Write data as JSON to a temp file next to path, fsync it and rename it over path."""
+    _atomic_write(path, lambda f: json.dump(data, f, ensure_ascii=False, **dump_kwargs))
+
+
+def read_json(path: Path, default: Any=None) -> Any:
+    """Read a JSON snapshot, returning default when it is missing or unreadable."""
+    path = Path(path)
+    if not path.exists():
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        logging.error(f'Lỗi khi đọc file trạng thái ({path}): {e}')
+        return default
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return datetime.min
+
+
+class AppendOnlyLog:
+    """JSONL event log ordered by the `timestamp` field of its records.
+
+append() writes a single line instead of rewriting the whole file. Records are kept in memory
+together with a sorted timestamp index, so range queries are a bisect instead of a full scan.
+Only the newest max_entries records are visible; the file is compacted to them once it holds
+twice as many. Rewrites (delete_before, compaction) go through a temp file + rename.
+A legacy JSON list file is migrated on first load and kept as *.bak."""
+
+    def __init__(self, path: Path, max_entries: Optional[int]=None, legacy_path: Optional[Path]=None, newest_first_legacy: bool=False):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self.newest_first_legacy = newest_first_legacy
+        self._lock = threading.RLock()
+        self._records: List[Dict[str, Any]] = []
+        self._index: List[datetime] = []
+        self._signature: Optional[Tuple[int, int]] = None
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _migrate_legacy(self):
+        try:
+            with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logging.error(f'Không thể chuyển {self.legacy_path.name}, giữ nguyên file cũ: {e}')
+            return
+        if not isinstance(legacy, list):
+            logging.error(f'Không thể chuyển {self.legacy_path.name}: không phải danh sách, giữ nguyên file cũ.')
+            return
+        if self.newest_first_legacy:
+            legacy = legacy[::-1]
+        self._set_records([r for r in legacy if isinstance(r, dict)])
+        self._rewrite()
+        backup_path = self.legacy_path.with_name(self.legacy_path.name + '.bak')
+        os.replace(self.legacy_path, backup_path)
+        logging.info(f'Đã chuyển {len(self._records)} bản ghi từ {self.legacy_path.name} sang {self.path.name} (bản cũ: {backup_path.name}).')
+
+    def _set_records(self, records: List[Dict[str, Any]]):
+        records = sorted(records, key=lambda r: _parse_timestamp(r.get('timestamp')))
+        self._records = records
+        self._index = [_parse_timestamp(r.get('timestamp')) for r in records]
+
+    def _load(self):
+        if not self.path.exists() and self.legacy_path and self.legacy_path.exists():
+            self._migrate_legacy()
+            return
+        signature = self._file_signature()
+        if signature == self._signature:
+            return
+        records = []
+        if signature is not None:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logging.warning(f'Bỏ qua dòng hỏng trong {self.path.name}.')
+        self._set_records(records)
+        self._signature = signature
+
+    def _first(self) -> int:
+        """Index of the oldest record inside the max_entries window."""
+        if self.max_entries:
+            return max(len(self._records) - self.max_entries, 0)
+        return 0
+
+    def _rewrite(self):
+        _atomic_write(self.path, lambda f: f.writelines((json.dumps(r, ensure_ascii=False) + '\n' for r in self._records)))
+        self._signature = self._file_signature()
+
+    def append(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Append one record, stamping it with the current time if it has no timestamp."""
+        with self._lock:
+            self._load()
+            record = dict(record)
+            record.setdefault('timestamp', datetime.now().isoformat())
+            ts = _parse_timestamp(record['timestamp'])
+            if self._index and ts < self._index[-1]:
+                position = bisect.bisect_right(self._index, ts)
+                self._records.insert(position, record)
+                self._index.insert(position, ts)
+                self._rewrite()
+                return record
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._records.append(record)
+            self._index.append(ts)
+            self._signature = self._file_signature()
+            if self.max_entries and len(self._records) >= 2 * self.max_entries:
+                self._set_records(self._records[-self.max_entries:])
+                self._rewrite()
+            return record
+
+    def records(self) -> List[Dict[str, Any]]:
+        """All records, oldest first (trimmed to max_entries)."""
+        with self._lock:
+            self._load()
+            return self._records[self._first():]
+
+    def latest(self, n: int) -> List[Dict[str, Any]]:
+        """The n newest records, newest first."""
+        with self._lock:
+            self._load()
+            return self._records[max(len(self._records) - n, self._first()):][::-1] if n > 0 else []
+
+    def range(self, start: Optional[datetime]=None, end: Optional[datetime]=None) -> List[Dict[str, Any]]:
+        """Records with start <= timestamp < end, oldest first."""
+        with self._lock:
+            self._load()
+            lo = max(bisect.bisect_left(self._index, start), self._first()) if start is not None else self._first()
+            hi = bisect.bisect_left(self._index, end) if end is not None else len(self._index)
+            return self._records[lo:hi]
+
+    def delete_before(self, cutoff: datetime, keep: Optional[Callable[[Dict[str, Any]], bool]]=None) -> List[Dict[str, Any]]:
+        """Remove records older than cutoff and return them.
+Records for which keep(record) is True stay in the log."""
+        with self._lock:
+            self._load()
+            hi = bisect.bisect_left(self._index, cutoff)
+            if hi == 0:
+                return []
+            kept, removed = ([], [])
+            for record in self._records[:hi]:
+                (kept if keep and keep(record) else removed).append(record)
+            self._set_records(kept + self._records[hi:])
+            self._rewrite()
+            return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._records) - self._first()
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 from pandas import DataFrame, Timestamp
@@ -382,6 +382,27 @@ def test_current_whitelist(mocker, default_conf, tickers):
         dp.current_whitelist()
 
 
+def test_pushed_data(mocker, default_conf, markets):
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    exchange = get_patched_exchange(mocker, default_conf)
+
+    pairlist = PairListManager(exchange, default_conf)
+    dp = DataProvider(default_conf, exchange, pairlist)
+    # No PushPairList configured
+    assert dp.pushed_data() == {}
+
+    default_conf["pairlists"] = [{"method": "PushPairList"}]
+    pairlist = PairListManager(exchange, default_conf)
+    dp = DataProvider(default_conf, exchange, pairlist)
+    assert dp.pushed_data() == {}
+    pairlist._pairlist_handlers[0].push_pairs(["ETH/BTC"], {"ETH/BTC": {"entry": 0.05}})
+    assert dp.pushed_data() == {"ETH/BTC": {"entry": 0.05}}
+
+    with pytest.raises(OperationalException):
+        dp = DataProvider(default_conf, exchange)
+        dp.pushed_data()
+
+
 def test_get_analyzed_dataframe(mocker, default_conf, ohlcv_history):
     default_conf["runmode"] = RunMode.DRY_RUN
 
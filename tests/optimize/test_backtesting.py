@@ -1,5 +1,6 @@
 # pragma pylint: disable=missing-docstring, W0212, line-too-long, C0103, unused-argument
 
+import pickle
 import random
 from collections import defaultdict
 from copy import deepcopy
@@ -22,8 +23,15 @@ from freqtrade.data.history import get_timerange
 from freqtrade.enums import CandleType, ExitType, RunMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
-from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
+from freqtrade.optimize.backtest_caching import (
+    get_backtest_metadata_filename,
+    get_backtest_snapshot_filename,
+    get_indicator_hash,
+    get_strategy_run_id,
+)
 from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.columnar_data import ColumnarPairData
+from freqtrade.optimize.event_index import PairEventIndex
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util.datetime_helpers import dt_utc
@@ -1561,6 +1569,322 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results["results"], "5m", 1)) == 0
 
 
+def test_columnar_pair_data(testdatadir) -> None:
+    df = history.load_pair_history(pair="UNITTEST/BTC", timeframe="5m", datadir=testdatadir)
+    df = df.iloc[:50].copy()
+    df["enter_long"] = np.where(df.index % 7 == 0, 1.0, 0.0)
+    df["exit_long"] = np.where(df.index % 5 == 0, 1.0, 0.0)
+    df["enter_short"] = 0.0
+    df["exit_short"] = 0.0
+    df["enter_tag"] = np.where(df.index % 7 == 0, "buy_signal", None)
+    df["exit_tag"] = None
+    df.loc[10, "exit_tag"] = "exit_signal"
+    headers = [
+        "date",
+        "open",
+        "high",
+        "low",
+        "close",
+        "enter_long",
+        "exit_long",
+        "enter_short",
+        "exit_short",
+        "enter_tag",
+        "exit_tag",
+    ]
+    expected = df[headers].values.tolist()
+    timestamps = {}
+    columnar = ColumnarPairData(df, headers[1:5], headers[5:9], headers[9:], timestamps)
+
+    assert len(columnar) == len(expected)
+    assert [list(row) for row in columnar] == expected
+    assert list(columnar[-1]) == expected[-1]
+    assert list(columnar[3]) == expected[3]
+    assert [type(v) for v in columnar[0][:5]] == [type(v) for v in expected[0][:5]]
+    assert columnar[0][9] == "buy_signal"
+    assert columnar[10][10] == "exit_signal"
+    assert columnar[1][9] is None
+    assert [list(row) for row in columnar[2:4]] == expected[2:4]
+    with pytest.raises(IndexError):
+        columnar[len(expected)]
+
+    # Timestamps are shared between pairs
+    columnar2 = ColumnarPairData(df, headers[1:5], headers[5:9], headers[9:], timestamps)
+    assert columnar2[5][0] is columnar[5][0]
+    assert columnar.nbytes < 100 * len(columnar)
+
+    # Signals not fitting into int8 are kept as float
+    df["enter_long"] = 0.5
+    assert ColumnarPairData(df, headers[1:5], headers[5:9], headers[9:], {})[0][5] == 0.5
+
+
+@pytest.mark.parametrize("use_detail", [True, False])
+def test_backtest_columnar_data_identical(default_conf_usdt, fee, mocker, use_detail) -> None:
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        dataframe["enter_long"] = np.where(dataframe.index % 20 == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + 18) % 20 == 0, 1, 0)
+        dataframe["enter_tag"] = np.where(dataframe.index % 40 == 0, "even", "odd")
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update({"runmode": "backtest", "timeframe": "5m", "max_open_trades": 3})
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles_1m = generate_test_data("1m", 1000, "2022-01-03 12:00:00+00:00")
+    raw_candles = ohlcv_fill_up_missing_data(raw_candles_1m, "5m", "dummy")
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = {pair: raw_candles for pair in pairs}
+
+    results = []
+    for columnar in (False, True):
+        default_conf_usdt["backtest_columnar_data"] = columnar
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting.detail_data = {pair: raw_candles_1m for pair in pairs} if use_detail else {}
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
+        backtesting.strategy.advise_exit = _trend_alternate_hold  # Override
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        converted = mocker.spy(backtesting, "_get_ohlcv_as_lists")
+        results.append(
+            backtesting.backtest(
+                processed=deepcopy(processed), start_date=min_date, end_date=max_date
+            )
+        )
+        assert isinstance(converted.spy_return["ETH/USDT"], ColumnarPairData) == columnar
+
+    assert len(results[0]["results"]) > 0
+    pd.testing.assert_frame_equal(results[0]["results"], results[1]["results"])
+    assert results[0]["final_balance"] == results[1]["final_balance"]
+
+
+def test_pair_event_index_consume_steps() -> None:
+    step = 300_000_000_000
+    grid = step * np.arange(1, 41, dtype=np.int64)
+    row_dates = {
+        "aligned": step * np.arange(1, 41),
+        "gaps": step * np.array([1, 2, 3, 7, 8, 20, 21, 22, 39, 40, 41, 42]),
+        "late_start": step * np.arange(15, 30),
+        "duplicates": step * np.array([1, 1, 1, 2, 5, 5, 6, 7, 8, 9, 10]),
+        "misaligned": step * np.arange(0, 40) + step // 2,
+        "unsorted": step * np.array([3, 2, 1, 4, 10, 9]),
+    }
+    for name, dates in row_dates.items():
+        dates = dates.astype(np.int64)
+        # Reference - what the dense loop does with its per-pair row index.
+        expected = []
+        row = 0
+        for step_nr, date in enumerate(grid, 1):
+            if row < len(dates) and dates[row] <= date:
+                expected.append(step_nr)
+                row += 1
+        assert PairEventIndex._consume_steps(dates, grid).tolist() == expected, name
+
+    events = PairEventIndex(
+        ["A", "B"],
+        {
+            "A": (step * np.arange(1, 41, dtype=np.int64), np.array([3, 10])),
+            "B": (step * np.arange(5, 41, dtype=np.int64), np.array([0, 40])),
+        },
+        start_ns=0,
+        step_ns=step,
+        num_steps=40,
+        startup_candles=100,
+    )
+    assert events.candle_pairs(4, []) == ["A"]
+    assert events.candle_pairs(5, []) == ["B"]
+    assert events.candle_pairs(6, ["B"]) == ["B"]
+    assert events.candle_pairs(11, ["B"]) == ["A", "B"]
+    assert events.row_index("A", 11) == 10
+    assert events.row_index("B", 11) == 6
+    assert events.has_rows(1)
+    assert not events.has_rows(0)
+
+    # Before any pair is processed, all pairs are on the prior candle's row.
+    assert events.slice_index("A") == 110
+    assert events.slice_index("B") == 106
+    # B has an open trade, so it's processed first.
+    events.processing("B")
+    assert events.slice_index("A") == 110
+    assert events.slice_index("B") == 107
+    events.processing("A")
+    assert events.slice_index("A") == 111
+    events.processing(None)
+    assert events.slice_index("A") == 111
+    assert events.slice_index("C") is None
+    events.candle_pairs(1, [])
+    assert events.slice_index("A") is None
+    assert events.final_slice_indexes() == {"A": 140, "B": 136}
+
+
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_backtest_incremental_identical(
+    default_conf_usdt, fee, mocker, caplog, tmp_path, event_driven
+) -> None:
+    def _sparse_signals(dataframe=None, metadata=None):
+        offset = len(metadata["pair"])
+        dataframe["enter_long"] = np.where((dataframe.index + offset) % 37 == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + offset) % 37 == 9, 1, 0)
+        dataframe["enter_tag"] = "sparse"
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": 2,
+            "minimal_roi": {"0": 10},
+            "stoploss": -0.99,
+            "user_data_dir": tmp_path,
+            "backtest_event_driven": event_driven,
+        }
+    )
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles = generate_test_data("5m", 1000, "2022-01-03 12:00:00+00:00")
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = {pair: raw_candles for pair in pairs}
+    # Pair with a late start and pair with gaps in the data
+    data["DASH/USDT"] = raw_candles.iloc[120:].reset_index(drop=True)
+    data["LTC/USDT"] = raw_candles.drop(raw_candles.index[200:230]).reset_index(drop=True)
+
+    def run_backtest(incremental: bool, data: dict):
+        default_conf_usdt["backtest_incremental"] = incremental
+        backtesting = Backtesting(default_conf_usdt)
+        strategy = backtesting.strategylist[0]
+        strategy.advise_entry = _sparse_signals  # Override
+        strategy.advise_exit = _sparse_signals  # Override
+        dp = backtesting.dataprovider
+        # What callbacks see of the dataframes
+        seen = []
+
+        def _record(*args, current_time, seen=seen, dp=dp, **kwargs):
+            seen.append((current_time, [len(dp.get_analyzed_dataframe(p, "5m")[0]) for p in pairs]))
+            return True
+
+        strategy.bot_loop_start = MagicMock(side_effect=_record)
+        strategy.confirm_trade_entry = MagicMock(side_effect=_record)
+        strategy.confirm_trade_exit = MagicMock(side_effect=_record)
+        backtesting.backtest_one_strategy(strategy, data, TimeRange())
+        snapshot_file = get_backtest_snapshot_filename(tmp_path / "backtest_results", strategy)
+        return backtesting.all_bt_content[strategy.get_strategy_name()], seen, snapshot_file
+
+    full, full_seen, _ = run_backtest(False, data)
+    assert len(full["results"]) > 5
+    assert not (tmp_path / "backtest_results" / "snapshots").exists()
+
+    # Backtest up to an earlier date - storing the snapshot
+    _, _, snapshot_file = run_backtest(True, {pair: df.iloc[:-150] for pair, df in data.items()})
+    assert snapshot_file.is_file()
+    snapshot = pickle.loads(snapshot_file.read_bytes())  # noqa: S301
+    assert len(snapshot["trades"]) > 0
+    assert len(snapshot["open_trades"]) > 0
+    assert not log_has_re(r"Resuming backtest from .*", caplog)
+
+    # Resume on the full data
+    resumed, resumed_seen, _ = run_backtest(True, data)
+    assert log_has_re(r"Resuming backtest from .*", caplog)
+    pd.testing.assert_frame_equal(full["results"], resumed["results"])
+    for key in ("final_balance", "locks", "rejected_signals", "timedout_entry_orders"):
+        assert full[key] == resumed[key]
+    # Callbacks after the snapshot see the same dataframes
+    assert len(resumed_seen) > 0
+    assert resumed_seen == [seen for seen in full_seen if seen[0] >= snapshot["resume_date"]]
+
+    # Data which doesn't match the snapshot runs a full backtest
+    caplog.clear()
+    data["ETH/USDT"] = raw_candles.iloc[1:].reset_index(drop=True)
+    run_backtest(True, data)
+    assert log_has("Backtest snapshot doesn't match the data, running a full backtest.", caplog)
+    assert not log_has_re(r"Resuming backtest from .*", caplog)
+
+    # Corrected candle with the same dates
+    run_backtest(True, {pair: df.iloc[:-150] for pair, df in data.items()})
+    caplog.clear()
+    data["ADA/USDT"] = raw_candles.copy()
+    data["ADA/USDT"].loc[500, "close"] *= 1.01
+    run_backtest(True, data)
+    assert log_has("Backtest snapshot doesn't match the data, running a full backtest.", caplog)
+    assert not log_has_re(r"Resuming backtest from .*", caplog)
+
+
+@pytest.mark.parametrize("use_detail", [True, False])
+def test_backtest_event_driven_identical(default_conf_usdt, fee, mocker, use_detail) -> None:
+    def _sparse_signals(dataframe=None, metadata=None):
+        offset = len(metadata["pair"])
+        dataframe["enter_long"] = np.where((dataframe.index + offset) % 37 == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + offset) % 37 == 9, 1, 0)
+        dataframe["enter_tag"] = "sparse"
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update({"runmode": "backtest", "timeframe": "5m", "max_open_trades": 2})
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles_1m = generate_test_data("1m", 2500, "2022-01-03 12:00:00+00:00")
+    raw_candles = ohlcv_fill_up_missing_data(raw_candles_1m, "5m", "dummy")
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = {pair: raw_candles for pair in pairs}
+    # Pairs with a late start and with gaps in the data
+    data["DASH/USDT"] = raw_candles.iloc[120:].reset_index(drop=True)
+    data["LTC/USDT"] = raw_candles.drop(raw_candles.index[200:230]).reset_index(drop=True)
+
+    results = []
+    for event_driven in (False, True):
+        default_conf_usdt["backtest_event_driven"] = event_driven
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting.detail_data = {pair: raw_candles_1m for pair in pairs} if use_detail else {}
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _sparse_signals  # Override
+        backtesting.strategy.advise_exit = _sparse_signals  # Override
+        dp = backtesting.dataprovider
+        # What callbacks see of all pairs' dataframes
+        seen = []
+
+        def _record(*args, seen=seen, dp=dp, **kwargs):
+            seen.append([len(dp.get_analyzed_dataframe(p, "5m")[0]) for p in pairs])
+            return True
+
+        backtesting.strategy.bot_loop_start = MagicMock(side_effect=_record)
+        backtesting.strategy.confirm_trade_entry = MagicMock(side_effect=_record)
+        backtesting.strategy.confirm_trade_exit = MagicMock(side_effect=_record)
+        backtest_loop = mocker.spy(backtesting, "backtest_loop")
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        result = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        results.append((result, seen, backtest_loop.call_count))
+
+    (dense, dense_seen, dense_calls), (events, events_seen, events_calls) = results
+    assert len(dense["results"]) > 5
+    pd.testing.assert_frame_equal(dense["results"], events["results"])
+    assert dense["final_balance"] == events["final_balance"]
+    assert dense["rejected_signals"] == events["rejected_signals"]
+    # bot_loop_start is still called once per candle.
+    assert len(dense_seen) == len(events_seen)
+    assert dense_seen == events_seen
+    assert events_calls < dense_calls / 2
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 @pytest.mark.parametrize("pair", ["ADA/USDT", "LTC/USDT"])
 @pytest.mark.parametrize("tres", [0, 20, 30])
@@ -1815,6 +2139,71 @@ def test_backtest_multi_pair_detail_simplified(
     assert len(evaluate_result_multi(results["results"], "1m", 1)) == 0
 
 
+def test_get_detail_data(default_conf_usdt, mocker) -> None:
+    default_conf_usdt["timeframe"] = "5m"
+    default_conf_usdt["timeframe_detail"] = "1m"
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf_usdt)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    pair = "ETH/USDT"
+    raw_candles_1m = generate_test_data("1m", 100, "2022-01-03 12:00:00+00:00")
+    # Create a gap in the detail data
+    raw_candles_1m = raw_candles_1m.drop(index=range(20, 30)).reset_index(drop=True)
+    backtesting.detail_data = {pair: raw_candles_1m}
+
+    def reference(row):
+        # Filter / copy based implementation
+        start = row[0].to_pydatetime()
+        df = raw_candles_1m.loc[
+            (raw_candles_1m["date"] >= start)
+            & (raw_candles_1m["date"] < start + timedelta(minutes=5))
+        ].copy()
+        if len(df) == 0:
+            return None
+        for col, val in zip(
+            ["enter_long", "exit_long", "enter_short", "exit_short", "enter_tag", "exit_tag"],
+            row[5:],
+            strict=True,
+        ):
+            df.loc[:, col] = val
+        return df[
+            [
+                "date",
+                "open",
+                "high",
+                "low",
+                "close",
+                "enter_long",
+                "exit_long",
+                "enter_short",
+                "exit_short",
+                "enter_tag",
+                "exit_tag",
+            ]
+        ].values.tolist()
+
+    for minutes in (-10, -5, -3, 0, 15, 20, 25, 30, 95, 100, 120):
+        date = pd.Timestamp("2022-01-03 12:00:00+00:00") + timedelta(minutes=minutes)
+        row = [date, 1.0, 1.1, 0.9, 1.05, 1, 0, 0, 1, "tag", None]
+        result = backtesting.get_detail_data(pair, row)
+        expected = reference(row)
+        assert result == expected
+        if expected is not None:
+            assert [type(v) for v in result[0]] == [type(v) for v in expected[0]]
+
+    assert (
+        backtesting.get_detail_data(pair, [pd.Timestamp("2022-01-03 12:20:00+00:00")] + [0] * 10)
+        is None
+    )
+
+    # A new detail dataframe invalidates the cached index
+    backtesting.detail_data[pair] = raw_candles_1m.iloc[:10]
+    row = [pd.Timestamp("2022-01-03 12:05:00+00:00"), 1.0, 1.1, 0.9, 1.05, 0, 0, 0, 0, None, None]
+    assert len(backtesting.get_detail_data(pair, row)) == 5
+    row[0] = pd.Timestamp("2022-01-03 12:10:00+00:00")
+    assert backtesting.get_detail_data(pair, row) is None
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 def test_backtest_multi_pair_long_short_switch(
     default_conf_usdt,
@@ -2054,6 +2443,67 @@ def test_backtest_start_multi_strat(default_conf, mocker, caplog, testdatadir):
         assert log_has(line, caplog)
 
 
+def test_backtest_start_multi_strat_parallel(default_conf, mocker, caplog, testdatadir, tmp_path):
+    patch_exchange(mocker)
+    default_conf["exchange"]["pair_whitelist"] = ["ETH/BTC", "LTC/BTC"]
+    patched_configuration_load_config_file(mocker, default_conf)
+    mocker.patch("freqtrade.optimize.backtesting.show_backtest_results")
+    mocker.patch("freqtrade.optimize.backtesting.store_backtest_results")
+    args = [
+        "backtesting",
+        "--config",
+        "config.json",
+        "--datadir",
+        str(testdatadir),
+        "--userdir",
+        str(tmp_path),
+        "--strategy-path",
+        str(Path(__file__).parents[1] / "strategy/strats"),
+        "--timeframe",
+        "5m",
+        "--timerange",
+        "20180110-20180130",
+        "--export",
+        "signals",
+        "--strategy-list",
+        CURRENT_TEST_STRATEGY,
+        "StrategyTestV2",
+    ]
+    config = setup_optimize_configuration(get_args([*args, "-j", "2"]), RunMode.BACKTEST)
+    assert config["backtest_jobs"] == 2
+
+    def _run_in_process(self, parallel, strategy_indexes, timerange, data_file):
+        # Worker processes don't see mocks - run the worker function in this process instead.
+        assert data_file.is_file()
+        return [self.backtest_strategy_worker(i, timerange, data_file) for i in strategy_indexes]
+
+    run_parallel = mocker.patch.object(
+        Backtesting, "run_strategies_parallel", autospec=True, side_effect=_run_in_process
+    )
+    backtesting = Backtesting(deepcopy(config))
+    backtesting.start()
+    assert run_parallel.call_count == 1
+    assert run_parallel.call_args[0][2] == [0, 1]
+    assert log_has("Backtesting 2 strategies in 2 worker processes.", caplog)
+    # The shared data file is removed.
+    assert not (tmp_path / "backtest_results" / "backtest_tickerdata.pkl").exists()
+
+    config["backtest_jobs"] = 1
+    sequential = Backtesting(deepcopy(config))
+    sequential.start()
+    assert run_parallel.call_count == 1
+    for strategy_name in (CURRENT_TEST_STRATEGY, "StrategyTestV2"):
+        pd.testing.assert_frame_equal(
+            backtesting.all_bt_content[strategy_name]["results"],
+            sequential.all_bt_content[strategy_name]["results"],
+        )
+        for key in ("signals", "rejected", "exited"):
+            assert strategy_name in backtesting.analysis_results[key]
+    assert len(sequential.all_bt_content[CURRENT_TEST_STRATEGY]["results"]) > 0
+    assert backtesting.results["strategy_comparison"] == sequential.results["strategy_comparison"]
+    assert list(backtesting.results["strategy"]) == [CURRENT_TEST_STRATEGY, "StrategyTestV2"]
+
+
 def test_backtest_start_multi_strat_nomock(default_conf, mocker, caplog, testdatadir, capsys):
     default_conf.update(
         {
@@ -2650,6 +3100,69 @@ def test_get_strategy_run_id(default_conf_usdt):
     assert isinstance(x, str)
 
 
+def test_get_indicator_hash(default_conf):
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.ft_bot_start()
+    x = get_indicator_hash(strategy)
+    assert x == get_indicator_hash(strategy)
+
+    # ROI and stoploss don't influence indicators
+    strategy.minimal_roi = {"0": 0.5}
+    strategy.stoploss = -0.5
+    assert get_indicator_hash(strategy) == x
+
+    strategy.buy_rsi.value = 42
+    y = get_indicator_hash(strategy)
+    assert y != x
+
+    strategy.config["timeframe"] = "1h"
+    assert get_indicator_hash(strategy) not in (x, y)
+
+
+def test_backtest_indicator_cache(default_conf, mocker, caplog, testdatadir, tmp_path) -> None:
+    default_conf.update({"backtest_indicator_cache": True, "user_data_dir": tmp_path})
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC", "ADA/BTC", "ETH/BTC"]
+    )
+    advise_mock = mocker.spy(backtesting.strategy, "advise_all_indicators")
+
+    processed = backtesting._advise_all_indicators(data)
+    assert advise_mock.call_count == 1
+    assert log_has("Loaded cached indicators for 0 of 3 pairs.", caplog)
+    cache_dir = tmp_path / "backtest_results" / "indicator_cache"
+    assert len(list(cache_dir.glob("*/*.feather"))) == 3
+
+    cached = backtesting._advise_all_indicators(data)
+    assert advise_mock.call_count == 1
+    assert log_has("Loaded cached indicators for 3 of 3 pairs.", caplog)
+    assert list(cached) == list(data)
+    for pair, df in cached.items():
+        pd.testing.assert_frame_equal(df, processed[pair])
+
+    # Different candles for one pair - only this pair is analyzed again
+    data["ADA/BTC"] = data["ADA/BTC"].iloc[:-10].reset_index(drop=True)
+    cached = backtesting._advise_all_indicators(data)
+    assert advise_mock.call_count == 2
+    assert list(advise_mock.call_args[0][0]) == ["ADA/BTC"]
+    assert log_has("Loaded cached indicators for 2 of 3 pairs.", caplog)
+    assert len(cached["ADA/BTC"]) == len(processed["ADA/BTC"]) - 10
+
+    # Changed parameters use a new cache directory
+    backtesting.strategy.buy_rsi.value = 42
+    backtesting._advise_all_indicators(data)
+    assert advise_mock.call_count == 3
+    assert len(list(cache_dir.iterdir())) == 2
+
+    # Disabled
+    backtesting.config["backtest_indicator_cache"] = False
+    backtesting._advise_all_indicators(data)
+    assert advise_mock.call_count == 4
+    assert len(list(cache_dir.glob("*/*.feather"))) == 7
+
+
 def test_get_backtest_metadata_filename():
     # Test with a file path
     filename = Path("backtest_results.json")
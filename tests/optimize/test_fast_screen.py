@@ -0,0 +1,180 @@
+# pragma pylint: disable=missing-docstring, W0212, C0103, unused-argument
+
+from copy import deepcopy
+from unittest.mock import MagicMock, PropertyMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from freqtrade.data.history import get_timerange
+from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.fast_screen import FastScreen
+from tests.conftest import EXMS, log_has_re, patch_exchange
+
+
+def _random_walk(size: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 20 * np.exp(np.cumsum(rng.normal(0, 0.005, size)))
+    open_ = np.concatenate(([20], close[:-1]))
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2022-01-03 12:00", periods=size, freq="5min", tz="UTC"),
+            "open": open_,
+            "high": np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.004, size))),
+            "low": np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.004, size))),
+            "close": close,
+            "volume": rng.uniform(100, 1000, size),
+        }
+    )
+
+
+def _signals(dataframe=None, metadata=None):
+    dataframe["enter_long"] = np.where(dataframe.index % 7 == 0, 1, 0)
+    dataframe["exit_long"] = np.where(dataframe.index % 11 == 0, 1, 0)
+    dataframe["enter_tag"] = np.where(dataframe.index % 14 == 0, "even", "odd")
+    dataframe["exit_tag"] = np.where(dataframe.index % 22 == 0, "tagged_exit", None)
+    dataframe["enter_short"] = 0
+    dataframe["exit_short"] = 0
+    return dataframe
+
+
+@pytest.mark.parametrize(
+    "strategy_settings,config_settings",
+    [
+        ({}, {}),
+        ({"minimal_roi": {0: 0.08, 20: 0.03, 45: 0}, "stoploss": -0.04}, {}),
+        (
+            {
+                "minimal_roi": {0: 0.2},
+                "trailing_stop": True,
+                "trailing_stop_positive": 0.005,
+                "trailing_stop_positive_offset": 0.01,
+                "trailing_only_offset_is_reached": True,
+                "use_exit_signal": False,
+            },
+            {},
+        ),
+        (
+            {"trailing_stop": True, "ignore_roi_if_entry_signal": True, "exit_profit_only": True},
+            {"stake_amount": "unlimited", "max_open_trades": 2},
+        ),
+    ],
+)
+def test_fast_screen_backtest(
+    default_conf_usdt, fee, mocker, strategy_settings, config_settings
+) -> None:
+    default_conf_usdt.update({"runmode": "backtest", "timeframe": "5m", "max_open_trades": 3})
+    default_conf_usdt.update(config_settings)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_precision_amount", return_value=None)
+    mocker.patch(f"{EXMS}.get_precision_price", return_value=None)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = {pair: _random_walk(1000, seed) for seed, pair in enumerate(pairs)}
+    # Gaps in the data
+    data["ETH/USDT"] = data["ETH/USDT"].drop(data["ETH/USDT"].index[100:120])
+
+    backtesting = Backtesting(default_conf_usdt)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    for key, value in strategy_settings.items():
+        setattr(backtesting.strategy, key, value)
+    backtesting.strategy.advise_entry = _signals  # Override
+    backtesting.strategy.advise_exit = _signals  # Override
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    full = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )
+    fast = FastScreen(backtesting).backtest(deepcopy(processed), min_date, max_date)
+
+    full_results = full["results"].sort_values(["open_date", "pair"], ignore_index=True)
+    fast_results = fast["results"].sort_values(["open_date", "pair"], ignore_index=True)
+    assert len(full_results) > 20
+    assert set(fast_results.columns) == set(full_results.columns)
+    for col in ("pair", "open_date", "close_date", "exit_reason", "enter_tag", "trade_duration"):
+        pd.testing.assert_series_equal(fast_results[col], full_results[col], check_dtype=False)
+    for col in ("open_rate", "close_rate", "stake_amount", "profit_abs", "min_rate", "max_rate"):
+        np.testing.assert_allclose(fast_results[col], full_results[col], rtol=1e-6, atol=1e-6)
+    assert fast["rejected_signals"] == full["rejected_signals"]
+    assert fast["final_balance"] == pytest.approx(full["final_balance"])
+
+
+def test_fast_screen_unsupported_features(default_conf_usdt, mocker) -> None:
+    patch_exchange(mocker)
+    default_conf_usdt["strategy"] = "StrategyTestV3CustomEntryPrice"
+    backtesting = Backtesting(default_conf_usdt)
+    fast_screen = FastScreen(backtesting)
+    strategy = backtesting.strategylist[0]
+    assert fast_screen.unsupported_features(strategy) == ["custom_entry_price"]
+
+    strategy.position_adjustment_enable = True
+    strategy.use_custom_stoploss = True
+    backtesting.trading_mode = "futures"
+    assert fast_screen.unsupported_features(strategy) == [
+        "custom_entry_price",
+        "position_adjustment_enable",
+        "use_custom_stoploss",
+        "trading_mode futures",
+    ]
+
+    assert len(fast_screen.divergences()) == 2
+    backtesting.enable_protections = True
+    backtesting.timeframe_detail = "1m"
+    assert "timeframe_detail is ignored" in fast_screen.divergences()
+
+
+def test_backtest_start_fast_screen(default_conf, mocker, caplog, testdatadir) -> None:
+    patch_exchange(mocker)
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["UNITTEST/BTC"]),
+    )
+    default_conf.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "1m",
+            "datadir": testdatadir,
+            "export": "none",
+            "timerange": "1510694220-1510700340",
+            "strategy_list": [
+                "StrategyTestV3",
+                "StrategyTestV3CustomEntryPrice",
+                "StrategyTestV2",
+            ],
+            "backtest_fast_screen": 1,
+        }
+    )
+    mocker.patch("freqtrade.optimize.backtesting.show_backtest_results")
+    text_table_mock = mocker.patch("freqtrade.optimize.backtesting.text_table_strategy")
+    profits = {"StrategyTestV3": 5.0, "StrategyTestV2": 10.0}
+
+    def fast_backtest(self, processed, start_date, end_date):
+        return {"strategy_name": self.backtesting.strategy.get_strategy_name()}
+
+    mocker.patch.object(FastScreen, "backtest", fast_backtest)
+    mocker.patch(
+        "freqtrade.optimize.backtesting.generate_backtest_stats",
+        side_effect=lambda data, contents, **kwargs: {
+            "strategy": {name: {"profit_total_abs": profits[name]} for name in contents},
+            "strategy_comparison": [],
+        },
+    )
+    backtest_mock = mocker.patch(
+        "freqtrade.optimize.backtesting.Backtesting.backtest_one_strategy",
+        return_value=(MagicMock(), MagicMock()),
+    )
+    backtesting = Backtesting(default_conf)
+    backtesting.start()
+
+    assert text_table_mock.call_count == 1
+    assert log_has_re(r"Fast screen doesn't support custom_entry_price .*", caplog)
+    assert log_has_re(r"Fast screen selected StrategyTestV2 for the full backtest\.", caplog)
+    assert [c.args[0].get_strategy_name() for c in backtest_mock.call_args_list] == [
+        "StrategyTestV3CustomEntryPrice",
+        "StrategyTestV2",
+    ]
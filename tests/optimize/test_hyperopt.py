@@ -13,6 +13,7 @@ from freqtrade.commands.optimize_commands import setup_optimize_configuration, s
 from freqtrade.data.history import load_data
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
+from freqtrade.exchange import timeframe_to_prev_date
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
@@ -338,7 +339,7 @@ def test_params_no_optimize_details(hyperopt) -> None:
 
 
 def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_shared_dataframes")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -542,7 +543,8 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     mocker.patch.object(Path, "open")
     mocker.patch("freqtrade.configuration.config_validation.validate_config_schema")
     mocker.patch(
-        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load", return_value={"XRP/BTC": None}
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load_shared_dataframes",
+        return_value={"XRP/BTC": None},
     )
 
     optimizer_param = {
@@ -619,16 +621,52 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
         "freqtrade.strategy.hyper.HyperStrategyMixin.load_params_from_file",
         MagicMock(return_value={}),
     )
+    mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt.Path.is_dir",
+        MagicMock(side_effect=[True, False, False]),
+    )
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.is_file", MagicMock(return_value=True))
+    rmtreemock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.shutil.rmtree", MagicMock())
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.unlink", MagicMock())
     h = Hyperopt(hyperopt_conf)
 
+    assert rmtreemock.call_count == 1
     assert unlinkmock.call_count == 2
-    assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
+    assert log_has(f"Removing `{h.shared_data_dir}`.", caplog)
+    assert log_has(f"Removing `{h.results_file}`.", caplog)
+
+
+def test_prepare_hyperopt_data_shared(mocker, hyperopt_conf, tmp_path, testdatadir) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"user_data_dir": tmp_path, "datadir": testdatadir})
+    detail = load_data(testdatadir, "1m", ["UNITTEST/BTC"])
+
+    def load_detail(self):
+        self.detail_data = detail
+
+    mocker.patch(
+        "freqtrade.optimize.backtesting.Backtesting.load_bt_data_detail",
+        autospec=True,
+        side_effect=load_detail,
+    )
+    opt = Hyperopt(hyperopt_conf).hyperopter
+    opt.prepare_hyperopt_data()
+
+    # Detail data is not sent to the workers with every epoch.
+    assert opt.backtesting.detail_data == {}
+    assert opt.shared_backtest_data == ["detail_data"]
+    assert (opt.shared_data_dir / "data" / "pairs.json").is_file()
+
+    processed = opt.load_shared_data()
+    assert list(processed) == ["ETH/BTC", "LTC/BTC"]
+    assert "rsi" in processed["ETH/BTC"]
+    pd.testing.assert_frame_equal(
+        opt.backtesting.detail_data["UNITTEST/BTC"], detail["UNITTEST/BTC"]
+    )
 
 
 def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_shared_dataframes")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -695,7 +733,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_shared_dataframes")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -752,7 +790,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_shared_dataframes")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -807,7 +845,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_shared_dataframes")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -861,7 +899,9 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
 
 
 def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.store_shared_dataframes", MagicMock()
+    )
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -900,7 +940,7 @@ def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
 
 
 def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_shared_dataframes")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -954,7 +994,7 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_shared_dataframes")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -1020,7 +1060,9 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
     ],
 )
 def test_simplified_interface_failed(mocker, hyperopt_conf, space) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.store_shared_dataframes", MagicMock()
+    )
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -1092,6 +1134,140 @@ def test_in_strategy_auto_hyperopt(mocker, hyperopt_conf, tmp_path, fee) -> None
         opt.get_optimizer(2, 42, 2, 2)
 
 
+def test_get_asked_points(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.opt = MagicMock()
+    hyperopt.opt.Xi = [[1, "a"], [2, "b"]]
+    hyperopt.opt.ask.side_effect = [
+        [[1, "a"], [3, "c"], [3, "c"]],
+        [[2, "b"], [4, "d"], [3, "c"], [5, "e"]],
+        [[6, "f"]] * 3,
+        [[3, "c"], [6, "f"]],
+        [[4, "d"]],
+    ]
+    hyperopt.opt.space.rvs.return_value = [[7, "g"], [1, "a"], [8, "h"]]
+
+    asked, is_random = hyperopt.get_asked_points(n_points=3)
+    assert asked == [[3, "c"], [4, "d"], [5, "e"]]
+    assert is_random == [False, False, False]
+    assert hyperopt.evaluated_points == {(1, "a"), (2, "b")}
+
+    hyperopt.opt.Xi.extend(asked)
+    asked, is_random = hyperopt.get_asked_points(n_points=4)
+    assert asked == [[6, "f"], [7, "g"], [8, "h"]]
+    assert is_random == [False, True, True]
+    assert (4, "d") in hyperopt.evaluated_points
+    assert hyperopt._evaluated_count == 5
+
+    # All points evaluated already
+    hyperopt.opt.ask.side_effect = None
+    hyperopt.opt.ask.return_value = [[1, "a"]]
+    hyperopt.opt.space.rvs.return_value = [[2, "b"]]
+    assert hyperopt.get_asked_points(n_points=1) == ([[1, "a"]], [False])
+
+
+def test_run_successive_halving(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf["hyperopt_halving_factor"] = 3
+    fractions = []
+
+    def run_optimizer(parallel, asked, timerange_fraction=1.0):
+        fractions.append(timerange_fraction)
+        # Points are ranked by their value on the short timeranges
+        return [
+            {"loss": p[0] if timerange_fraction < 1 else p[0] * 10, "point": p[0]} for p in asked
+        ]
+
+    mocker.patch(
+        "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel", side_effect=run_optimizer
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.opt = MagicMock()
+    asked = [[x] for x in (5, 3, 8, 1, 9, 2, 7, 4, 6, 10, 12, 11, 14, 13, 15, 16, 18, 17)]
+    promoted, f_val = hyperopt.run_successive_halving(MagicMock(), asked)
+
+    assert fractions == [1 / 9, 1 / 3, 1]
+    assert [asked[i] for i in promoted] == [[1], [2]]
+    assert [v["point"] for v in f_val] == [1, 2]
+    # Every point is told - eliminated points with the worst full timerange loss
+    told_points, told_losses = hyperopt.opt.tell.call_args[0]
+    assert told_points == asked
+    assert told_losses[asked.index([1])] == 10
+    assert told_losses[asked.index([2])] == 20
+    assert told_losses[asked.index([4])] == 20
+    assert told_losses[asked.index([18])] == 20
+
+    # Batch is 9 times the number of jobs, the promoted points count as epochs
+    asked_mock = mocker.patch.object(
+        hyperopt, "get_asked_points", return_value=(asked, [p[0] == 2 for p in asked])
+    )
+    f_val, is_random = hyperopt.evaluate_points(MagicMock(), 2)
+    assert asked_mock.call_args.kwargs["n_points"] == 18
+    assert len(f_val) == 2
+    assert is_random == [False, True]
+
+
+def test_generate_optimizer_timerange_fraction(mocker, hyperopt_conf, tmp_path) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"user_data_dir": tmp_path, "hyperopt_min_trades": 8})
+    opt = Hyperopt(hyperopt_conf).hyperopter
+    opt.prepare_hyperopt()
+    backtest_mock = mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.Backtesting.backtest",
+        wraps=opt.backtesting.backtest,
+    )
+    calc_loss = mocker.patch.object(opt, "calculate_loss", return_value=0.5)
+
+    point = [(x.low + x.high) / 2 for x in opt.dimensions]
+    assert opt.generate_optimizer(point)["results_metrics"]["total_trades"] == 9
+
+    result = opt.generate_optimizer(point, 0.25)
+    end_date = backtest_mock.call_args.kwargs["end_date"]
+    unaligned = opt.min_date + (opt.max_date - opt.min_date) / 4
+    assert unaligned.timestamp() % 300 != 0
+    assert end_date == timeframe_to_prev_date("5m", unaligned)
+    assert all(
+        df["date"].max() <= end_date for df in backtest_mock.call_args.kwargs["processed"].values()
+    )
+    trades = result["results_metrics"]["total_trades"]
+    assert trades == 2
+    # Minimum trades are scaled down to the fraction of the timerange
+    assert result["loss"] == 0.5
+    assert calc_loss.call_args.kwargs["max_date"] == end_date
+
+
+def test_generate_optimizer_signal_cache(mocker, hyperopt_conf, tmp_path) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"user_data_dir": tmp_path})
+    opt = Hyperopt(hyperopt_conf).hyperopter
+    opt.prepare_hyperopt()
+    advise_mock = mocker.spy(opt.backtesting.strategy, "ft_advise_signals")
+    names = [x.name for x in opt.dimensions]
+    point = [(x.low + x.high) / 2 for x in opt.dimensions]
+
+    opt.generate_optimizer(point)
+    assert advise_mock.call_count == 2
+
+    # Only stoploss changed - signals are reused
+    point[names.index("stoploss")] = opt.dimensions[names.index("stoploss")].high
+    cached = opt.generate_optimizer(point)
+    assert advise_mock.call_count == 2
+    assert opt.get_signal_key() != opt.get_signal_key(0.5)
+
+    opt.data_id = "other_data"
+    uncached = opt.generate_optimizer(point)
+    assert advise_mock.call_count == 4
+    assert cached["loss"] == uncached["loss"]
+    for key in ("total_trades", "profit_total", "max_drawdown_abs"):
+        assert cached["results_metrics"][key] == uncached["results_metrics"][key]
+
+    # Changed buy parameter
+    point[names.index("buy_rsi")] = opt.dimensions[names.index("buy_rsi")].high
+    opt.generate_optimizer(point)
+    assert advise_mock.call_count == 6
+
+
 @pytest.mark.filterwarnings("ignore::DeprecationWarning")
 def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path, fee) -> None:
     mocker.patch(f"{EXMS}.validate_config", MagicMock())
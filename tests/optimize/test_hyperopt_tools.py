@@ -8,8 +8,10 @@ import rapidjson
 
 from freqtrade.constants import FTHYPT_FILEVERSION
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt_results_index import get_results_index_filename
 from freqtrade.optimize.hyperopt_tools import HyperoptTools, hyperopt_serializer
 from tests.conftest import CURRENT_TEST_STRATEGY, log_has, log_has_re
+from tests.conftest_hyperopt import hyperopt_test_result
 
 
 # Functions for recurrent object patching
@@ -53,6 +55,60 @@ def test_save_results_saves_epochs(hyperopt, tmp_path, caplog) -> None:
         next(result_gen)
 
 
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"hyperopt_list_best": True},
+        {"hyperopt_list_profitable": True, "hyperopt_list_min_trades": 2},
+        {"hyperopt_list_max_trades": 10, "hyperopt_list_min_avg_time": 2000},
+        {"hyperopt_list_max_avg_time": 2000, "hyperopt_list_min_avg_profit": -0.1},
+        {"hyperopt_list_max_avg_profit": 1, "hyperopt_list_min_total_profit": -0.01},
+        {"hyperopt_list_max_total_profit": 0.001, "hyperopt_list_min_objective": 10},
+        {"hyperopt_list_max_objective": 0, "hyperopt_list_best": True},
+    ],
+)
+def test_load_filtered_results_index(hyperopt, tmp_path, caplog, mocker, filters) -> None:
+    hyperopt.results_file = tmp_path / "ut_results.fthypt"
+    for epoch in hyperopt_test_result():
+        hyperopt._save_result(epoch)
+    assert get_results_index_filename(hyperopt.results_file).is_file()
+
+    epochs, total = HyperoptTools.load_filtered_results(hyperopt.results_file, filters)
+    assert log_has_re(r"Reading epochs from '.*ut_results\.sqlite'", caplog)
+    assert total == 12
+    assert 0 < len(epochs) < 12 or not filters
+
+    mocker.patch("freqtrade.optimize.hyperopt_tools.load_indexed_results", return_value=None)
+    assert HyperoptTools.load_filtered_results(hyperopt.results_file, filters) == (epochs, total)
+
+
+def test_load_filtered_epoch(hyperopt, tmp_path, mocker) -> None:
+    hyperopt.results_file = tmp_path / "ut_results.fthypt"
+    results = hyperopt_test_result()
+    for epoch in results:
+        hyperopt._save_result(epoch)
+    with hyperopt.results_file.open("r") as f:
+        results = [rapidjson.loads(line) for line in f]
+    best = [x for x in results if x["is_best"]]
+    config = {"hyperopt_list_best": True}
+
+    read_mock = mocker.spy(HyperoptTools, "_read_results")
+    assert HyperoptTools.load_filtered_epoch(hyperopt.results_file, config, 1) == (best[0], 3, 12)
+    assert HyperoptTools.load_filtered_epoch(hyperopt.results_file, config, -1) == (best[-1], 3, 12)
+    assert HyperoptTools.load_filtered_epoch(hyperopt.results_file, config, -3) == (best[0], 3, 12)
+    assert HyperoptTools.load_filtered_epoch(hyperopt.results_file, config, 4) == (None, 3, 12)
+    assert HyperoptTools.load_filtered_epoch(hyperopt.results_file, {}, 12)[0] == results[11]
+    assert read_mock.call_count == 0
+
+    # Epoch appended without index - the full file is read
+    with hyperopt.results_file.open("a") as f:
+        f.write(rapidjson.dumps(results[2]) + "\n")
+    assert HyperoptTools.load_filtered_epoch(hyperopt.results_file, {}, -1) == (results[2], 13, 13)
+    assert read_mock.call_count == 1
+    assert HyperoptTools.load_filtered_epoch(hyperopt.results_file, config, -4) == (None, 3, 13)
+
+
 def test_load_previous_results2(mocker, testdatadir, caplog) -> None:
     results_file = testdatadir / "hyperopt_results_SampleStrategy.pickle"
     with pytest.raises(
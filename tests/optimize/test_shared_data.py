@@ -0,0 +1,34 @@
+# pragma pylint: disable=missing-docstring, W0212, C0103
+
+import numpy as np
+import pandas as pd
+
+from freqtrade.optimize.shared_data import load_shared_dataframes, store_shared_dataframes
+from tests.conftest import generate_test_data
+
+
+def test_store_load_shared_dataframes(tmp_path) -> None:
+    dataframe = generate_test_data("5m", 100)
+    dataframe["rsi"] = np.where(dataframe.index < 14, np.nan, 50.0)
+    dataframe["enter_tag"] = np.where(dataframe.index % 2 == 0, "even", None)
+    data = {
+        "ETH/USDT": dataframe,
+        "XRP/USDT": dataframe.iloc[30:],
+        "LTC/USDT": dataframe.iloc[:0],
+    }
+    directory = tmp_path / "shared"
+    store_shared_dataframes(data, directory)
+    loaded = load_shared_dataframes(directory)
+
+    assert list(loaded) == list(data)
+    for pair, df in data.items():
+        pd.testing.assert_frame_equal(loaded[pair], df)
+    assert loaded["ETH/USDT"]["rsi"].isna().sum() == 14
+    # Memory-mapped, not copied
+    assert not loaded["ETH/USDT"]["close"].to_numpy().flags.writeable
+    assert not loaded["ETH/USDT"]["rsi"].to_numpy().flags.writeable
+
+    # Storing again replaces the prior content
+    store_shared_dataframes({"BTC/USDT": dataframe}, directory)
+    assert list(load_shared_dataframes(directory)) == ["BTC/USDT"]
+    assert len(list(directory.glob("*.feather"))) == 1
@@ -2160,6 +2160,49 @@ def test_ProducerPairlist(mocker, whitelist_conf, markets):
     assert pm.whitelist == ["TKN/BTC", *pairs]
 
 
+def test_PushPairList(mocker, whitelist_conf, markets):
+    mocker.patch.multiple(
+        EXMS,
+        markets=PropertyMock(return_value=markets),
+        exchange_has=MagicMock(return_value=True),
+    )
+    whitelist_conf["exchange"]["pair_whitelist"] = ["ETH/BTC", "TKN/BTC"]
+    whitelist_conf["pairlists"] = [{"method": "PushPairList"}]
+    exchange = get_patched_exchange(mocker, whitelist_conf)
+    pm = PairListManager(exchange, whitelist_conf)
+    pm.refresh_pairlist()
+    assert pm.whitelist == ["ETH/BTC", "TKN/BTC"]
+    assert pm.short_desc() == [{"PushPairList": "PushPairList - 2 pairs."}]
+
+    handler = pm._pairlist_handlers[0]
+    added, removed = handler.push_pairs(["TKN/BTC", "LTC/BTC", "XRP/BTC", "LTC/BTC", "BLK/BTC"])
+    assert added == ["LTC/BTC", "XRP/BTC", "BLK/BTC"]
+    assert removed == ["ETH/BTC"]
+    assert handler.pairs == ["TKN/BTC", "LTC/BTC", "XRP/BTC", "BLK/BTC"]
+    # Only applied on the next refresh - blacklist still applies
+    assert pm.whitelist == ["ETH/BTC", "TKN/BTC"]
+    pm.refresh_pairlist()
+    assert pm.whitelist == ["TKN/BTC", "LTC/BTC", "XRP/BTC"]
+    # Config is not modified
+    assert whitelist_conf["exchange"]["pair_whitelist"] == ["ETH/BTC", "TKN/BTC"]
+
+    # Strategy data is replaced by the next push with data, kept otherwise
+    assert handler.data == {}
+    handler.push_pairs(["TKN/BTC"], {"plans": {"TKN/BTC": 1}})
+    assert handler.data == {"plans": {"TKN/BTC": 1}}
+    handler.push_pairs(["TKN/BTC", "LTC/BTC"])
+    assert handler.data == {"plans": {"TKN/BTC": 1}}
+    handler.push_pairs(["TKN/BTC"], {})
+    assert handler.data == {}
+
+    # As additional pairlist
+    whitelist_conf["pairlists"] = [{"method": "StaticPairList"}, {"method": "PushPairList"}]
+    pm = PairListManager(exchange, whitelist_conf)
+    pm._pairlist_handlers[1].push_pairs(["LTC/BTC", "ETH/BTC"])
+    pm.refresh_pairlist()
+    assert pm.whitelist == ["ETH/BTC", "TKN/BTC", "LTC/BTC"]
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_FullTradesFilter(mocker, default_conf_usdt, fee, caplog) -> None:
     default_conf_usdt["exchange"]["pair_whitelist"].extend(["ADA/USDT", "XRP/USDT", "ETC/USDT"])
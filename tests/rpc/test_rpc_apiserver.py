@@ -25,6 +25,7 @@ from freqtrade.exceptions import DependencyException, ExchangeError, Operational
 from freqtrade.loggers import setup_logging, setup_logging_pre
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import CustomDataWrapper, Trade
+from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.rpc import RPC
 from freqtrade.rpc.api_server import ApiServer
 from freqtrade.rpc.api_server.api_auth import create_token, get_user_from_token
@@ -1678,6 +1679,47 @@ def test_api_whitelist(botclient):
     }
 
 
+def test_api_whitelist_push(botclient):
+    ftbot, client = botclient
+
+    rc = client_post(client, f"{BASE_URI}/whitelist", data={"whitelist": ["ETH/BTC"]})
+    assert_response(rc, 502)
+    assert rc.json() == {
+        "error": "Error querying /api/v1/whitelist: PushPairList is not configured."
+    }
+
+    ftbot.config["pairlists"] = [{"method": "PushPairList"}]
+    ftbot.pairlists = PairListManager(ftbot.exchange, ftbot.config, ftbot.dataprovider)
+    ftbot.pairlists.refresh_pairlist()
+    assert ftbot.pairlists.whitelist == ["ETH/BTC", "LTC/BTC", "XRP/BTC", "NEO/BTC"]
+
+    rc = client_post(
+        client, f"{BASE_URI}/whitelist", data={"whitelist": ["ETH/BTC", "TKN/BTC", "MEEP/BTC"]}
+    )
+    assert_response(rc)
+    assert rc.json() == {
+        "whitelist": ["ETH/BTC", "TKN/BTC"],
+        "length": 2,
+        "method": ["PushPairList"],
+        "added": ["TKN/BTC"],
+        "removed": ["LTC/BTC", "XRP/BTC", "NEO/BTC"],
+        "errors": {"MEEP/BTC": {"error_msg": "Pair MEEP/BTC is not available on the exchange."}},
+    }
+    # Whitelist changes with the next iteration, without reload
+    assert ftbot.pairlists.whitelist == ["ETH/BTC", "LTC/BTC", "XRP/BTC", "NEO/BTC"]
+    ftbot.pairlists.refresh_pairlist()
+    assert ftbot.pairlists.whitelist == ["ETH/BTC", "TKN/BTC"]
+
+    rc = client_post(
+        client,
+        f"{BASE_URI}/whitelist",
+        data={"whitelist": ["ETH/BTC"], "data": {"plans": {"ETH/BTC": {"entry": 0.05}}}},
+    )
+    assert_response(rc)
+    assert rc.json()["removed"] == ["TKN/BTC"]
+    assert ftbot.pairlists._pairlist_handlers[0].data == {"plans": {"ETH/BTC": {"entry": 0.05}}}
+
+
 @pytest.mark.parametrize(
     "endpoint",
     [
@@ -2133,6 +2175,60 @@ def test_api_pair_candles(botclient, ohlcv_history):
     ]
 
 
+def test_api_pair_candles_batch(botclient, ohlcv_history):
+    ftbot, client = botclient
+    timeframe = "5m"
+
+    rc = client_post(client, f"{BASE_URI}/pair_candles/batch", data={"candles": [{}]})
+    assert_response(rc, 422)
+
+    ohlcv_history["sma"] = ohlcv_history["close"].rolling(2).mean()
+    ohlcv_history["sma2"] = ohlcv_history["close"].rolling(2).mean()
+    ftbot.dataprovider._set_cached_df("XRP/BTC", timeframe, ohlcv_history, CandleType.SPOT)
+    # Not analyzed - served from the exchange klines
+    ftbot.exchange._klines[("LTC/BTC", "1h", CandleType.SPOT)] = ohlcv_history[
+        ["date", "open", "high", "low", "close", "volume"]
+    ]
+
+    rc = client_post(
+        client,
+        f"{BASE_URI}/pair_candles/batch",
+        data={
+            "candles": [
+                {"pair": "XRP/BTC", "timeframe": timeframe, "limit": 3, "columns": ["sma"]},
+                {"pair": "XRP/BTC", "timeframe": timeframe},
+                {"pair": "LTC/BTC", "timeframe": "1h", "limit": 2},
+                {"pair": "ETH/BTC", "timeframe": timeframe},
+            ]
+        },
+    )
+    assert_response(rc)
+    resp = rc.json()
+    assert resp["strategy"] == CURRENT_TEST_STRATEGY
+    projected, full, raw, missing = resp["candles"]
+
+    assert projected["pair"] == "XRP/BTC"
+    assert projected["analyzed"] is True
+    assert projected["length"] == 3
+    assert projected["columns"] == ["date", "open", "high", "low", "close", "volume", "sma"]
+    assert projected["data"]["date"] == [1511686200000, 1511686500000, 1511686800000]
+    assert projected["data"]["close"] == ohlcv_history["close"].iloc[-3:].tolist()
+    # NaN is converted to None
+    assert projected["data"]["sma"] == [None, *ohlcv_history["sma"].iloc[-2:].tolist()]
+
+    assert full["length"] == len(ohlcv_history)
+    assert "sma2" in full["columns"]
+
+    assert raw["analyzed"] is False
+    assert raw["timeframe_ms"] == 3_600_000
+    assert raw["length"] == 2
+    assert raw["data"]["close"] == ohlcv_history["close"].iloc[-2:].tolist()
+
+    assert missing["length"] == 0
+    assert missing["columns"] == []
+    assert missing["data"] == {}
+
+
 def test_api_pair_history(botclient, tmp_path, mocker):
     _ftbot, client = botclient
     _ftbot.config["user_data_dir"] = tmp_path
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 from pandas import DataFrame
 
@@ -330,6 +331,35 @@ def test_advise_all_indicators_copy(mocker, default_conf, testdatadir) -> None:
     assert aimock.call_args_list[0][0][0] is not data
 
 
+def test_advise_all_indicators_parallel(default_conf, testdatadir, caplog) -> None:
+    default_conf["indicator_jobs"] = 2
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.dp = DataProvider(default_conf, None)
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC", "ADA/BTC", "ETH/BTC"])
+    sequential = {
+        pair: strategy.advise_indicators(df.copy(), {"pair": pair}) for pair, df in data.items()
+    }
+    message = "Populating indicators for 3 pairs in 2 worker processes."
+
+    # Not declared as pair independent
+    strategy.advise_all_indicators(data)
+    assert not log_has(message, caplog)
+
+    strategy.pair_independent_indicators = True
+    processed = strategy.advise_all_indicators(data)
+    assert log_has(message, caplog)
+    assert list(processed) == list(data)
+    for pair, df in processed.items():
+        pd.testing.assert_frame_equal(df, sequential[pair])
+    # The strategy itself keeps its dataprovider
+    assert strategy.dp is not None
+
+    # Informative pairs need the dataprovider
+    strategy._ft_informative = [("dummy", None)]
+    assert not strategy._can_advise_indicators_in_parallel()
+    assert log_has_re(r"Informative pairs and public trades require the dataprovider.*", caplog)
+
+
 def test_min_roi_reached(default_conf, fee) -> None:
     # Use list to confirm sequence does not matter
     min_roi_list = [{20: 0.05, 55: 0.01, 0: 0.1}, {0: 0.1, 20: 0.05, 55: 0.01}]
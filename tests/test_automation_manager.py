@@ -0,0 +1,84 @@
+import importlib
+import json
+import sys
+
+import pytest
+
+
+if sys.version_info < (3, 12):
+    # automation_manager imports ichimoku_scanner, which uses f-string syntax of Python 3.12
+    pytest.skip("automation_manager requires Python 3.12", allow_module_level=True)
+
+
+@pytest.fixture
+def automation_manager(tmp_path, monkeypatch):
+    # Importing configures a log file in the working directory
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("automation_manager")
+
+
+@pytest.fixture
+def bot_files(automation_manager, tmp_path, mocker):
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps({"exchange": {"pair_whitelist": ["BTC/USDT"]}}))
+    mocker.patch.object(automation_manager, "CONFIG_PATH", config)
+    mocker.patch.object(automation_manager, "TRADE_PLAN_PATH", tmp_path / "trade_plan.json")
+    mocker.patch.object(automation_manager, "STRATEGY_OVERRIDES_PATH", tmp_path / "overrides.json")
+    mocker.patch.object(automation_manager.time, "sleep")
+    return tmp_path
+
+
+def test_update_files_and_reload_push(automation_manager, bot_files, mocker):
+    push_mock = mocker.patch.object(automation_manager, "push_whitelist", return_value=True)
+    reload_mock = mocker.patch.object(
+        automation_manager, "reload_freqtrade_config", return_value=True
+    )
+    plans = {"market_state": {}, "pairs": {"ETH/USDT": {"entry": 1.0}}}
+    overrides = {
+        "BTC/USDT": "ExternalSignalStrategy",
+        "ETH/USDT": "ExternalSignalStrategy",
+    }
+
+    # New whitelist, plans and overrides - pushed, no reload
+    automation_manager.update_files_and_reload(["BTC/USDT", "ETH/USDT"], plans)
+    push_mock.assert_called_once_with(
+        ["BTC/USDT", "ETH/USDT"], {"trade_plan": plans, "strategy_overrides": overrides}
+    )
+    assert reload_mock.call_count == 0
+    assert json.loads((bot_files / "trade_plan.json").read_text()) == plans
+    assert json.loads((bot_files / "overrides.json").read_text()) == overrides
+    config = json.loads((bot_files / "config.json").read_text())
+    assert config["exchange"]["pair_whitelist"] == ["BTC/USDT", "ETH/USDT"]
+
+    # Hourly plan update - pushed, still no reload
+    plans["pairs"]["ETH/USDT"]["entry"] = 1.1
+    automation_manager.update_files_and_reload(["BTC/USDT", "ETH/USDT"], plans)
+    assert push_mock.call_count == 2
+    assert push_mock.call_args[0][1]["trade_plan"] == plans
+    assert reload_mock.call_count == 0
+
+    # Forced reload - no push
+    automation_manager.update_files_and_reload(["BTC/USDT", "ETH/USDT"], plans, force_reload=True)
+    assert push_mock.call_count == 2
+    assert reload_mock.call_count == 1
+
+
+def test_update_files_and_reload_push_failed(automation_manager, bot_files, mocker):
+    mocker.patch.object(automation_manager, "push_whitelist", return_value=False)
+    reload_mock = mocker.patch.object(
+        automation_manager, "reload_freqtrade_config", return_value=True
+    )
+    plans = {"market_state": {}, "pairs": {"BTC/USDT": {"entry": 1.0}}}
+
+    # Overrides changed
+    automation_manager.update_files_and_reload(["BTC/USDT"], plans)
+    assert reload_mock.call_count == 1
+
+    # Nothing changed
+    automation_manager.update_files_and_reload(["BTC/USDT"], plans)
+    assert reload_mock.call_count == 1
+
+    # Only the plans changed - the bot needs the reload to pick them up
+    plans["pairs"]["BTC/USDT"]["entry"] = 1.1
+    automation_manager.update_files_and_reload(["BTC/USDT"], plans)
+    assert reload_mock.call_count == 2
@@ -0,0 +1,522 @@
+import importlib.util
+import pickle
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import ccxt
+import pandas as pd
+import pytest
+
+
+if sys.version_info < (3, 12):
+    # ichimoku_scanner uses f-string syntax of Python 3.12
+    pytest.skip("ichimoku_scanner requires Python 3.12", allow_module_level=True)
+
+import ichimoku_scanner as scanner
+
+
+def _make_candles(start_ms: int, count: int, step_ms: int = 3_600_000) -> list[list[float]]:
+    candles = []
+    for i in range(count):
+        price = 100 + (i % 17) - (i % 5) * 0.5
+        candles.append(
+            [start_ms + i * step_ms, price, price + 2, price - 2, price + 0.5, 1000.0 + i]
+        )
+    return candles
+
+
+@pytest.fixture(autouse=True)
+def disable_candle_cache(mocker):
+    mocker.patch.object(scanner, "CANDLE_CACHE_ENABLED", False)
+
+
+@pytest.fixture
+def fake_exchange():
+    exchange = MagicMock()
+    exchange.has = {"fetchOHLCV": True}
+    exchange.rateLimit = 0
+
+    def fetch_ohlcv(pair, timeframe, limit=300, since=None):
+        return _make_candles(1_700_000_000_000, limit)
+
+    exchange.fetch_ohlcv = MagicMock(side_effect=fetch_ohlcv)
+    return exchange
+
+
+def test_fetch_ohlcv_concurrently(fake_exchange, mocker):
+    mocker.patch.object(scanner, "FETCH_MIN_REQUEST_INTERVAL_MS", 0)
+    pairs = ["AAA/USDT", "BBB/USDT", "CCC/USDT"]
+    timeframes = ["4h", "1h", "15m"]
+
+    stream = scanner.fetch_ohlcv_concurrently(
+        fake_exchange, pairs, timeframes, limit=50, max_concurrency=4
+    )
+    results = dict(stream)
+
+    assert set(results.keys()) == set(pairs)
+    for frames in results.values():
+        assert set(frames.keys()) == set(timeframes)
+        for df in frames.values():
+            assert len(df) == 50
+            assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    assert fake_exchange.fetch_ohlcv.call_count == len(pairs) * len(timeframes)
+
+
+def test_fetch_ohlcv_concurrently_empty(fake_exchange):
+    assert list(scanner.fetch_ohlcv_concurrently(fake_exchange, [], ["1h"])) == []
+    assert fake_exchange.fetch_ohlcv.call_count == 0
+
+
+def test_fetch_ohlcv_throttled_retries_rate_limit(fake_exchange, mocker):
+    throttle = scanner.RequestThrottle(0)
+    penalize = mocker.spy(throttle, "penalize")
+    mocker.patch.object(scanner, "FETCH_RATE_LIMIT_BACKOFF_SECONDS", 0)
+    fake_exchange.fetch_ohlcv.side_effect = [
+        ccxt.RateLimitExceeded("429"),
+        ccxt.RequestTimeout("timeout"),
+        _make_candles(1_700_000_000_000, 10),
+    ]
+
+    df = scanner.fetch_ohlcv_throttled(fake_exchange, "AAA/USDT", "1h", 10, throttle)
+    assert df is not None
+    assert len(df) == 10
+    assert fake_exchange.fetch_ohlcv.call_count == 3
+    assert penalize.call_count == 1
+
+    fake_exchange.fetch_ohlcv.side_effect = ccxt.BadSymbol("unknown")
+    assert scanner.fetch_ohlcv_throttled(fake_exchange, "AAA/USDT", "1h", 10, throttle) is None
+
+    fake_exchange.fetch_ohlcv.side_effect = ccxt.RateLimitExceeded("429")
+    fake_exchange.fetch_ohlcv.reset_mock()
+    assert scanner.fetch_ohlcv_throttled(fake_exchange, "AAA/USDT", "1h", 10, throttle) is None
+    assert fake_exchange.fetch_ohlcv.call_count == scanner.FETCH_MAX_RETRIES + 1
+
+
+def test_request_throttle_spacing(mocker):
+    sleep_mock = mocker.patch("ichimoku_scanner.time.sleep")
+    mocker.patch("ichimoku_scanner.time.monotonic", return_value=100.0)
+    throttle = scanner.RequestThrottle(0.5)
+    throttle.wait()
+    assert sleep_mock.call_count == 0
+    throttle.wait()
+    throttle.wait()
+    assert [c.args[0] for c in sleep_mock.call_args_list] == [0.5, 1.0]
+
+    throttle.penalize(10)
+    throttle.wait()
+    assert sleep_mock.call_args_list[-1].args[0] == 10
+
+
+def test_candle_cache_incremental_fetch(fake_exchange, tmp_path, time_machine):
+    hour_ms = 3_600_000
+    start_ms = 1_700_000_000_000
+    history = _make_candles(start_ms, 400)
+
+    def fetch_ohlcv(pair, timeframe, limit=300, since=None):
+        rows = [c for c in history if since is None or c[0] >= since]
+        return rows[-limit:] if since is None else rows[:limit]
+
+    fake_exchange.fetch_ohlcv.side_effect = fetch_ohlcv
+    cache = scanner.CandleCache(tmp_path)
+    throttle = scanner.RequestThrottle(0)
+    # "now" is inside the last candle of the 300 initial candles
+    time_machine.move_to(scanner.pd.Timestamp(history[299][0] + 60_000, unit="ms", tz="UTC"))
+    history_now = history[:300]
+    history, full_history = (history_now, history)
+
+    first = scanner.fetch_ohlcv_throttled(fake_exchange, "AAA/USDT", "1h", 300, throttle, cache)
+    assert len(first) == 300
+    assert fake_exchange.fetch_ohlcv.call_args.kwargs == {"since": None, "limit": 300}
+    assert (tmp_path / "AAA_USDT-1h.feather").is_file()
+
+    # 3 hours later - only the open candle and 3 new ones are requested
+    history = full_history[:303]
+    time_machine.move_to(scanner.pd.Timestamp(history[302][0] + 60_000, unit="ms", tz="UTC"))
+    second = scanner.fetch_ohlcv_throttled(fake_exchange, "AAA/USDT", "1h", 300, throttle, cache)
+    assert fake_exchange.fetch_ohlcv.call_args.kwargs == {
+        "since": start_ms + 299 * hour_ms,
+        "limit": 5,
+    }
+    assert len(second) == 300
+    assert second.index[-1] == scanner.pd.Timestamp(history[302][0], unit="ms")
+    assert second.index.is_monotonic_increasing
+    assert not second.index.has_duplicates
+    expected = scanner._ohlcv_to_dataframe(history[-300:])
+    scanner.pd.testing.assert_frame_equal(second, expected, check_freq=False)
+
+    # Cache too old to be extended -> full download
+    time_machine.move_to(scanner.pd.Timestamp(history[302][0] + 400 * hour_ms, unit="ms", tz="UTC"))
+    scanner.fetch_ohlcv_throttled(fake_exchange, "AAA/USDT", "1h", 300, throttle, cache)
+    assert fake_exchange.fetch_ohlcv.call_args.kwargs == {"since": None, "limit": 300}
+
+    # Pair with less history than limit - extended incrementally as well
+    young_history = _make_candles(start_ms + 653 * hour_ms, 52)
+    history = young_history[:50]
+    young = scanner.fetch_ohlcv_throttled(fake_exchange, "BBB/USDT", "1h", 300, throttle, cache)
+    assert len(young) == 50
+    assert fake_exchange.fetch_ohlcv.call_args.kwargs == {"since": None, "limit": 300}
+    history = young_history
+    time_machine.move_to(scanner.pd.Timestamp(history[51][0] + 60_000, unit="ms", tz="UTC"))
+    young = scanner.fetch_ohlcv_throttled(fake_exchange, "BBB/USDT", "1h", 300, throttle, cache)
+    assert fake_exchange.fetch_ohlcv.call_args.kwargs == {
+        "since": start_ms + 702 * hour_ms,
+        "limit": 4,
+    }
+    assert len(young) == 52
+    assert young.index[-1] == scanner.pd.Timestamp(history[51][0], unit="ms")
+
+
+def _make_indicator_frame(count: int, seed: int) -> "scanner.pd.DataFrame":
+    rng = scanner.np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, count).cumsum()
+    df = scanner.pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.5, count),
+            "high": close + rng.uniform(0.5, 2, count),
+            "low": close - rng.uniform(0.5, 2, count),
+            "close": close,
+            "volume": rng.uniform(100, 1000, count),
+        },
+        index=scanner.pd.date_range("2024-01-01", periods=count, freq="1h"),
+    )
+    df["rs"] = df["close"] / 50
+    df["rs_ma"] = df["rs"].rolling(20).mean()
+    return df
+
+
+def test_rolling_percentile_rank_matches_pandas():
+    values = scanner.np.round(scanner.np.random.default_rng(1).uniform(0, 1, (3, 150)), 1)
+    values[1, 40] = scanner.np.nan
+    result = scanner.rolling_percentile_rank(values, 20)
+    for row in range(values.shape[0]):
+        expected = (
+            scanner.pd.Series(values[row])
+            .rolling(20)
+            .apply(lambda x: scanner.pd.Series(x).rank(pct=True).iloc[-1], raw=False)
+        )
+        scanner.np.testing.assert_array_equal(result[row], expected.to_numpy())
+
+    assert scanner.np.isnan(scanner.rolling_percentile_rank(values[:, :10], 20)).all()
+
+
+def test_calculate_indicators_batch_matches_single():
+    frames = {
+        "AAA/USDT": _make_indicator_frame(300, 1),
+        "BBB/USDT": _make_indicator_frame(300, 2),
+        "CCC/USDT": _make_indicator_frame(260, 3),
+        "DDD/USDT": _make_indicator_frame(80, 4),
+        "EEE/USDT": None,
+    }
+    originals = {k: v.copy() for k, v in frames.items() if v is not None}
+
+    result = scanner.calculate_indicators_batch(frames)
+
+    assert set(result.keys()) == set(frames.keys())
+    assert result["DDD/USDT"] is None
+    assert result["EEE/USDT"] is None
+    for pair in ("AAA/USDT", "BBB/USDT", "CCC/USDT"):
+        # Input frames are left untouched
+        scanner.pd.testing.assert_frame_equal(frames[pair], originals[pair])
+        expected = scanner.calculate_indicators(frames[pair].copy())
+        scanner.pd.testing.assert_frame_equal(result[pair], expected)
+
+
+def test_lazy_timeframe_memoizes():
+    loader = MagicMock(return_value=_make_indicator_frame(10, 1))
+    lazy = scanner.LazyTimeframe(loader)
+    assert not lazy.resolved
+    assert loader.call_count == 0
+
+    assert len(lazy) == 10
+    assert "close" in lazy
+    assert lazy["close"].iloc[-1] == lazy.iloc[-1]["close"]
+    assert not lazy.empty
+    assert lazy.resolved
+    assert loader.call_count == 1
+
+    empty = scanner.LazyTimeframe(lambda: None)
+    assert empty.empty
+    assert len(empty) == 0
+
+
+def test_lazy_timeframe_pickle():
+    df = _make_indicator_frame(300, 1)[["open", "high", "low", "close", "volume"]]
+    lazy = scanner.LazyTimeframe(scanner.functools.partial(scanner.calculate_indicators, df))
+    # Sent unresolved - resolved by the receiving process
+    copy = pickle.loads(pickle.dumps(lazy))  # noqa: S301
+    assert not lazy.resolved
+    assert not copy.resolved
+    scanner.pd.testing.assert_frame_equal(copy.resolve(), scanner.calculate_indicators(df))
+    assert pickle.loads(pickle.dumps(copy)).resolved  # noqa: S301
+
+
+def test_analyze_pair_batch_lazy_timeframes(mocker):
+    btc = _make_indicator_frame(300, 9)
+    ohlcv = ["open", "high", "low", "close", "volume"]
+    good = {
+        tf: _make_indicator_frame(300, i)[ohlcv]
+        for i, tf in enumerate(scanner.SCAN_GATE_TIMEFRAMES)
+    }
+    # 4h too short -> rejected before 15m/5m indicators are computed
+    bad = {**good, "4h": good["4h"].iloc[:50]}
+    batch = [
+        ("AAA/USDT", {tf: df.copy() for tf, df in good.items()}),
+        ("BBB/USDT", {tf: df.copy() for tf, df in good.items()}),
+        ("CCC/USDT", {tf: df.copy() for tf, df in bad.items()}),
+        ("DDD/USDT", {**{tf: df.copy() for tf, df in good.items()}, "1w": good["1h"].copy()}),
+    ]
+    weekly = _make_indicator_frame(300, 5)[ohlcv]
+    # No daily data for AAA, too few weekly candles for an ema_200 for BBB
+    load_timeframes = MagicMock(
+        return_value={
+            "AAA/USDT": {"1w": weekly, "1d": None},
+            "BBB/USDT": {"1w": weekly.iloc[:150], "1d": weekly.copy()},
+        }
+    )
+    assert scanner.calculate_indicators(weekly.iloc[:150].copy()) is None
+    batch_spy = mocker.spy(scanner, "calculate_indicators_batch")
+    single_spy = mocker.spy(scanner, "calculate_indicators")
+
+    def fake_score(pair, data_1w, data_1d, *args, **kwargs):
+        if pair == "AAA/USDT":
+            # Only AAA reads its weekly frame, twice
+            assert isinstance(data_1w, scanner.pd.DataFrame)
+            assert not data_1w.empty
+            assert data_1w["close"].iloc[-1] > 0
+            assert data_1d is None
+            return {"pair": pair}
+        if pair == "BBB/USDT":
+            assert data_1w is None
+            assert data_1d is not None
+        return None
+
+    mocker.patch.object(scanner, "analyze_and_score", side_effect=fake_score)
+    result = scanner._analyze_pair_batch(batch, btc, btc, {}, {}, load_timeframes)
+
+    assert result == [
+        ("AAA/USDT", {"pair": "AAA/USDT"}),
+        ("BBB/USDT", None),
+        ("CCC/USDT", None),
+        ("DDD/USDT", None),
+    ]
+    # One batched load for the pairs that passed the gate and miss a 1w/1d frame
+    load_timeframes.assert_called_once_with(["AAA/USDT", "BBB/USDT", "DDD/USDT"], ["1w", "1d"])
+    assert single_spy.call_count == 1
+    assert scanner.analyze_and_score.call_count == 3
+    # CCC/USDT only takes part in the 4h and 1h indicator passes
+    assert sum("CCC/USDT" in c.args[0] for c in batch_spy.call_args_list) == 2
+
+
+def test_scan_context_shares_cycle_data(fake_exchange, mocker, time_machine):
+    time_machine.move_to("2024-05-01 10:15:00 +00:00")
+    init_mock = mocker.patch.object(scanner, "initialize_exchange", return_value=fake_exchange)
+    mocker.patch.object(scanner, "analyze_market_context", return_value={"btc_context": {}})
+    fake_exchange.fetch_tickers.return_value = {"AAA/USDT": {"last": 1.0}}
+    context = scanner.ScanContext("binance")
+
+    for _ in range(3):
+        assert context.get_exchange() is fake_exchange
+        assert context.get_tickers() == {"AAA/USDT": {"last": 1.0}}
+        assert context.get_market_context() == {"btc_context": {}}
+        btc_4h, btc_1h = context.get_btc_frames()
+        assert len(btc_4h) == 300
+        assert len(btc_1h) == 300
+    assert init_mock.call_count == 1
+    assert fake_exchange.fetch_tickers.call_count == 1
+    assert scanner.analyze_market_context.call_count == 1
+    assert fake_exchange.fetch_ohlcv.call_count == 2
+
+    # Everything expires together at the next full hour
+    time_machine.move_to("2024-05-01 11:00:01 +00:00")
+    context.get_tickers()
+    context.get_btc_frames()
+    assert init_mock.call_count == 2
+    assert fake_exchange.fetch_tickers.call_count == 2
+    assert fake_exchange.fetch_ohlcv.call_count == 4
+
+    # Failed loads are not cached
+    fake_exchange.fetch_ohlcv.side_effect = ccxt.BadSymbol("unknown")
+    context.clear()
+    assert context.get_btc_frames() == (None, None)
+    fake_exchange.fetch_ohlcv.side_effect = None
+    fake_exchange.fetch_ohlcv.return_value = _make_candles(1_700_000_000_000, 300)
+    assert context.get_btc_frames()[0] is not None
+
+
+def test_stream_scan_yields_progressively(fake_exchange, mocker):
+    summary = {"market_context": {}, "total_pairs_in_universe": 3}
+    context = MagicMock()
+    context.get_exchange.return_value = fake_exchange
+    context.get_btc_frames.return_value = (None, None)
+    mocker.patch.object(scanner, "get_scan_context", return_value=context)
+    mocker.patch.object(
+        scanner,
+        "get_all_usdt_pairs",
+        return_value=(["AAA/USDT", "BBB/USDT", "CCC/USDT"], summary, {}),
+    )
+    mocker.patch.object(scanner, "FETCH_MIN_REQUEST_INTERVAL_MS", 0)
+    mocker.patch.object(scanner, "SCAN_INDICATOR_BATCH_SIZE", 1)
+    scores = {"AAA/USDT": 50, "BBB/USDT": None, "CCC/USDT": 120}
+    scored = []
+
+    def fake_batch(batch, *args):
+        scored.extend(pair for pair, _ in batch)
+        return [
+            (pair, {"pair": pair, "final_score": scores[pair]} if scores[pair] else None)
+            for pair, _ in batch
+        ]
+
+    mocker.patch.object(scanner, "_analyze_pair_batch", side_effect=fake_batch)
+
+    stream = scanner.stream_scan()
+    assert stream.summary is summary
+    assert scored == []
+    first = next(iter(stream))
+    assert first["pair"] in scores
+    assert len(scored) < 3
+    assert "found_targets" not in summary
+    rest = list(stream)
+    assert len(rest) == 1
+    assert summary["found_targets"] == 2
+
+    result = scanner.run_scan()
+    assert [r["pair"] for r in result["recommendations"]] == ["CCC/USDT", "AAA/USDT"]
+    assert result["summary"]["found_targets"] == 2
+
+
+def test_bot_candles_to_dataframe():
+    candles = _make_candles(1_700_000_000_000, 5, 900_000)
+    payload = {
+        "length": 5,
+        "columns": ["date", "open", "high", "low", "close", "volume", "sma"],
+        "data": {
+            col: [c[i] for c in candles]
+            for i, col in enumerate(["date", "open", "high", "low", "close", "volume"])
+        }
+        | {"sma": [None] * 5},
+    }
+    df = scanner.bot_candles_to_dataframe(payload)
+    pd.testing.assert_frame_equal(df, scanner._ohlcv_to_dataframe(candles))
+
+    assert scanner.bot_candles_to_dataframe({"length": 0, "columns": [], "data": {}}) is None
+
+
+def test_analyze_open_trades_prefers_candle_source(fake_exchange, mocker):
+    mocker.patch.object(scanner, "FETCH_MIN_REQUEST_INTERVAL_MS", 0)
+    context = MagicMock()
+    context.get_exchange.return_value = fake_exchange
+    mocker.patch.object(scanner, "get_scan_context", return_value=context)
+    health = mocker.patch.object(
+        scanner, "_evaluate_15m_health", side_effect=lambda pair, df: {"status": "Strong"}
+    )
+    bot_frame = scanner._ohlcv_to_dataframe(_make_candles(1_700_000_000_000, 300, 900_000))
+
+    def candle_source(pairs, timeframe, limit):
+        assert timeframe == "15m"
+        return {"AAA/USDT": bot_frame.copy(), "BBB/USDT": None}
+
+    result = scanner.analyze_open_trades(["AAA/USDT", "BBB/USDT"], candle_source=candle_source)
+    assert result == {"AAA/USDT": {"status": "Strong"}, "BBB/USDT": {"status": "Strong"}}
+    assert health.call_count == 2
+    # Only the pair the bot could not serve hits the exchange
+    assert [c.args[0] for c in fake_exchange.fetch_ohlcv.call_args_list] == ["BBB/USDT"]
+
+    # Everything served by the bot -> no exchange at all
+    fake_exchange.fetch_ohlcv.reset_mock()
+    context.get_exchange.reset_mock()
+    scanner.analyze_open_trades(["AAA/USDT"], candle_source=candle_source)
+    assert fake_exchange.fetch_ohlcv.call_count == 0
+    assert context.get_exchange.call_count == 0
+
+    # Failing source -> concurrent exchange fallback
+    def broken_source(pairs, timeframe, limit):
+        raise ConnectionError("bot down")
+
+    result = scanner.analyze_open_trades(["AAA/USDT", "BBB/USDT"], candle_source=broken_source)
+    assert set(result) == {"AAA/USDT", "BBB/USDT"}
+    assert fake_exchange.fetch_ohlcv.call_count == 2
+
+
+def test_analyze_pair_batch_scoring_pool_matches_serial(mocker):
+    btc = _make_indicator_frame(300, 9)
+    ohlcv = ["open", "high", "low", "close", "volume"]
+    batch = [
+        (
+            pair,
+            {
+                tf: _make_indicator_frame(300, seed + i)[ohlcv]
+                for i, tf in enumerate(scanner.SCAN_GATE_TIMEFRAMES)
+            },
+        )
+        for seed, pair in enumerate(["AAA/USDT", "BBB/USDT", "CCC/USDT", "DDD/USDT"])
+    ]
+    batch[2][1]["1h"] = None
+    tickers = {"AAA/USDT": {"last": 1.5}, "DDD/USDT": {"last": 2.5}}
+    weekly = _make_indicator_frame(300, 7)[ohlcv]
+    load_timeframes = MagicMock(
+        side_effect=lambda pairs, timeframes: {
+            pair: {tf: weekly.copy() for tf in timeframes} for pair in pairs
+        }
+    )
+
+    def fake_score(pair, data_1w, data_1d, data_4h, data_1h, data_15m, data_5m, *args, **kwargs):
+        return {
+            "pair": pair,
+            "final_score": round(data_1h["rsi"].iloc[-1] + data_1w["close"].iloc[-1], 6),
+            "price": args[1],
+        }
+
+    mocker.patch.object(scanner, "analyze_and_score", side_effect=fake_score)
+
+    def run(pool):
+        frames = [
+            (pair, {tf: df if df is None else df.copy() for tf, df in f.items()})
+            for pair, f in batch
+        ]
+        return scanner._analyze_pair_batch(frames, btc, btc, {}, tickers, load_timeframes, pool)
+
+    serial = run(None)
+    with scanner.ThreadPoolExecutor(max_workers=3) as pool:
+        pooled = run(pool)
+    assert pooled == serial
+    assert [pair for pair, _ in pooled] == ["AAA/USDT", "BBB/USDT", "CCC/USDT", "DDD/USDT"]
+    assert pooled[2][1] is None
+    assert pooled[0][1]["price"] == 1.5
+    assert pooled[1][1]["price"] is None
+
+
+def test_create_scoring_pool(mocker):
+    assert scanner.create_scoring_pool(0) is None
+    assert scanner.create_scoring_pool(1) is None
+    mocker.patch.object(scanner, "SCORING_WORKERS", 0)
+    assert scanner.create_scoring_pool() is None
+    pool = scanner.create_scoring_pool(2)
+    try:
+        assert isinstance(pool, scanner.ProcessPoolExecutor)
+        assert list(pool.map(scanner._score_pair, ["AAA/USDT"], [{}], [{}], [{}])) == [None]
+    finally:
+        pool.shutdown()
+
+
+def test_scanner_benchmark_smoke(tmp_path):
+    spec = importlib.util.spec_from_file_location(
+        "scanner_benchmark", Path(__file__).parent.parent / "scripts" / "scanner_benchmark.py"
+    )
+    benchmark = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(benchmark)
+
+    exchange = benchmark.FakeExchange(5)
+    assert len(exchange.fetch_ohlcv("BENCH0001/USDT", "1h", limit=120)) == 120
+    assert exchange.fetch_ohlcv("BENCH0001/USDT", "1h") == exchange.fetch_ohlcv(
+        "BENCH0001/USDT", "1h"
+    )
+
+    report = benchmark.benchmark(5, {}, trace_memory=True)
+    assert list(report) == benchmark.STAGES
+    for values in report.values():
+        assert values["seconds"] >= 0
+        assert values["peak_mib"] >= 0
+    assert report["universe"]["pairs"] > 0
+    assert report["scan"]["indicators_s"] > 0
+    assert "scoring_s" in report["scan"]
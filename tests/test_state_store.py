@@ -0,0 +1,133 @@
+import json
+from datetime import datetime, timedelta
+
+import state_store
+
+
+def test_atomic_write_json(tmp_path):
+    path = tmp_path / "sub" / "watchlist.json"
+    state_store.atomic_write_json(path, {"ETH/USDT": {"last_score": 70}})
+    assert state_store.read_json(path) == {"ETH/USDT": {"last_score": 70}}
+    state_store.atomic_write_json(path, {"SOL/USDT": {"last_score": 60}})
+    assert state_store.read_json(path) == {"SOL/USDT": {"last_score": 60}}
+    # No temp files are left behind
+    assert [p.name for p in path.parent.iterdir()] == ["watchlist.json"]
+
+    path.write_text("{broken")
+    assert state_store.read_json(path, default={}) == {}
+    assert state_store.read_json(tmp_path / "missing.json", default=[]) == []
+
+
+def test_append_only_log_append_and_range(tmp_path):
+    path = tmp_path / "log.jsonl"
+    log = state_store.AppendOnlyLog(path)
+    start = datetime(2024, 1, 1)
+    for i in range(10):
+        log.append({"message_id": i, "timestamp": (start + timedelta(hours=i)).isoformat()})
+
+    # One line per record, appended in place
+    assert len(path.read_text().splitlines()) == 10
+    assert len(log) == 10
+
+    window = log.range(start + timedelta(hours=3), start + timedelta(hours=6))
+    assert [r["message_id"] for r in window] == [3, 4, 5]
+    assert [r["message_id"] for r in log.range(end=start + timedelta(hours=2))] == [0, 1]
+    assert [r["message_id"] for r in log.latest(3)] == [9, 8, 7]
+
+    # Out-of-order records are inserted at their position
+    log.append({"message_id": 99, "timestamp": (start + timedelta(minutes=30)).isoformat()})
+    assert [r["message_id"] for r in log.range(end=start + timedelta(hours=2))] == [0, 99, 1]
+
+    # Missing timestamps are stamped
+    record = log.append({"message_id": 100})
+    assert "timestamp" in record
+
+    # A fresh instance reads the same state from disk
+    assert [r["message_id"] for r in state_store.AppendOnlyLog(path).records()] == [
+        r["message_id"] for r in log.records()
+    ]
+
+
+def test_append_only_log_delete_before(tmp_path):
+    log = state_store.AppendOnlyLog(tmp_path / "log.jsonl")
+    start = datetime(2024, 1, 1)
+    for i in range(6):
+        log.append({"message_id": i, "timestamp": (start + timedelta(days=i)).isoformat()})
+
+    assert log.delete_before(start - timedelta(days=1)) == []
+    removed = log.delete_before(start + timedelta(days=3), keep=lambda r: r["message_id"] == 1)
+    assert [r["message_id"] for r in removed] == [0, 2]
+    assert [r["message_id"] for r in log.records()] == [1, 3, 4, 5]
+    reloaded = state_store.AppendOnlyLog(tmp_path / "log.jsonl")
+    assert [r["message_id"] for r in reloaded.records()] == [1, 3, 4, 5]
+
+
+def test_append_only_log_max_entries_and_migration(tmp_path):
+    legacy = tmp_path / "market_history.json"
+    start = datetime(2024, 1, 1)
+    # Legacy market history is stored newest first
+    entries = [{"n": i, "timestamp": (start + timedelta(hours=i)).isoformat()} for i in range(5)]
+    legacy.write_text(json.dumps(entries[::-1], indent=4))
+
+    log = state_store.AppendOnlyLog(
+        tmp_path / "market_history.jsonl",
+        max_entries=3,
+        legacy_path=legacy,
+        newest_first_legacy=True,
+    )
+    assert [r["n"] for r in log.latest(10)] == [4, 3, 2]
+    assert [r["n"] for r in log.records()] == [2, 3, 4]
+    assert not legacy.exists()
+    # The legacy file is kept as backup
+    assert json.loads((tmp_path / "market_history.json.bak").read_text()) == entries[::-1]
+
+    log.append({"n": 5, "timestamp": (start + timedelta(hours=5)).isoformat()})
+    # Compaction keeps the file bounded
+    assert len(log) == 3
+    assert [r["n"] for r in log.latest(3)] == [5, 4, 3]
+
+
+def test_append_only_log_max_entries_window(tmp_path):
+    path = tmp_path / "log.jsonl"
+    log = state_store.AppendOnlyLog(path, max_entries=3)
+    start = datetime(2024, 1, 1)
+
+    def add(i):
+        log.append({"n": i, "timestamp": (start + timedelta(hours=i)).isoformat()})
+
+    for i in range(5):
+        add(i)
+    # Below the compaction threshold, the file holds more than max_entries
+    assert len(path.read_text().splitlines()) == 5
+    # ... but all accessors agree on the window
+    assert len(log) == 3
+    assert [r["n"] for r in log.records()] == [2, 3, 4]
+    assert [r["n"] for r in log.latest(10)] == [4, 3, 2]
+    assert [r["n"] for r in log.range()] == [2, 3, 4]
+    assert [r["n"] for r in log.range(start=start)] == [2, 3, 4]
+    assert [r["n"] for r in log.range(end=start + timedelta(hours=4))] == [2, 3]
+    reloaded = state_store.AppendOnlyLog(path, max_entries=3)
+    assert len(reloaded) == 3
+    assert [r["n"] for r in reloaded.latest(10)] == [4, 3, 2]
+
+    # Crossing the threshold compacts the file
+    add(5)
+    assert len(path.read_text().splitlines()) == 3
+    assert len(log) == 3
+    assert [r["n"] for r in log.latest(10)] == [5, 4, 3]
+    assert [r["n"] for r in log.range()] == [3, 4, 5]
+
+
+def test_append_only_log_migration_failed(tmp_path, caplog):
+    legacy = tmp_path / "telegram_messages.json"
+    path = tmp_path / "telegram_messages.jsonl"
+
+    for content in ('[{"message_id": 1, "timestamp": "2024-01-01T00:', '{"message_id": 1}'):
+        legacy.write_text(content)
+        log = state_store.AppendOnlyLog(path, legacy_path=legacy)
+        assert len(log) == 0
+        # Unreadable legacy data is not replaced by an empty log
+        assert legacy.read_text() == content
+        assert not path.exists()
+        assert "telegram_messages.json" in caplog.text
+        caplog.clear()